@@ -0,0 +1,330 @@
+# ruff: noqa: INP001, E402, T201
+"""Benchmarks for alert parsing and coordinator throughput.
+
+Runs against synthetic GeoJSON payloads modeled on ``tests/fixtures/api.json``
+and needs the test requirements (``pip install -r requirements_test.txt``)::
+
+    python benchmarks/run.py
+    python benchmarks/run.py --sizes 0 100 10000 --entries 1 50 --json results.json
+
+Exits with status 1 when a metric is over its budget in ``budget.json``.
+"""
+
+import argparse
+import asyncio
+from collections.abc import Awaitable, Callable
+import copy
+import json
+from pathlib import Path
+import sys
+import tempfile
+import time
+import tracemalloc
+from typing import Any
+
+import aiohttp
+from aioresponses import aioresponses
+from pytest_homeassistant_custom_component.common import MockConfigEntry, async_test_home_assistant
+
+ROOT = Path(__file__).resolve().parents[1]
+sys.path.insert(0, str(ROOT))
+
+from custom_components.nws_alerts.alert import alert_id, serialize_alerts
+from custom_components.nws_alerts.const import COORDINATOR, DOMAIN, HUB
+from custom_components.nws_alerts.coordinator import AlertsDataUpdateCoordinator
+from custom_components.nws_alerts.hub import AlertsHub
+from custom_components.nws_alerts.ratelimit import RateLimiter
+
+FIXTURE = ROOT / "tests" / "fixtures" / "api.json"
+BUDGET = Path(__file__).parent / "budget.json"
+ALERTS_URL = "https://api.weather.gov/alerts/active"
+ZONE = "BMZ001"
+SQUARE = [[-113.0, 33.0], [-111.0, 33.0], [-111.0, 34.0], [-113.0, 34.0], [-113.0, 33.0]]
+
+
+def synthetic_payload(count: int) -> str:
+    """Return an /alerts/active body with count alerts, all covering ZONE."""
+    data = json.loads(FIXTURE.read_text(encoding="utf8"))
+    templates = data["features"]
+    features = []
+    for i in range(count):
+        feature = copy.deepcopy(templates[i % len(templates)])
+        feature["id"] = f"https://api.weather.gov/alerts/urn:oid:2.49.0.1.840.0.bench.{i}"
+        properties = feature["properties"]
+        properties["id"] = f"urn:oid:2.49.0.1.840.0.bench.{i}"
+        properties["geocode"]["UGC"].append(ZONE)
+        properties["affectedZones"].append(f"https://api.weather.gov/zones/forecast/{ZONE}")
+        # Storm based warnings come with a polygon
+        if i % 4 == 0:
+            feature["geometry"] = {"type": "Polygon", "coordinates": [SQUARE * 25]}
+        features.append(feature)
+    data["features"] = features
+    return json.dumps(data)
+
+
+async def timed(func: Callable[[], Awaitable[Any]], repeat: int) -> float:
+    """Return the best wall time of repeat runs, in seconds."""
+    best = float("inf")
+    for _ in range(repeat):
+        start = time.perf_counter()
+        await func()
+        best = min(best, time.perf_counter() - start)
+    return best
+
+
+async def loop_lag(func: Callable[[], Awaitable[Any]], interval: float = 0.001) -> float:
+    """Run func and return the longest event loop stall meanwhile, in seconds."""
+    loop = asyncio.get_running_loop()
+    worst = 0.0
+    done = asyncio.Event()
+
+    async def probe() -> None:
+        nonlocal worst
+        while not done.is_set():
+            start = loop.time()
+            await asyncio.sleep(interval)
+            worst = max(worst, loop.time() - start - interval)
+
+    task = asyncio.create_task(probe())
+    await asyncio.sleep(0)
+    try:
+        await func()
+    finally:
+        done.set()
+        await task
+    return worst
+
+
+class Bench:
+    """Benchmark environment around a test Home Assistant instance."""
+
+    def __init__(self, hass, session: aiohttp.ClientSession) -> None:
+        """Initialize."""
+        self.hass = hass
+        self.session = session
+        self.hub = AlertsHub(hass, session=session, user_agent="nws_alerts benchmark")
+        # Measure the integration, not the request pacing
+        self.hub.limiter = RateLimiter(hass, rate=1e9, burst=1_000_000)
+        hass.data.setdefault(DOMAIN, {})[HUB] = self.hub
+
+    def coordinator(self, **data: Any) -> AlertsDataUpdateCoordinator:
+        """Return a new coordinator for a zone entry."""
+        entry = MockConfigEntry(
+            domain=DOMAIN,
+            title="Bench",
+            data={"name": "Bench", "zone_id": ZONE, "interval": 1, "timeout": 120, **data},
+        )
+        entry.add_to_hass(self.hass)
+        coordinator = AlertsDataUpdateCoordinator(
+            self.hass,
+            entry,
+            session=self.session,
+            user_agent="nws_alerts benchmark",
+            hub=self.hub,
+        )
+        self.hass.data[DOMAIN][entry.entry_id] = {COORDINATOR: coordinator}
+        return coordinator
+
+
+async def bench_parse(bench: Bench, mock: aioresponses, size: int) -> dict[str, float]:
+    """Measure parsing, ID generation and attribute building for one payload size."""
+    body = synthetic_payload(size)
+    mock.get(f"{ALERTS_URL}?zone={ZONE}", status=200, body=body, repeat=True)
+    repeat = 5 if size <= 1000 else 2
+    per_alert = 1e6 / max(size, 1)
+
+    # A new hub each time so nothing is served from the request broker
+    cold = await timed(
+        lambda: Bench(bench.hass, bench.session).coordinator().async_get_alerts(zone_id=ZONE),
+        repeat,
+    )
+
+    coordinator = bench.coordinator()
+    coordinator.data = await coordinator.async_get_alerts(zone_id=ZONE)
+
+    async def repoll() -> None:
+        bench.hub._zone_fetched.clear()  # noqa: SLF001
+        await coordinator.async_get_alerts(zone_id=ZONE)
+
+    warm = await timed(repoll, repeat)
+
+    tracemalloc.start()
+    await Bench(bench.hass, bench.session).coordinator().async_get_alerts(zone_id=ZONE)
+    peak = tracemalloc.get_traced_memory()[1]
+    tracemalloc.stop()
+
+    # Longest stall of the event loop during a download, with large bodies
+    # decoded in the executor and with everything on the loop
+    lag = await loop_lag(
+        lambda: Bench(bench.hass, bench.session).coordinator().async_get_alerts(zone_id=ZONE)
+    )
+    inline = Bench(bench.hass, bench.session)
+    inline.hub.async_set_decode_threshold("inline", sys.maxsize)
+    lag_inline = await loop_lag(lambda: inline.coordinator().async_get_alerts(zone_id=ZONE))
+
+    # The sensors read the coordinator's cached attributes, time building them
+    async def build_attributes() -> None:
+        for _ in range(10):
+            serialize_alerts(coordinator.data["alerts"])
+
+    attributes = await timed(build_attributes, repeat) / 10
+
+    async def generate_ids() -> None:
+        # Generate every ID, the best run would otherwise only hit the cache
+        alert_id.cache_clear()
+        for i in range(1000):
+            alert_id(f"https://api.weather.gov/alerts/{i}")
+
+    generate_id = await timed(generate_ids, repeat) / 1000
+
+    return {
+        "size": size,
+        "bytes": len(body),
+        "parse_cold_ms": cold * 1e3,
+        "parse_warm_ms": warm * 1e3,
+        "parse_cold_us_per_alert": cold * per_alert,
+        "parse_warm_us_per_alert": warm * per_alert,
+        "attributes_us_per_alert": attributes * per_alert,
+        "generate_id_us": generate_id * 1e6,
+        "peak_kib": peak / 1024,
+        "peak_kib_per_alert": peak / 1024 / max(size, 1),
+        "loop_lag_ms": lag * 1e3,
+        "loop_lag_inline_ms": lag_inline * 1e3,
+    }
+
+
+async def bench_entries(
+    bench: Bench, mock: aioresponses, entries: int, shared: bool, size: int
+) -> dict[str, float]:
+    """Measure one update cycle of several entries watching the same zone."""
+    body = synthetic_payload(size)
+    mock.get(ALERTS_URL, status=200, body=body, repeat=True)
+    mock.get(f"{ALERTS_URL}?zone={ZONE}", status=200, body=body, repeat=True)
+    coordinators = [bench.coordinator(shared_feed=shared) for _ in range(entries)]
+    for coordinator in coordinators:
+        bench.hub.async_register(coordinator.config_entry.entry_id, coordinator.interval)
+    requests = sum(len(calls) for calls in mock.requests.values())
+
+    start = time.perf_counter()
+    await asyncio.gather(*(coordinator.async_refresh() for coordinator in coordinators))
+    elapsed = time.perf_counter() - start
+
+    return {
+        "entries": entries,
+        "shared_feed": shared,
+        "cycle_ms": elapsed * 1e3,
+        "per_entry_ms": elapsed * 1e3 / entries,
+        "requests": sum(len(calls) for calls in mock.requests.values()) - requests,
+    }
+
+
+async def run(sizes: list[int], entries: list[int], entry_size: int) -> dict[str, Any]:
+    """Run every benchmark."""
+    results: dict[str, Any] = {"parse": [], "entries": [], "entry_size": entry_size}
+    with tempfile.TemporaryDirectory() as config_dir:
+        async with (
+            async_test_home_assistant(config_dir=config_dir) as hass,
+            aiohttp.ClientSession() as session,
+        ):
+            for size in sizes:
+                with aioresponses() as mock:
+                    results["parse"].append(await bench_parse(Bench(hass, session), mock, size))
+            for count in entries:
+                for shared in (False, True):
+                    with aioresponses() as mock:
+                        results["entries"].append(
+                            await bench_entries(
+                                Bench(hass, session), mock, count, shared, entry_size
+                            )
+                        )
+            await hass.async_stop(force=True)
+    return results
+
+
+def check_budget(results: dict[str, Any], budget: dict[str, Any]) -> list[str]:
+    """Return the metrics that are over budget.
+
+    A budget row applies to the results with the same size, or the same
+    number of entries and feed, the rest of its keys are limits.
+    """
+    failures = []
+    for limits in budget["parse"]:
+        for row in results["parse"]:
+            if row["size"] != limits["size"]:
+                continue
+            failures.extend(
+                f"{metric} at {row['size']} alerts: {row[metric]:.1f} > {limit}"
+                for metric, limit in limits.items()
+                if metric != "size" and row[metric] > limit
+            )
+    if results["entry_size"] == budget["entry_size"]:
+        for limits in budget["entries"]:
+            for row in results["entries"]:
+                if (row["entries"], row["shared_feed"]) != (
+                    limits["entries"],
+                    limits["shared_feed"],
+                ):
+                    continue
+                failures.extend(
+                    f"{metric} with {row['entries']} entries (shared feed: "
+                    f"{row['shared_feed']}): {row[metric]:.1f} > {limit}"
+                    for metric, limit in limits.items()
+                    if metric not in ("entries", "shared_feed") and row[metric] > limit
+                )
+    failures.extend(
+        f"shared feed with {row['entries']} entries made {row['requests']} requests"
+        for row in results["entries"]
+        if row["shared_feed"] and row["requests"] > budget["shared_requests_per_cycle"]
+    )
+    return failures
+
+
+def print_results(results: dict[str, Any]) -> None:
+    """Print the results as tables."""
+    print(
+        f"{'alerts':>7} {'KiB':>8} {'cold ms':>9} {'warm ms':>9} {'cold us/a':>10} "
+        f"{'attrs us/a':>10} {'id us':>7} {'peak KiB':>9} {'lag ms':>7} {'inline':>7}"
+    )
+    for row in results["parse"]:
+        print(
+            f"{row['size']:>7} {row['bytes'] / 1024:>8.0f} {row['parse_cold_ms']:>9.2f} "
+            f"{row['parse_warm_ms']:>9.2f} {row['parse_cold_us_per_alert']:>10.1f} "
+            f"{row['attributes_us_per_alert']:>10.2f} {row['generate_id_us']:>7.2f} "
+            f"{row['peak_kib']:>9.0f} {row['loop_lag_ms']:>7.1f} {row['loop_lag_inline_ms']:>7.1f}"
+        )
+    print()
+    print(f"{'entries':>7} {'shared':>7} {'cycle ms':>9} {'ms/entry':>9} {'requests':>9}")
+    for row in results["entries"]:
+        print(
+            f"{row['entries']:>7} {row['shared_feed']!s:>7} {row['cycle_ms']:>9.2f} "
+            f"{row['per_entry_ms']:>9.2f} {row['requests']:>9}"
+        )
+
+
+def main() -> None:
+    """Run the benchmarks from the command line."""
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--sizes", type=int, nargs="+", default=[0, 10, 100, 1000, 10000])
+    parser.add_argument("--entries", type=int, nargs="+", default=[1, 10, 50])
+    parser.add_argument("--entry-size", type=int, default=500, help="alerts per entry cycle")
+    parser.add_argument("--budget", type=Path, default=BUDGET)
+    parser.add_argument("--no-budget", action="store_true", help="report only")
+    parser.add_argument("--json", type=Path, help="write the results to this file")
+    args = parser.parse_args()
+
+    results = asyncio.run(run(args.sizes, args.entries, args.entry_size))
+    print_results(results)
+    if args.json:
+        args.json.write_text(json.dumps(results, indent=2), encoding="utf8")
+
+    if args.no_budget:
+        return
+    budget = json.loads(args.budget.read_text(encoding="utf8"))
+    if failures := check_budget(results, budget):
+        print("\nOver budget:\n  " + "\n  ".join(failures))
+        sys.exit(1)
+    print("\nAll metrics within budget")
+
+
+if __name__ == "__main__":
+    main()
@@ -1,33 +1,49 @@
 """NWS Alerts."""
 
-import asyncio
 import logging
 
 from homeassistant.config_entries import ConfigEntry
 from homeassistant.core import HomeAssistant
+from homeassistant.helpers import config_validation as cv
 from homeassistant.helpers.aiohttp_client import async_get_clientsession
 from homeassistant.helpers.entity_registry import async_entries_for_config_entry, async_get
 from homeassistant.helpers.instance_id import async_get as async_get_instance_id
+from homeassistant.helpers.storage import Store
+from homeassistant.helpers.typing import ConfigType
 
 from .const import (
+    CONF_DECODE_THRESHOLD,
     CONF_GPS_LOC,
     CONF_INTERVAL,
     CONF_TIMEOUT,
     CONF_TRACKER,
     CONFIG_VERSION,
     COORDINATOR,
+    DEFAULT_DECODE_THRESHOLD,
     DEFAULT_INTERVAL,
     DEFAULT_TIMEOUT,
     DOMAIN,
+    HUB,
     ISSUE_URL,
     PLATFORMS,
+    SNAPSHOT_STORAGE_VERSION,
     USER_AGENT,
     VERSION,
 )
 from .coordinator import AlertsDataUpdateCoordinator
+from .hub import AlertsHub
+from .services import async_setup_services
 
 _LOGGER = logging.getLogger(__name__)
 
+CONFIG_SCHEMA = cv.config_entry_only_config_schema(DOMAIN)
+
+
+async def async_setup(hass: HomeAssistant, config: ConfigType) -> bool:
+    """Set up the integration services."""
+    async_setup_services(hass)
+    return True
+
 
 async def async_setup_entry(hass: HomeAssistant, config_entry: ConfigEntry) -> bool:
     """Load the saved entities."""
@@ -62,36 +78,44 @@ async def async_setup_entry(hass: HomeAssistant, config_entry: ConfigEntry) -> b
     user_agent = USER_AGENT.format(instance_id)
     _LOGGER.debug("NWS User-Agent: %s", user_agent)
 
+    # Share one national feed between all config entries
+    if HUB not in hass.data[DOMAIN]:
+        hub = AlertsHub(
+            hass,
+            session=async_get_clientsession(hass),
+            user_agent=user_agent,
+        )
+        hass.data[DOMAIN][HUB] = hub
+        await hub.async_load()
+    hub = hass.data[DOMAIN][HUB]
+
     # Setup the data coordinator
     coordinator = AlertsDataUpdateCoordinator(
         hass,
         config_entry,
         session=async_get_clientsession(hass),
         user_agent=user_agent,
+        hub=hub,
+    )
+    hub.async_register(config_entry.entry_id, coordinator.interval)
+    hub.async_set_decode_threshold(
+        config_entry.entry_id,
+        config_entry.data.get(CONF_DECODE_THRESHOLD, DEFAULT_DECODE_THRESHOLD) * 1024,
     )
 
-    # Wait for device tracker to become available on startup
+    # Refresh whenever the device tracker moves instead of waiting for it on startup
     if CONF_TRACKER in config_entry.data:
-        tracker_id = config_entry.data[CONF_TRACKER]
-        max_wait = 30  # Maximum wait time in seconds
-        wait_interval = 2  # Check every 2 seconds
-        waited = 0
-
-        while waited < max_wait:
-            if hass.states.get(tracker_id) is not None:
-                _LOGGER.debug("Tracker %s is available after %s seconds", tracker_id, waited)
-                break
-            _LOGGER.debug("Waiting for tracker %s to become available...", tracker_id)
-            await asyncio.sleep(wait_interval)
-            waited += wait_interval
-
-        if waited >= max_wait:
-            _LOGGER.warning(
-                "Tracker %s not available after %s seconds, proceeding anyway", tracker_id, max_wait
-            )
-
-    # Fetch initial data so we have data when entities subscribe
-    await coordinator.async_refresh()
+        config_entry.async_on_unload(coordinator.async_track_tracker())
+
+    # Serve the last known alerts right away and update them in the background,
+    # only wait for the API when there is nothing to show yet
+    if await coordinator.async_restore():
+        config_entry.async_create_background_task(
+            hass, coordinator.async_refresh(), f"{DOMAIN} initial refresh"
+        )
+    else:
+        # Fetch initial data so we have data when entities subscribe
+        await coordinator.async_refresh()
 
     hass.data[DOMAIN][config_entry.entry_id] = {
         COORDINATOR: coordinator,
@@ -109,10 +133,18 @@ async def async_unload_entry(hass: HomeAssistant, config_entry: ConfigEntry):
 
     if unload_ok:
         _LOGGER.debug("Successfully removed entities from the %s integration", DOMAIN)
+        hub = hass.data[DOMAIN].get(HUB)
+        if hub is not None and hub.async_unregister(config_entry.entry_id):
+            hass.data[DOMAIN].pop(HUB)
 
     return unload_ok
 
 
+async def async_remove_entry(hass: HomeAssistant, config_entry: ConfigEntry) -> None:
+    """Remove the persisted alerts of a deleted entry."""
+    await Store(hass, SNAPSHOT_STORAGE_VERSION, f"{DOMAIN}.{config_entry.entry_id}").async_remove()
+
+
 async def update_listener(hass: HomeAssistant, config_entry: ConfigEntry):
     """Update listener."""
     if config_entry.data == config_entry.options:
@@ -0,0 +1,145 @@
+"""Compact alert records for nws_alerts."""
+
+from __future__ import annotations
+
+from collections.abc import Mapping
+from dataclasses import dataclass, field, fields
+from datetime import datetime
+from functools import lru_cache
+import hashlib
+import sys
+from typing import Any
+import uuid
+
+from homeassistant.util import dt as dt_util
+
+from .const import ALERT_ID_CACHE_SIZE, SLIM_OMITTED_FIELDS
+
+# Fields with a handful of possible values, interned so every record shares
+# one string object per value
+INTERNED_FIELDS = ("Type", "NWSCode", "Status", "Severity", "Certainty", "Event")
+
+# ISO timestamp fields and the attribute holding each one parsed
+TIME_FIELDS = {"Sent": "sent_at", "Onset": "onset_at", "Expires": "expires_at", "Ends": "ends_at"}
+
+
+@lru_cache(maxsize=ALERT_ID_CACHE_SIZE)
+def alert_id(url: str) -> str:
+    """Return the stable ID of an alert, generated from its URL."""
+    hex_string = hashlib.md5(url.encode("UTF-8")).hexdigest()
+    return str(uuid.UUID(hex=hex_string))
+
+
+@dataclass(frozen=True, slots=True, weakref_slot=True)
+class AlertRecord:
+    """One parsed alert.
+
+    Read like the dict it replaces, ``alert["Severity"]`` and
+    ``alert.get("Ends")`` keep working, without a per-alert ``__dict__``.
+    The timestamps are parsed once, when the record is created.
+    """
+
+    Event: str
+    ID: str
+    URL: str
+    Headline: str
+    Type: str
+    NWSCode: str
+    Status: str
+    Severity: str
+    Certainty: str
+    Sent: str
+    Onset: str | None
+    Expires: str | None
+    Ends: str | None
+    AreasAffected: str
+    Description: str
+    Instruction: str | None
+    sent_at: datetime | None = field(init=False, repr=False, compare=False)
+    onset_at: datetime | None = field(init=False, repr=False, compare=False)
+    expires_at: datetime | None = field(init=False, repr=False, compare=False)
+    ends_at: datetime | None = field(init=False, repr=False, compare=False)
+
+    def __post_init__(self) -> None:
+        """Parse the timestamps."""
+        for key, attr in TIME_FIELDS.items():
+            object.__setattr__(self, attr, dt_util.parse_datetime(getattr(self, key) or ""))
+
+    @classmethod
+    def create(cls, **values: Any) -> AlertRecord:
+        """Create a record, interning the enum-like fields."""
+        for key in INTERNED_FIELDS:
+            if isinstance(value := values.get(key), str):
+                values[key] = sys.intern(value)
+        return cls(**values)
+
+    @classmethod
+    def from_dict(cls, data: Mapping[str, Any]) -> AlertRecord:
+        """Create a record from a serialized alert, missing fields are None."""
+        return cls.create(**{key: data.get(key) for key in ALERT_FIELDS})
+
+    def __getitem__(self, key: str) -> Any:
+        """Return a field like a dict would."""
+        try:
+            return getattr(self, key)
+        except AttributeError:
+            raise KeyError(key) from None
+
+    def get(self, key: str, default: Any = None) -> Any:
+        """Return a field or the default."""
+        return getattr(self, key, default)
+
+    def time(self, key: str) -> datetime | None:
+        """Return the Sent, Onset, Expires or Ends time as a datetime."""
+        return getattr(self, TIME_FIELDS[key])
+
+    def as_dict(self, slim: bool = False) -> dict[str, Any]:
+        """Return the alert as a plain dict for state attributes, events and storage.
+
+        Next to each ISO timestamp its Unix time is included, for templates
+        to compare against ``as_timestamp(now())`` without parsing. Slim
+        leaves out the full texts.
+        """
+        data = {key: getattr(self, key) for key in (SLIM_FIELDS if slim else ALERT_FIELDS)}
+        for key, attr in TIME_FIELDS.items():
+            value = getattr(self, attr)
+            data[f"{key}Epoch"] = int(value.timestamp()) if value is not None else None
+        return data
+
+
+ALERT_FIELDS = tuple(item.name for item in fields(AlertRecord) if item.init)
+SLIM_FIELDS = tuple(key for key in ALERT_FIELDS if key not in SLIM_OMITTED_FIELDS)
+
+
+def normalize_alert(feature: dict[str, Any]) -> AlertRecord:
+    """Return the record of a GeoJSON alert feature."""
+    properties = feature["properties"]
+    event = properties["event"]
+    if "NWSheadline" in properties["parameters"]:
+        headline = properties["parameters"]["NWSheadline"][0]
+    else:
+        headline = event
+
+    return AlertRecord.create(
+        Event=event,
+        ID=alert_id(feature["id"]),
+        URL=feature["id"],
+        Headline=headline,
+        Type=properties["messageType"],
+        NWSCode=properties["eventCode"]["NationalWeatherService"][0],
+        Status=properties["status"],
+        Severity=properties["severity"],
+        Certainty=properties["certainty"],
+        Sent=properties["sent"],
+        Onset=properties["onset"],
+        Expires=properties["expires"],
+        Ends=properties["ends"],
+        AreasAffected=properties["areaDesc"],
+        Description=properties["description"],
+        Instruction=properties["instruction"],
+    )
+
+
+def serialize_alerts(alerts: list[AlertRecord], slim: bool = False) -> list[dict[str, Any]]:
+    """Return the alerts as plain dicts."""
+    return [alert.as_dict(slim) for alert in alerts]
@@ -0,0 +1,88 @@
+"""nws_alert binary sensors."""
+
+from dataclasses import dataclass
+from typing import Any, Final
+
+from homeassistant.components.binary_sensor import (
+    BinarySensorDeviceClass,
+    BinarySensorEntity,
+    BinarySensorEntityDescription,
+)
+
+from .alert import AlertRecord
+from .entity import NWSAlertEntity
+
+
+@dataclass(frozen=True, kw_only=True)
+class NWSAlertBinarySensorEntityDescription(BinarySensorEntityDescription):
+    """Binary sensor that is on while an alert with one of the NWS codes is active."""
+
+    # No codes means any alert
+    codes: tuple[str, ...] = ()
+
+
+BINARY_SENSOR_TYPES: Final[tuple[NWSAlertBinarySensorEntityDescription, ...]] = (
+    NWSAlertBinarySensorEntityDescription(
+        key="active",
+        name="Alerts Active",
+        icon="mdi:weather-lightning",
+        device_class=BinarySensorDeviceClass.SAFETY,
+    ),
+    NWSAlertBinarySensorEntityDescription(
+        key="tornado_warning",
+        name="Tornado Warning",
+        icon="mdi:weather-tornado",
+        device_class=BinarySensorDeviceClass.SAFETY,
+        codes=("TOR",),
+    ),
+    NWSAlertBinarySensorEntityDescription(
+        key="severe_thunderstorm_warning",
+        name="Severe Thunderstorm Warning",
+        icon="mdi:weather-lightning-rainy",
+        device_class=BinarySensorDeviceClass.SAFETY,
+        codes=("SVR",),
+    ),
+    NWSAlertBinarySensorEntityDescription(
+        key="flash_flood_warning",
+        name="Flash Flood Warning",
+        icon="mdi:home-flood",
+        device_class=BinarySensorDeviceClass.SAFETY,
+        codes=("FFW",),
+    ),
+)
+
+
+async def async_setup_entry(hass, entry, async_add_entities):
+    """Binary sensor platform setup."""
+    async_add_entities(
+        NWSAlertBinarySensor(hass, entry, description) for description in BINARY_SENSOR_TYPES
+    )
+
+
+class NWSAlertBinarySensor(NWSAlertEntity, BinarySensorEntity):
+    """Binary sensor for a kind of alert being active."""
+
+    entity_description: NWSAlertBinarySensorEntityDescription
+
+    def _alerts(self) -> list[AlertRecord]:
+        """Return the active alerts this sensor is about."""
+        if not self.entity_description.codes:
+            return self.coordinator.data["alerts"] if self.coordinator.data else []
+        by_code = self.coordinator.index["NWSCode"]
+        return [alert for code in self.entity_description.codes for alert in by_code.get(code, [])]
+
+    def _index_slice(self) -> Any:
+        """Return the alerts the sensor is about, a reissued alert compares unequal."""
+        return tuple(self._alerts())
+
+    @property
+    def is_on(self) -> bool:
+        """Return True while a matching alert is active."""
+        return bool(self._alerts())
+
+    @property
+    def extra_state_attributes(self) -> dict[str, Any]:
+        """Return the matching alerts' headlines and the configuration."""
+        attrs: dict[str, Any] = {"headlines": [alert["Headline"] for alert in self._alerts()]}
+        attrs.update(self._config_attributes())
+        return attrs
@@ -17,20 +17,37 @@ from homeassistant.helpers.instance_id import async_get as async_get_instance_id
 
 from .const import (
     API_ENDPOINT,
+    CONF_ADAPTIVE,
+    CONF_ALERT_SLOTS,
+    CONF_COUNT_PRECHECK,
+    CONF_DECODE_THRESHOLD,
     CONF_GPS_LOC,
+    CONF_HEARTBEAT,
     CONF_INTERVAL,
+    CONF_SHARED_FEED,
+    CONF_SLIM_ATTRIBUTES,
     CONF_TIMEOUT,
     CONF_TRACKER,
+    CONF_TRACKER_DISTANCE,
     CONF_ZONE_ID,
     CONFIG_VERSION,
+    DEFAULT_ADAPTIVE,
+    DEFAULT_ALERT_SLOTS,
+    DEFAULT_COUNT_PRECHECK,
+    DEFAULT_DECODE_THRESHOLD,
+    DEFAULT_HEARTBEAT,
     DEFAULT_INTERVAL,
     DEFAULT_NAME,
+    DEFAULT_SHARED_FEED,
+    DEFAULT_SLIM_ATTRIBUTES,
     DEFAULT_TIMEOUT,
+    DEFAULT_TRACKER_DISTANCE,
     DOMAIN,
     ID_URL,
     LOOKUP_URL,
     USER_AGENT,
 )
+from .zone_index import async_get_zone_index
 
 JSON_FEATURES = "features"
 JSON_PROPERTIES = "properties"
@@ -38,6 +55,8 @@ JSON_ID = "id"
 
 _LOGGER = logging.getLogger(__name__)
 MENU_OPTIONS = ["zone", "gps"]
+POSITIVE_INT = vol.All(int, vol.Range(min=1))
+NON_NEGATIVE_INT = vol.All(int, vol.Range(min=0))
 MENU_GPS = ["gps_loc", "gps_tracker"]
 
 
@@ -46,16 +65,40 @@ def _get_schema_zone(hass: Any, user_input: dict, default_dict: dict) -> Any:
     if user_input is None:
         user_input = {}
 
-    def _get_default(key):
+    def _get_default(key: str, fallback_default: Any = None) -> Any:
         """Get default value for key."""
-        return user_input.get(key, default_dict.get(key))
+        return user_input.get(key, default_dict.get(key, fallback_default))
 
     return vol.Schema(
         {
             vol.Required(CONF_ZONE_ID, default=_get_default(CONF_ZONE_ID)): str,
             vol.Optional(CONF_NAME, default=_get_default(CONF_NAME)): str,
-            vol.Optional(CONF_INTERVAL, default=_get_default(CONF_INTERVAL)): int,
-            vol.Optional(CONF_TIMEOUT, default=_get_default(CONF_TIMEOUT)): int,
+            vol.Optional(CONF_INTERVAL, default=_get_default(CONF_INTERVAL)): POSITIVE_INT,
+            vol.Optional(CONF_TIMEOUT, default=_get_default(CONF_TIMEOUT)): POSITIVE_INT,
+            vol.Optional(
+                CONF_SHARED_FEED, default=_get_default(CONF_SHARED_FEED, DEFAULT_SHARED_FEED)
+            ): bool,
+            vol.Optional(
+                CONF_HEARTBEAT, default=_get_default(CONF_HEARTBEAT, DEFAULT_HEARTBEAT)
+            ): POSITIVE_INT,
+            vol.Optional(
+                CONF_ADAPTIVE, default=_get_default(CONF_ADAPTIVE, DEFAULT_ADAPTIVE)
+            ): bool,
+            vol.Optional(
+                CONF_COUNT_PRECHECK,
+                default=_get_default(CONF_COUNT_PRECHECK, DEFAULT_COUNT_PRECHECK),
+            ): bool,
+            vol.Optional(
+                CONF_ALERT_SLOTS, default=_get_default(CONF_ALERT_SLOTS, DEFAULT_ALERT_SLOTS)
+            ): NON_NEGATIVE_INT,
+            vol.Optional(
+                CONF_SLIM_ATTRIBUTES,
+                default=_get_default(CONF_SLIM_ATTRIBUTES, DEFAULT_SLIM_ATTRIBUTES),
+            ): bool,
+            vol.Optional(
+                CONF_DECODE_THRESHOLD,
+                default=_get_default(CONF_DECODE_THRESHOLD, DEFAULT_DECODE_THRESHOLD),
+            ): POSITIVE_INT,
         }
     )
 
@@ -65,16 +108,40 @@ def _get_schema_gps(hass: Any, user_input: dict, default_dict: dict) -> Any:
     if user_input is None:
         user_input = {}
 
-    def _get_default(key):
+    def _get_default(key: str, fallback_default: Any = None) -> Any:
         """Get default value for key."""
-        return user_input.get(key, default_dict.get(key))
+        return user_input.get(key, default_dict.get(key, fallback_default))
 
     return vol.Schema(
         {
             vol.Required(CONF_GPS_LOC, default=_get_default(CONF_GPS_LOC)): str,
             vol.Optional(CONF_NAME, default=_get_default(CONF_NAME)): str,
-            vol.Optional(CONF_INTERVAL, default=_get_default(CONF_INTERVAL)): int,
-            vol.Optional(CONF_TIMEOUT, default=_get_default(CONF_TIMEOUT)): int,
+            vol.Optional(CONF_INTERVAL, default=_get_default(CONF_INTERVAL)): POSITIVE_INT,
+            vol.Optional(CONF_TIMEOUT, default=_get_default(CONF_TIMEOUT)): POSITIVE_INT,
+            vol.Optional(
+                CONF_SHARED_FEED, default=_get_default(CONF_SHARED_FEED, DEFAULT_SHARED_FEED)
+            ): bool,
+            vol.Optional(
+                CONF_HEARTBEAT, default=_get_default(CONF_HEARTBEAT, DEFAULT_HEARTBEAT)
+            ): POSITIVE_INT,
+            vol.Optional(
+                CONF_ADAPTIVE, default=_get_default(CONF_ADAPTIVE, DEFAULT_ADAPTIVE)
+            ): bool,
+            vol.Optional(
+                CONF_COUNT_PRECHECK,
+                default=_get_default(CONF_COUNT_PRECHECK, DEFAULT_COUNT_PRECHECK),
+            ): bool,
+            vol.Optional(
+                CONF_ALERT_SLOTS, default=_get_default(CONF_ALERT_SLOTS, DEFAULT_ALERT_SLOTS)
+            ): NON_NEGATIVE_INT,
+            vol.Optional(
+                CONF_SLIM_ATTRIBUTES,
+                default=_get_default(CONF_SLIM_ATTRIBUTES, DEFAULT_SLIM_ATTRIBUTES),
+            ): bool,
+            vol.Optional(
+                CONF_DECODE_THRESHOLD,
+                default=_get_default(CONF_DECODE_THRESHOLD, DEFAULT_DECODE_THRESHOLD),
+            ): POSITIVE_INT,
         }
     )
 
@@ -93,9 +160,37 @@ def _get_schema_tracker(hass: Any, user_input: dict, default_dict: dict) -> Any:
             vol.Required(CONF_TRACKER, default=_get_default(CONF_TRACKER, "(none)")): vol.In(
                 _get_entities(hass, TRACKER_DOMAIN)
             ),
+            vol.Optional(
+                CONF_TRACKER_DISTANCE,
+                default=_get_default(CONF_TRACKER_DISTANCE, DEFAULT_TRACKER_DISTANCE),
+            ): NON_NEGATIVE_INT,
             vol.Optional(CONF_NAME, default=_get_default(CONF_NAME)): str,
-            vol.Optional(CONF_INTERVAL, default=_get_default(CONF_INTERVAL)): int,
-            vol.Optional(CONF_TIMEOUT, default=_get_default(CONF_TIMEOUT)): int,
+            vol.Optional(CONF_INTERVAL, default=_get_default(CONF_INTERVAL)): POSITIVE_INT,
+            vol.Optional(CONF_TIMEOUT, default=_get_default(CONF_TIMEOUT)): POSITIVE_INT,
+            vol.Optional(
+                CONF_SHARED_FEED, default=_get_default(CONF_SHARED_FEED, DEFAULT_SHARED_FEED)
+            ): bool,
+            vol.Optional(
+                CONF_HEARTBEAT, default=_get_default(CONF_HEARTBEAT, DEFAULT_HEARTBEAT)
+            ): POSITIVE_INT,
+            vol.Optional(
+                CONF_ADAPTIVE, default=_get_default(CONF_ADAPTIVE, DEFAULT_ADAPTIVE)
+            ): bool,
+            vol.Optional(
+                CONF_COUNT_PRECHECK,
+                default=_get_default(CONF_COUNT_PRECHECK, DEFAULT_COUNT_PRECHECK),
+            ): bool,
+            vol.Optional(
+                CONF_ALERT_SLOTS, default=_get_default(CONF_ALERT_SLOTS, DEFAULT_ALERT_SLOTS)
+            ): NON_NEGATIVE_INT,
+            vol.Optional(
+                CONF_SLIM_ATTRIBUTES,
+                default=_get_default(CONF_SLIM_ATTRIBUTES, DEFAULT_SLIM_ATTRIBUTES),
+            ): bool,
+            vol.Optional(
+                CONF_DECODE_THRESHOLD,
+                default=_get_default(CONF_DECODE_THRESHOLD, DEFAULT_DECODE_THRESHOLD),
+            ): POSITIVE_INT,
         }
     )
 
@@ -128,6 +223,12 @@ async def _get_zone_list(self) -> str | None:
     lat = self.hass.config.latitude
     lon = self.hass.config.longitude
 
+    # Resolve locally when the offline zone index is installed
+    zone_index = await async_get_zone_index(self.hass)
+    if zone_index is not None and (zones := zone_index.lookup(lat, lon)):
+        _LOGGER.debug("Zones list from offline index: %s", zones)
+        return ",".join(zones)
+
     instance_id = await async_get_instance_id(self.hass)
     user_agent = USER_AGENT.format(instance_id)
     headers = {"User-Agent": user_agent, "Accept": "application/geo+json"}
@@ -201,6 +302,14 @@ class NWSAlertsFlowHandler(config_entries.ConfigFlow, domain=DOMAIN):
             CONF_NAME: DEFAULT_NAME,
             CONF_INTERVAL: DEFAULT_INTERVAL,
             CONF_TIMEOUT: DEFAULT_TIMEOUT,
+            CONF_SHARED_FEED: DEFAULT_SHARED_FEED,
+            CONF_HEARTBEAT: DEFAULT_HEARTBEAT,
+            CONF_ADAPTIVE: DEFAULT_ADAPTIVE,
+            CONF_COUNT_PRECHECK: DEFAULT_COUNT_PRECHECK,
+            CONF_ALERT_SLOTS: DEFAULT_ALERT_SLOTS,
+            CONF_SLIM_ATTRIBUTES: DEFAULT_SLIM_ATTRIBUTES,
+            CONF_DECODE_THRESHOLD: DEFAULT_DECODE_THRESHOLD,
+            CONF_TRACKER_DISTANCE: DEFAULT_TRACKER_DISTANCE,
         }
 
         return self.async_show_form(
@@ -229,6 +338,13 @@ class NWSAlertsFlowHandler(config_entries.ConfigFlow, domain=DOMAIN):
             CONF_NAME: DEFAULT_NAME,
             CONF_INTERVAL: DEFAULT_INTERVAL,
             CONF_TIMEOUT: DEFAULT_TIMEOUT,
+            CONF_SHARED_FEED: DEFAULT_SHARED_FEED,
+            CONF_HEARTBEAT: DEFAULT_HEARTBEAT,
+            CONF_ADAPTIVE: DEFAULT_ADAPTIVE,
+            CONF_COUNT_PRECHECK: DEFAULT_COUNT_PRECHECK,
+            CONF_ALERT_SLOTS: DEFAULT_ALERT_SLOTS,
+            CONF_SLIM_ATTRIBUTES: DEFAULT_SLIM_ATTRIBUTES,
+            CONF_DECODE_THRESHOLD: DEFAULT_DECODE_THRESHOLD,
             CONF_GPS_LOC: self._gps_loc,
         }
 
@@ -256,6 +372,13 @@ class NWSAlertsFlowHandler(config_entries.ConfigFlow, domain=DOMAIN):
             CONF_NAME: DEFAULT_NAME,
             CONF_INTERVAL: DEFAULT_INTERVAL,
             CONF_TIMEOUT: DEFAULT_TIMEOUT,
+            CONF_SHARED_FEED: DEFAULT_SHARED_FEED,
+            CONF_HEARTBEAT: DEFAULT_HEARTBEAT,
+            CONF_ADAPTIVE: DEFAULT_ADAPTIVE,
+            CONF_COUNT_PRECHECK: DEFAULT_COUNT_PRECHECK,
+            CONF_ALERT_SLOTS: DEFAULT_ALERT_SLOTS,
+            CONF_SLIM_ATTRIBUTES: DEFAULT_SLIM_ATTRIBUTES,
+            CONF_DECODE_THRESHOLD: DEFAULT_DECODE_THRESHOLD,
             CONF_ZONE_ID: self._zone_list,
         }
 
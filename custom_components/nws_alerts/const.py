@@ -12,12 +12,74 @@ CONF_INTERVAL = "interval"
 CONF_ZONE_ID = "zone_id"
 CONF_GPS_LOC = "gps_loc"
 CONF_TRACKER = "tracker"
+CONF_SHARED_FEED = "shared_feed"
+CONF_HEARTBEAT = "heartbeat"
+CONF_ADAPTIVE = "adaptive_interval"
+CONF_TRACKER_DISTANCE = "tracker_distance"
+CONF_COUNT_PRECHECK = "count_precheck"
+CONF_ALERT_SLOTS = "alert_slots"
+CONF_SLIM_ATTRIBUTES = "slim_attributes"
+CONF_DECODE_THRESHOLD = "decode_threshold"
 
 # Defaults
 DEFAULT_ICON = "mdi:alert"
 DEFAULT_NAME = "NWS Alerts"
 DEFAULT_INTERVAL = 1
 DEFAULT_TIMEOUT = 120
+DEFAULT_SHARED_FEED = False
+DEFAULT_HEARTBEAT = 60
+DEFAULT_ADAPTIVE = False
+DEFAULT_TRACKER_DISTANCE = 1000  # meters
+DEFAULT_COUNT_PRECHECK = False
+DEFAULT_ALERT_SLOTS = 0
+DEFAULT_SLIM_ATTRIBUTES = False
+# Responses larger than this are decoded and parsed in the executor instead of the event loop
+DEFAULT_DECODE_THRESHOLD = 256  # KiB
+
+# Adaptive polling
+ADAPTIVE_URGENT_INTERVAL = 30  # seconds, while severe alerts or watches are active
+ADAPTIVE_QUIET_INTERVAL = 15  # minutes, longest back off when there are no alerts
+ADAPTIVE_URGENT_SEVERITIES = ("Extreme", "Severe")
+
+# Two-tier polling
+COUNT_PRECHECK_MAX_AGE = 10  # minutes, longest alerts are reused on unchanged counts
+
+# Request pacing, shared by all entries
+RATE_LIMIT_RATE = 1.0  # requests per second
+RATE_LIMIT_BURST = 10  # requests
+BACKOFF_BASE = 30  # seconds, after the first failure
+BACKOFF_MAX = 900  # seconds
+CIRCUIT_FAILURES = 3  # consecutive failures before requests are stopped
+CIRCUIT_COOLDOWN = 300  # seconds between probes while stopped
+
+# Alert IDs generated from alert URLs, remembered for the most recent ones
+ALERT_ID_CACHE_SIZE = 1024
+
+# Full alert texts kept for the get_alert_details service
+ALERT_DETAILS_CACHE_SIZE = 256  # alerts
+# Fields left out of the state attributes with the slim attribute option
+SLIM_OMITTED_FIELDS = ("Description", "Instruction")
+
+# Point to zone resolution
+ZONE_GRID_RESOLUTION = 0.01  # degrees, roughly 1 km
+ZONE_CACHE_SIZE = 2048  # grid cells
+ZONE_CACHE_STORAGE_KEY = "nws_alerts.zone_cells"
+ZONE_CACHE_STORAGE_VERSION = 1
+
+# Last known alerts, served on startup while the first update runs
+SNAPSHOT_STORAGE_VERSION = 1
+SNAPSHOT_SAVE_DELAY = 10  # seconds
+SNAPSHOT_STALE_AFTER = 30  # minutes
+SNAPSHOT_CHECKED_SAVE_INTERVAL = 5  # minutes, unchanged alerts are saved again this often
+
+# Alert fields the coordinator indexes alerts by, for the derived entities
+INDEX_FIELDS = ("Severity", "Certainty", "Event", "NWSCode")
+SEVERITY_ORDER = ("Extreme", "Severe", "Moderate", "Minor", "Unknown")
+
+# Events fired for every alert that is added, updated or removed
+EVENT_ALERT_ADDED = "nws_alerts_alert_added"
+EVENT_ALERT_UPDATED = "nws_alerts_alert_updated"
+EVENT_ALERT_REMOVED = "nws_alerts_alert_removed"
 
 # Misc
 ZONE_ID = ""
@@ -27,7 +89,13 @@ DOMAIN = "nws_alerts"
 PLATFORM = "sensor"
 ATTRIBUTION = "Data provided by Weather.gov"
 COORDINATOR = "coordinator"
-PLATFORMS = [Platform.SENSOR]
+HUB = "hub"
+PLATFORMS = [Platform.BINARY_SENSOR, Platform.SENSOR]
+
+# Services
+SERVICE_GET_ALERT_DETAILS = "get_alert_details"
+ATTR_ALERT_ID = "alert_id"
+ATTR_URL = "url"
 CONFIG_VERSION = 2  # Config flow version
 
 # Translations URLS
@@ -1,29 +1,126 @@
 """Coordinator for nws_alerts."""
 
 from asyncio import timeout
+from bisect import insort
+from collections import Counter
 from datetime import datetime, timedelta
 import hashlib
+from heapq import heapify, heappop
 import logging
+from operator import itemgetter
 from typing import Any
-import uuid
 
 import aiohttp
 
-from homeassistant.const import CONF_NAME
+from homeassistant.const import ATTR_LATITUDE, ATTR_LONGITUDE, CONF_NAME
+from homeassistant.core import CALLBACK_TYPE, Event, EventStateChangedData, callback
+from homeassistant.exceptions import HomeAssistantError
+from homeassistant.helpers.event import (
+    async_track_point_in_utc_time,
+    async_track_state_change_event,
+)
+from homeassistant.helpers.storage import Store
 from homeassistant.helpers.update_coordinator import DataUpdateCoordinator, UpdateFailed
+from homeassistant.util import dt as dt_util
+from homeassistant.util.location import distance
 
+from .alert import AlertRecord, normalize_alert, serialize_alerts
 from .const import (
+    ADAPTIVE_QUIET_INTERVAL,
+    ADAPTIVE_URGENT_INTERVAL,
+    ADAPTIVE_URGENT_SEVERITIES,
     API_ENDPOINT,
+    CONF_ADAPTIVE,
+    CONF_ALERT_SLOTS,
+    CONF_COUNT_PRECHECK,
     CONF_GPS_LOC,
+    CONF_HEARTBEAT,
     CONF_INTERVAL,
+    CONF_SHARED_FEED,
+    CONF_SLIM_ATTRIBUTES,
     CONF_TIMEOUT,
     CONF_TRACKER,
+    CONF_TRACKER_DISTANCE,
     CONF_ZONE_ID,
+    COUNT_PRECHECK_MAX_AGE,
+    DEFAULT_ADAPTIVE,
+    DEFAULT_ALERT_SLOTS,
+    DEFAULT_COUNT_PRECHECK,
+    DEFAULT_HEARTBEAT,
+    DEFAULT_SHARED_FEED,
+    DEFAULT_SLIM_ATTRIBUTES,
+    DEFAULT_TRACKER_DISTANCE,
+    DOMAIN,
+    EVENT_ALERT_ADDED,
+    EVENT_ALERT_REMOVED,
+    EVENT_ALERT_UPDATED,
+    INDEX_FIELDS,
+    SNAPSHOT_CHECKED_SAVE_INTERVAL,
+    SNAPSHOT_SAVE_DELAY,
+    SNAPSHOT_STALE_AFTER,
+    SNAPSHOT_STORAGE_VERSION,
 )
+from .hub import AlertsHub, cache_ttl, conditional_headers
 
 _LOGGER = logging.getLogger(__name__)
 
 
+def alerts_fingerprint(alerts: list[AlertRecord]) -> str:
+    """Return a fingerprint of an alert set, based on each alert's id and sent time."""
+    content = "\n".join(f"{alert['URL']}|{alert['Sent']}" for alert in alerts)
+    return hashlib.md5(content.encode("UTF-8")).hexdigest()
+
+
+def build_alert_index(
+    alerts: list[AlertRecord],
+) -> dict[str, dict[str, list[AlertRecord]]]:
+    """Group the alerts by each of the INDEX_FIELDS and their values."""
+    index: dict[str, dict[str, list[AlertRecord]]] = {field: {} for field in INDEX_FIELDS}
+    for alert in alerts:
+        for field, by_value in index.items():
+            by_value.setdefault(alert[field], []).append(alert)
+    return index
+
+
+def alert_end(alert: AlertRecord) -> datetime | None:
+    """Return when the alert lapses, its Expires time or else its Ends time."""
+    return alert.time("Expires") or alert.time("Ends")
+
+
+def alert_expired(alert: AlertRecord, now: datetime) -> bool:
+    """Return True if the alert has lapsed."""
+    end = alert_end(alert)
+    return end is not None and end <= now
+
+
+def replace_alerts(data: dict[str, Any], alerts: list[AlertRecord]) -> dict[str, Any]:
+    """Return a copy of the sensor data with another alert list."""
+    return {
+        **data,
+        "state": len(alerts),
+        "alerts": alerts,
+        "fingerprint": alerts_fingerprint(alerts),
+    }
+
+
+class SnapshotStore(Store[dict[str, Any]]):
+    """Store for the last alerts of an entry."""
+
+    async def _async_migrate_func(
+        self, old_major_version: int, old_minor_version: int, old_data: dict[str, Any]
+    ) -> dict[str, Any]:
+        """Migrate a snapshot of another version.
+
+        Alerts are restored field by field, missing fields become None and
+        unknown ones are left out, so the data is kept as it is. What can't
+        be read is ignored by async_restore.
+        """
+        _LOGGER.debug(
+            "Restoring alert snapshot version %s.%s", old_major_version, old_minor_version
+        )
+        return old_data
+
+
 class AlertsDataUpdateCoordinator(DataUpdateCoordinator):
     """Class to manage fetching NWS Alert data."""
 
@@ -34,14 +131,55 @@ class AlertsDataUpdateCoordinator(DataUpdateCoordinator):
         *,
         session: aiohttp.ClientSession,
         user_agent: str,
+        hub: AlertsHub,
     ):
         """Initialize."""
         self.interval = timedelta(minutes=config.data.get(CONF_INTERVAL))
         self.name = config.data.get(CONF_NAME)
         self.timeout = config.data.get(CONF_TIMEOUT)
+        self.shared_feed = config.data.get(CONF_SHARED_FEED, DEFAULT_SHARED_FEED)
+        self.heartbeat = timedelta(minutes=config.data.get(CONF_HEARTBEAT, DEFAULT_HEARTBEAT))
+        self.last_checked: datetime | None = None
+        self.adaptive = config.data.get(CONF_ADAPTIVE, DEFAULT_ADAPTIVE)
+        self._quiet_polls = 0
+        self._cache_ttl: timedelta | None = None
+        self.tracker_distance = config.data.get(CONF_TRACKER_DISTANCE, DEFAULT_TRACKER_DISTANCE)
+        self._tracker_position: tuple[float, float] | None = None
+        self.count_precheck = config.data.get(CONF_COUNT_PRECHECK, DEFAULT_COUNT_PRECHECK)
+        self.alert_slots = config.data.get(CONF_ALERT_SLOTS, DEFAULT_ALERT_SLOTS)
+        self.slim_attributes = config.data.get(CONF_SLIM_ATTRIBUTES, DEFAULT_SLIM_ATTRIBUTES)
+        # Alerts of the per-alert sensors by slot, and the alert list they were assigned from
+        self._slots: list[AlertRecord | None] = [None] * self.alert_slots
+        self._slotted: list[AlertRecord] | None = None
+        # Zone counts the last downloaded alerts were fetched for, and when
+        self._counted: tuple[tuple[tuple[str, int], ...], datetime] | None = None
+        # Check time of the last saved snapshot
+        self._saved_checked: datetime | None = None
+        self._store = SnapshotStore(hass, SNAPSHOT_STORAGE_VERSION, f"{DOMAIN}.{config.entry_id}")
         self._config = config
         self._session = session
         self._user_agent = user_agent
+        self._hub = hub
+        # Validators and parsed result of the last response, for conditional GETs
+        self._validators: dict[str, str] = {}
+        self._validated_url: str | None = None
+        # Hash of the last response body per URL, an identical body isn't decoded again
+        self._body_hashes: dict[str, int] = {}
+        self.cache_stats: Counter[str] = Counter()
+        self._validated_alerts: dict[str, Any] = {}
+        # Parsed alerts keyed by NWS alert id, with the sent time they were parsed from
+        self._parsed: dict[str, tuple[str, AlertRecord]] = {}
+        self._sorted_alerts: list[AlertRecord] = []
+        self._fingerprinted: tuple[list[AlertRecord], str] | None = None
+        # Heap of (time, "onset" or "expiry", alert URL) for the held alerts
+        self._timers: list[tuple[datetime, str, str]] = []
+        self._unsub_timer: CALLBACK_TYPE | None = None
+        # Alerts that lapsed while the feed may still list them
+        self._retired: set[str] = set()
+        self._indexed: tuple[list[AlertRecord], dict[str, dict[str, list]]] | None = None
+        # Alerts listeners were last told about, by alert ID
+        self._announced: dict[str, AlertRecord] = {}
+        self._serialized: tuple[list[AlertRecord], list[dict[str, Any]]] | None = None
         self.hass = hass
 
         _LOGGER.debug("Data will be update every %s", self.interval)
@@ -52,24 +190,291 @@ class AlertsDataUpdateCoordinator(DataUpdateCoordinator):
             config_entry=config,
             name=self.name,
             update_interval=self.interval,
+            always_update=False,
         )
+        config.async_on_unload(self._async_cancel_timer)
 
     async def _async_update_data(self):
         """Fetch data."""
         coords = None
         if CONF_TRACKER in self._config.data:
             coords = await self._get_tracker_gps()
-        async with timeout(self.timeout):
-            try:
+        try:
+            async with timeout(self.timeout):
                 data = await self.update_alerts(coords)
-            except AttributeError as error:
-                _LOGGER.warning("AttributeError fetching NWS Alerts data: %s. Will retry.", error)
-                # Return valid structure instead of None
-                return {"state": 0, "alerts": [], "last_updated": datetime.now().isoformat()}
-            except Exception as error:
+        except AttributeError as error:
+            _LOGGER.warning("AttributeError fetching NWS Alerts data: %s. Will retry.", error)
+            # Return valid structure instead of None
+            data = {"state": 0, "alerts": [], "last_updated": datetime.now().isoformat()}
+        except (UpdateFailed, TimeoutError, aiohttp.ClientError) as error:
+            if self.data is None:
                 raise UpdateFailed(error) from error
-            _LOGGER.debug("Data: %s", data)
-            return data
+            # Keep serving the last alerts, each until it expires, while the API is down
+            _LOGGER.debug("Keeping the last alerts: %s", str(error) or "timeout")
+            return self._unexpired_data()
+        except Exception as error:
+            raise UpdateFailed(error) from error
+        if self._retired:
+            # Keep lapsed alerts retired while the feed still lists them
+            self._retired &= {alert["URL"] for alert in data["alerts"]}
+            alerts = [alert for alert in data["alerts"] if alert["URL"] not in self._retired]
+            data = {**data, "state": len(alerts), "alerts": alerts}
+        data = self._apply_fingerprint(data)
+        if data is not self.data or self._snapshot_checked_behind():
+            self._store.async_delay_save(self._snapshot_to_save, SNAPSHOT_SAVE_DELAY)
+        if self.adaptive:
+            self._adapt_interval(data["alerts"])
+        _LOGGER.debug("Data: %s", data)
+        return data
+
+    def _unexpired_data(self) -> dict[str, Any]:
+        """Return the last data without the alerts that expired since."""
+        now = dt_util.now()
+        alerts = [alert for alert in self.data["alerts"] if not alert_expired(alert, now)]
+        if len(alerts) == len(self.data["alerts"]):
+            return self.data
+        _LOGGER.debug("Dropping %s expired alerts", len(self.data["alerts"]) - len(alerts))
+        return replace_alerts(self.data, alerts)
+
+    @callback
+    def async_update_listeners(self) -> None:
+        """Reschedule the alert timers, fire alert events and update all registered listeners."""
+        self._async_schedule_alerts()
+        self._async_fire_alert_events()
+        super().async_update_listeners()
+
+    @callback
+    def _async_fire_alert_events(self) -> None:
+        """Fire an event for every alert added, updated or removed since the last update.
+
+        Automations can trigger on a single changed alert instead of comparing
+        the whole alert list of the old and new sensor state.
+        """
+        alerts = {alert["ID"]: alert for alert in (self.data or {}).get("alerts", [])}
+        for alert_id, alert in alerts.items():
+            if (previous := self._announced.get(alert_id)) is None:
+                self._async_fire_alert_event(EVENT_ALERT_ADDED, alert)
+            elif previous["Sent"] != alert["Sent"]:
+                self._async_fire_alert_event(EVENT_ALERT_UPDATED, alert)
+        for alert_id in self._announced.keys() - alerts.keys():
+            self._async_fire_alert_event(EVENT_ALERT_REMOVED, self._announced[alert_id])
+        self._announced = alerts
+
+    @callback
+    def _async_fire_alert_event(self, event_type: str, alert: AlertRecord) -> None:
+        """Fire one alert event."""
+        _LOGGER.debug("Firing %s for %s", event_type, alert["ID"])
+        self.hass.bus.async_fire(
+            event_type,
+            {"entry_id": self._config.entry_id, "name": self.name, "alert": alert.as_dict()},
+        )
+
+    @callback
+    def _async_schedule_alerts(self) -> None:
+        """Put the upcoming onset and expiry of every held alert on the timer heap.
+
+        Only times still ahead are scheduled, an alert the feed lists past its
+        expiry is left to the feed.
+        """
+        now = dt_util.utcnow()
+        timers = []
+        for alert in (self.data or {}).get("alerts", []):
+            if (onset := alert.time("Onset")) is not None and onset > now:
+                timers.append((onset, "onset", alert["URL"]))
+            if (end := alert_end(alert)) is not None and end > now:
+                timers.append((end, "expiry", alert["URL"]))
+        heapify(timers)
+        self._timers = timers
+
+        self._async_cancel_timer()
+        if timers:
+            self._unsub_timer = async_track_point_in_utc_time(
+                self.hass, self._async_timer_fired, timers[0][0]
+            )
+
+    @callback
+    def _async_cancel_timer(self) -> None:
+        """Cancel the pending alert timer."""
+        if self._unsub_timer is not None:
+            self._unsub_timer()
+            self._unsub_timer = None
+
+    @callback
+    def _async_timer_fired(self, _now: datetime) -> None:
+        """Retire alerts that lapsed and notify listeners of alerts coming into effect."""
+        self._unsub_timer = None
+        now = dt_util.utcnow()
+        expired: set[str] = set()
+        while self._timers and self._timers[0][0] <= now:
+            _, kind, url = heappop(self._timers)
+            if kind == "expiry":
+                expired.add(url)
+
+        if expired and self.data is not None:
+            _LOGGER.debug("Retiring %s lapsed alerts", len(expired))
+            self._retired |= expired
+            alerts = [alert for alert in self.data["alerts"] if alert["URL"] not in expired]
+            self.async_set_updated_data(replace_alerts(self.data, alerts))
+        else:
+            self.async_update_listeners()
+
+    @property
+    def index(self) -> dict[str, dict[str, list[AlertRecord]]]:
+        """Return the current alerts grouped by severity, certainty, event and NWS code.
+
+        Built once per alert set, so derived entities don't each scan the list.
+        """
+        alerts = self.data["alerts"] if self.data is not None else []
+        if self._indexed is None or self._indexed[0] is not alerts:
+            self._indexed = (alerts, build_alert_index(alerts))
+        return self._indexed[1]
+
+    @property
+    def slots(self) -> list[AlertRecord | None]:
+        """Return the alerts of the per-alert sensors, None for an empty slot.
+
+        An alert keeps its slot while it is active, also when it is updated,
+        new alerts take the free slots in alert order. Alerts beyond the last
+        slot are only listed by the alerts sensor.
+        """
+        alerts = self.data["alerts"] if self.data is not None else []
+        if self._slotted is not alerts:
+            by_id = {alert["ID"]: alert for alert in alerts}
+            slots = [
+                by_id.pop(alert["ID"], None) if alert is not None else None for alert in self._slots
+            ]
+            unassigned = iter(by_id.values())
+            self._slots = [
+                alert if alert is not None else next(unassigned, None) for alert in slots
+            ]
+            self._slotted = alerts
+        return self._slots
+
+    @property
+    def alert_attributes(self) -> list[dict[str, Any]]:
+        """Return the current alerts serialized for the state attributes.
+
+        Serialized on first use and reused until the alert set changes, a
+        heartbeat or data age write doesn't copy every alert again.
+        """
+        alerts = self.data["alerts"] if self.data is not None else []
+        if self._serialized is None or self._serialized[0] is not alerts:
+            self._serialized = (alerts, serialize_alerts(alerts, self.slim_attributes))
+        return self._serialized[1]
+
+    def _adapt_interval(self, alerts: list[AlertRecord]) -> None:
+        """Poll fast during severe alerts or watches and back off when quiet.
+
+        The interval never drops below how long the NWS says its last
+        response may be cached.
+        """
+        if any(
+            alert["Severity"] in ADAPTIVE_URGENT_SEVERITIES or "Watch" in alert["Event"]
+            for alert in alerts
+        ):
+            self._quiet_polls = 0
+            interval = min(self.interval, timedelta(seconds=ADAPTIVE_URGENT_INTERVAL))
+        elif alerts:
+            self._quiet_polls = 0
+            interval = self.interval
+        else:
+            # Double the interval for every poll without alerts
+            self._quiet_polls = min(self._quiet_polls + 1, 10)
+            interval = min(
+                self.interval * 2**self._quiet_polls,
+                max(self.interval, timedelta(minutes=ADAPTIVE_QUIET_INTERVAL)),
+            )
+
+        ttl = self._hub.cache_ttl if self.shared_feed else self._cache_ttl
+        if ttl is not None:
+            interval = max(interval, ttl)
+
+        if interval != self.update_interval:
+            _LOGGER.debug("Adapting update interval to %s", interval)
+            self.update_interval = interval
+            self._hub.async_register(self._config.entry_id, interval)
+
+    async def async_restore(self) -> bool:
+        """Serve the last persisted alerts until the first update finishes.
+
+        The restored data is marked stale when it was last confirmed longer
+        ago than SNAPSHOT_STALE_AFTER. A snapshot that can't be read is
+        ignored, the entry then waits for its first update.
+        """
+        try:
+            if (snapshot := await self._store.async_load()) is None:
+                return False
+            checked = datetime.fromisoformat(snapshot["checked"])
+            data = snapshot["data"]
+            records = [AlertRecord.from_dict(alert) for alert in data["alerts"]]
+            state = int(data["state"])
+        except (HomeAssistantError, AttributeError, KeyError, TypeError, ValueError) as error:
+            _LOGGER.warning("Ignoring unreadable alert snapshot: %s", error)
+            return False
+
+        stale = datetime.now() - checked > timedelta(minutes=SNAPSHOT_STALE_AFTER)
+        _LOGGER.debug("Restored alerts checked at %s (stale: %s)", checked, stale)
+        self.last_checked = checked
+        self._saved_checked = checked
+        alerts = [
+            self._hub.alert_pool.setdefault((record.URL, record.Sent), record) for record in records
+        ]
+        for alert in alerts:
+            self._hub.async_remember_alert(alert)
+        self.data = {**data, "state": state, "alerts": alerts, "restored": True, "stale": stale}
+        # These alerts were announced before the restart
+        self._announced = {alert["ID"]: alert for alert in self.data["alerts"]}
+        self._async_schedule_alerts()
+        return True
+
+    def _snapshot_checked_behind(self) -> bool:
+        """Return True when the saved check time lags the last check too far.
+
+        Unchanged alerts are saved again every SNAPSHOT_CHECKED_SAVE_INTERVAL,
+        so on a restart they are judged stale by when they were last checked,
+        without writing the snapshot on every poll.
+        """
+        return (
+            self._saved_checked is None
+            or self.last_checked is None
+            or self.last_checked - self._saved_checked
+            >= timedelta(minutes=SNAPSHOT_CHECKED_SAVE_INTERVAL)
+        )
+
+    @callback
+    def _snapshot_to_save(self) -> dict[str, Any]:
+        """Return the last good data to persist."""
+        self._saved_checked = self.last_checked or datetime.now()
+        return {
+            "data": {**self.data, "alerts": serialize_alerts(self.data["alerts"])},
+            "checked": self._saved_checked.isoformat(),
+        }
+
+    def _apply_fingerprint(self, data: dict[str, Any]) -> dict[str, Any]:
+        """Fingerprint the alert set and only move last_updated when it changes.
+
+        Listeners are only notified when the data differs from the previous
+        poll, so an unchanged alert set does not write any entity state until
+        the heartbeat is due.
+        """
+        self.last_checked = datetime.now()
+        alerts = data["alerts"]
+        if self._fingerprinted is not None and self._fingerprinted[0] is alerts:
+            fingerprint = self._fingerprinted[1]
+        else:
+            fingerprint = alerts_fingerprint(alerts)
+            self._fingerprinted = (alerts, fingerprint)
+
+        previous = self.data
+        if (
+            previous is not None
+            and not previous.get("restored")
+            and previous.get("fingerprint") == fingerprint
+            and self.last_checked - datetime.fromisoformat(previous["last_updated"])
+            < self.heartbeat
+        ):
+            return previous
+        return {**data, "fingerprint": fingerprint}
 
     async def _get_tracker_gps(self):
         """Return device tracker GPS data."""
@@ -78,10 +483,42 @@ class AlertsDataUpdateCoordinator(DataUpdateCoordinator):
         if entity and "source_type" in entity.attributes:
             # Check that latitude and longitude actually exist
             if "latitude" in entity.attributes and "longitude" in entity.attributes:
+                self._tracker_position = (
+                    entity.attributes["latitude"],
+                    entity.attributes["longitude"],
+                )
                 return f"{entity.attributes['latitude']},{entity.attributes['longitude']}"
             _LOGGER.warning("Tracker %s found but missing latitude/longitude attributes", tracker)
         return None
 
+    @callback
+    def async_track_tracker(self) -> CALLBACK_TYPE:
+        """Refresh as soon as the device tracker moves past the distance threshold."""
+        return async_track_state_change_event(
+            self.hass, self._config.data[CONF_TRACKER], self._async_tracker_changed
+        )
+
+    @callback
+    def _async_tracker_changed(self, event: Event[EventStateChangedData]) -> None:
+        """Handle device tracker state changes."""
+        new_state = event.data["new_state"]
+        if new_state is None:
+            return
+        lat = new_state.attributes.get(ATTR_LATITUDE)
+        lon = new_state.attributes.get(ATTR_LONGITUDE)
+        if lat is None or lon is None:
+            return
+
+        if self._tracker_position is not None:
+            moved = distance(*self._tracker_position, lat, lon)
+            if moved is not None and moved < self.tracker_distance:
+                return
+
+        _LOGGER.debug("Tracker %s moved, refreshing alerts", new_state.entity_id)
+        # Store the new position now so jitter while the refresh is pending is ignored
+        self._tracker_position = (lat, lon)
+        self._config.async_create_task(self.hass, self.async_request_refresh())
+
     async def update_alerts(self, coords) -> dict:
         """Fetch new state data for the sensor.
 
@@ -100,8 +537,12 @@ class AlertsDataUpdateCoordinator(DataUpdateCoordinator):
         if CONF_ZONE_ID in self._config.data:
             zone_id = self._config.data[CONF_ZONE_ID]
             _LOGGER.debug("Fetching alerts for zone: %s", zone_id)
-            # Directly fetch alerts for zone_id, don't rely on count endpoint
-            values = await self.async_get_alerts(zone_id=zone_id)
+            if self.shared_feed:
+                values = await self.async_get_shared_alerts(zone_id=zone_id)
+            elif self.count_precheck:
+                values = await self.async_get_counted_alerts(zone_id.split(","), zone_id=zone_id)
+            else:
+                values = await self.async_get_alerts(zone_id=zone_id)
         elif CONF_GPS_LOC in self._config.data or CONF_TRACKER in self._config.data:
             if coords is not None:
                 gps_loc = coords
@@ -112,7 +553,21 @@ class AlertsDataUpdateCoordinator(DataUpdateCoordinator):
                 return values
 
             _LOGGER.debug("Fetching alerts for GPS location: %s", gps_loc)
-            values = await self.async_get_alerts(gps_loc=gps_loc)
+            if self.shared_feed:
+                values = await self.async_get_shared_alerts(gps_loc=gps_loc)
+            elif coords is not None:
+                # Query moving trackers by zone so GPS jitter keeps the same URL
+                zones = await self._hub.async_get_point_zones(gps_loc)
+                if zones and self.count_precheck:
+                    values = await self.async_get_counted_alerts(zones, zone_id=",".join(zones))
+                elif zones:
+                    values = await self.async_get_alerts(zone_id=",".join(zones))
+                else:
+                    values = await self.async_get_alerts(gps_loc=gps_loc)
+            elif self.count_precheck and (zones := await self._hub.async_get_point_zones(gps_loc)):
+                values = await self.async_get_counted_alerts(zones, gps_loc=gps_loc)
+            else:
+                values = await self.async_get_alerts(gps_loc=gps_loc)
 
         return values
 
@@ -126,70 +581,138 @@ class AlertsDataUpdateCoordinator(DataUpdateCoordinator):
             "last_updated": datetime.now().isoformat(),
         }
         headers = {"User-Agent": self._user_agent, "Accept": "application/geo+json"}
-        data = None
 
         if zone_id != "":
-            url = f"{API_ENDPOINT}/alerts/active?zone={zone_id}"
-            _LOGGER.debug("getting alert for %s from %s", zone_id, url)
-        elif gps_loc != "":
+            # Zone queries of all entries are batched by the hub
+            _LOGGER.debug("getting alert for %s", zone_id)
+            features, self._cache_ttl = await self._hub.async_get_batched_features(
+                self._config.entry_id, zone_id
+            )
+            alerts = await self._async_parse_features(features)
+            self._validated_alerts = alerts
+            self._body_hashes.clear()
+            return alerts
+        if gps_loc != "":
             url = f"{API_ENDPOINT}/alerts/active?point={gps_loc}"
             _LOGGER.debug("getting alert for %s from %s", gps_loc, url)
 
-        async with self._session.get(url, headers=headers) as r:
-            if r.status == 200:
-                data = await r.json()
-            else:
+        if url == self._validated_url:
+            headers.update(self._validators)
+
+        async with self._hub.async_api_get(url, headers) as r:
+            self._cache_ttl = cache_ttl(r.headers)
+            if r.status == 304 and url == self._validated_url:
+                _LOGGER.debug("%s not modified, reusing parsed alerts", url)
+                self.cache_stats["not_modified"] += 1
+                return {**self._validated_alerts, "last_updated": datetime.now().isoformat()}
+            if r.status != 200:
                 msg = f"Problem updating NWS data: ({r.status}) - {r.reason}"
                 _LOGGER.warning(msg)
                 raise UpdateFailed(msg)
+            body = await r.read()
+            validators = conditional_headers(r.headers)
+
+        self._validators = validators
+        self._validated_url = url if validators else None
+        body_hash = hash(body)
+        if self._body_hashes.get(url) == body_hash:
+            # Same bytes as last time, skip decoding, ID generation and sorting
+            _LOGGER.debug("%s unchanged, reusing parsed alerts", url)
+            self.cache_stats["unchanged_body"] += 1
+            return {**self._validated_alerts, "last_updated": datetime.now().isoformat()}
+
+        self.cache_stats["decoded"] += 1
+        features = await self._hub.async_decode_features(body, url)
+        alerts = await self._async_parse_features(features)
+
+        # Only the last URL, the parsed alerts kept are for it
+        self._body_hashes = {url: body_hash}
+        self._validated_alerts = alerts
+        return alerts
 
-        if data is not None and "features" in data:
-            features = data["features"]
-            alert_list: list[Any] = []
-            for alert in features:
-                try:
-                    tmp_dict: dict[str, Any] = {}
-
-                    # Generate stable Alert ID
-                    alert_id = await self.generate_id(alert["id"])
-
-                    tmp_dict["Event"] = alert["properties"]["event"]
-                    tmp_dict["ID"] = alert_id
-                    tmp_dict["URL"] = alert["id"]
-
-                    event = alert["properties"]["event"]
-                    if "NWSheadline" in alert["properties"]["parameters"]:
-                        tmp_dict["Headline"] = alert["properties"]["parameters"]["NWSheadline"][0]
-                    else:
-                        tmp_dict["Headline"] = event
-
-                    tmp_dict["Type"] = alert["properties"]["messageType"]
-                    tmp_dict["NWSCode"] = alert["properties"]["eventCode"][
-                        "NationalWeatherService"
-                    ][0]
-                    tmp_dict["Status"] = alert["properties"]["status"]
-                    tmp_dict["Severity"] = alert["properties"]["severity"]
-                    tmp_dict["Certainty"] = alert["properties"]["certainty"]
-                    tmp_dict["Sent"] = alert["properties"]["sent"]
-                    tmp_dict["Onset"] = alert["properties"]["onset"]
-                    tmp_dict["Expires"] = alert["properties"]["expires"]
-                    tmp_dict["Ends"] = alert["properties"]["ends"]
-                    tmp_dict["AreasAffected"] = alert["properties"]["areaDesc"]
-                    tmp_dict["Description"] = alert["properties"]["description"]
-                    tmp_dict["Instruction"] = alert["properties"]["instruction"]
-
-                    alert_list.append(tmp_dict)
-                except (KeyError, TypeError) as error:
-                    _LOGGER.warning("Error parsing alert data: %s. Skipping this alert.", error)
-                    continue
-
-            alerts["state"] = len(alert_list)
-            alerts["alerts"] = sorted(alert_list, key=lambda x: x["ID"])
-            alerts["last_updated"] = datetime.now().isoformat()
+    async def async_get_counted_alerts(
+        self, zones: list[str], zone_id: str = "", gps_loc: str = ""
+    ) -> dict:
+        """Query API for Alerts only when the alert count of the zones changed.
 
+        The national count document is shared by all entries. While the counts
+        for our zones stay the same the previous alerts are reused, they are
+        downloaded again at least every COUNT_PRECHECK_MAX_AGE so an alert
+        replaced by an update is not missed for long.
+        """
+        try:
+            counts = await self._hub.async_get_zone_counts()
+        except (UpdateFailed, aiohttp.ClientError) as error:
+            _LOGGER.debug("Alert counts unavailable, fetching alerts: %s", error)
+            return await self.async_get_alerts(zone_id=zone_id, gps_loc=gps_loc)
+
+        signature = tuple((zone, counts.get(zone, 0)) for zone in sorted(z.strip() for z in zones))
+        now = datetime.now()
+        if (
+            self._counted is not None
+            and self._counted[0] == signature
+            and now - self._counted[1] < timedelta(minutes=COUNT_PRECHECK_MAX_AGE)
+        ):
+            _LOGGER.debug("Alert counts for %s unchanged, reusing alerts", zones)
+            return {**self._validated_alerts, "last_updated": now.isoformat()}
+
+        alerts = await self.async_get_alerts(zone_id=zone_id, gps_loc=gps_loc)
+        self._counted = (signature, now)
         return alerts
 
-    async def generate_id(self, val: str) -> str:
-        """Generate a unique ID for alerts."""
-        hex_string = hashlib.md5(val.encode("UTF-8")).hexdigest()
-        return str(uuid.UUID(hex=hex_string))
+    async def async_get_shared_alerts(self, zone_id: str = "", gps_loc: str = "") -> dict:
+        """Match alerts from the shared national feed."""
+
+        if zone_id != "":
+            features = await self._hub.async_get_zone_features(zone_id)
+        else:
+            features = await self._hub.async_get_point_features(gps_loc)
+        return await self._async_parse_features(features)
+
+    async def _async_parse_features(self, features: list[dict[str, Any]]) -> dict:
+        """Build the sensor data from a list of GeoJSON alert features.
+
+        Features whose id and sent time were seen on a previous poll, or
+        already parsed by another entry, reuse that record, only new or
+        updated alerts are parsed.
+        """
+
+        parsed: dict[str, tuple[str, AlertRecord]] = {}
+        changed: list[AlertRecord] = []
+        for alert in features:
+            try:
+                url = alert["id"]
+                sent = alert["properties"]["sent"]
+                cached = self._parsed.get(url)
+                if cached is not None and cached[0] == sent:
+                    parsed[url] = cached
+                    self._hub.async_remember_alert(cached[1])
+                    continue
+                # Entries with overlapping coverage share one record per alert
+                if (tmp_dict := self._hub.alert_pool.get((url, sent))) is None:
+                    tmp_dict = normalize_alert(alert)
+                    self._hub.alert_pool[url, sent] = tmp_dict
+                self._hub.async_remember_alert(tmp_dict)
+            except (KeyError, TypeError) as error:
+                _LOGGER.warning("Error parsing alert data: %s. Skipping this alert.", error)
+                continue
+            parsed[url] = (sent, tmp_dict)
+            changed.append(tmp_dict)
+
+        if changed or len(parsed) != len(self._parsed):
+            # Drop removed and superseded records, then insert the new ones in order
+            alert_list = [
+                alert
+                for alert in self._sorted_alerts
+                if (cached := parsed.get(alert["URL"])) is not None and cached[1] is alert
+            ]
+            for tmp_dict in changed:
+                insort(alert_list, tmp_dict, key=itemgetter("ID"))
+            self._sorted_alerts = alert_list
+        self._parsed = parsed
+
+        return {
+            "state": len(self._sorted_alerts),
+            "alerts": self._sorted_alerts,
+            "last_updated": datetime.now().isoformat(),
+        }
@@ -0,0 +1,35 @@
+"""Diagnostics support for nws_alerts."""
+
+from typing import Any
+
+from homeassistant.components.diagnostics import async_redact_data
+from homeassistant.config_entries import ConfigEntry
+from homeassistant.core import HomeAssistant
+
+from .const import CONF_GPS_LOC, COORDINATOR, DOMAIN, HUB
+
+TO_REDACT = {CONF_GPS_LOC}
+
+
+async def async_get_config_entry_diagnostics(
+    hass: HomeAssistant, config_entry: ConfigEntry
+) -> dict[str, Any]:
+    """Return diagnostics for a config entry."""
+    coordinator = hass.data[DOMAIN][config_entry.entry_id][COORDINATOR]
+    hub = hass.data[DOMAIN][HUB]
+    return {
+        "entry": async_redact_data(config_entry.as_dict(), TO_REDACT),
+        "coordinator": {
+            "last_update_success": coordinator.last_update_success,
+            "last_checked": coordinator.last_checked,
+            "update_interval": coordinator.update_interval,
+            "alerts": len(coordinator.data["alerts"]) if coordinator.data else None,
+            "cache": dict(coordinator.cache_stats),
+        },
+        "hub": {
+            "cache": dict(hub.cache_stats),
+            "alert_pool": len(hub.alert_pool),
+            "circuit_open": hub.breaker.is_open,
+            "backoff_remaining": hub.limiter.backoff_remaining,
+        },
+    }
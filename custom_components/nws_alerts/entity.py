@@ -0,0 +1,115 @@
+"""Base entity for nws_alerts."""
+
+from typing import Any
+
+from homeassistant.config_entries import ConfigEntry
+from homeassistant.const import ATTR_ATTRIBUTION, CONF_NAME
+from homeassistant.core import HomeAssistant, callback
+from homeassistant.helpers.device_registry import DeviceEntryType
+from homeassistant.helpers.entity import DeviceInfo, EntityDescription
+from homeassistant.helpers.update_coordinator import CoordinatorEntity
+from homeassistant.util import slugify
+
+from .const import ATTRIBUTION, CONF_GPS_LOC, CONF_TRACKER, CONF_ZONE_ID, COORDINATOR, DOMAIN
+from .coordinator import AlertsDataUpdateCoordinator
+
+
+class NWSAlertEntity(CoordinatorEntity[AlertsDataUpdateCoordinator]):
+    """Base class for the entities of a config entry."""
+
+    def __init__(
+        self,
+        hass: HomeAssistant,
+        entry: ConfigEntry,
+        description: EntityDescription,
+    ) -> None:
+        """Initialize the entity."""
+        super().__init__(hass.data[DOMAIN][entry.entry_id][COORDINATOR])
+        self.entity_description = description
+        self._config = entry
+        self._key = description.key
+        self._shown: Any = None
+
+        self._attr_icon = description.icon
+        self._attr_name = f"{entry.data[CONF_NAME]} {description.name}"
+        self._attr_device_class = description.device_class
+        self._attr_unique_id = f"{slugify(self._attr_name)}_{entry.entry_id}"
+
+    def _index_slice(self) -> Any:
+        """Return the part of the alert index the entity shows, None if it shows the whole update."""
+        return None
+
+    async def async_added_to_hass(self) -> None:
+        """Remember what the initial state shows."""
+        await super().async_added_to_hass()
+        if (shown := self._index_slice()) is not None:
+            self._shown = (self.available, shown)
+
+    @callback
+    def _handle_coordinator_update(self) -> None:
+        """Only write the state when the part of the alerts this entity shows changed."""
+        if (shown := self._index_slice()) is not None:
+            shown = (self.available, shown)
+            if shown == self._shown:
+                return
+            self._shown = shown
+        super()._handle_coordinator_update()
+
+    def _config_attributes(self) -> dict[str, Any]:
+        """Return the configuration information and attribution attributes."""
+        attrs: dict[str, Any] = {}
+        config_data = self._config.data
+
+        if CONF_ZONE_ID in config_data:
+            attrs["configuration_type"] = "Zone ID"
+            attrs["zone_id"] = config_data[CONF_ZONE_ID]
+        elif CONF_GPS_LOC in config_data:
+            attrs["configuration_type"] = "GPS Location"
+            attrs["gps_location"] = config_data[CONF_GPS_LOC]
+        elif CONF_TRACKER in config_data:
+            attrs["configuration_type"] = "Device Tracker"
+            attrs["tracker_entity"] = config_data[CONF_TRACKER]
+
+        attrs[ATTR_ATTRIBUTION] = ATTRIBUTION
+        return attrs
+
+    @property
+    def device_info(self) -> DeviceInfo:
+        """Return device registry information."""
+        config_data = self._config.data
+
+        # Create a more descriptive device name based on configuration
+        if CONF_ZONE_ID in config_data:
+            zone_id = config_data[CONF_ZONE_ID]
+            device_name = (
+                f"NWS Alerts (Zone: {zone_id[:20]}...)"
+                if len(zone_id) > 20
+                else f"NWS Alerts (Zone: {zone_id})"
+            )
+        elif CONF_GPS_LOC in config_data:
+            # Truncate GPS to 4 decimal places for readability (~11 meter precision)
+            gps = config_data[CONF_GPS_LOC]
+            try:
+                parts = gps.replace(" ", "").split(",")
+                lat = f"{float(parts[0]):.4f}"
+                lon = f"{float(parts[1]):.4f}"
+                device_name = f"NWS Alerts (GPS: {lat},{lon})"
+            except (ValueError, IndexError):
+                # Fallback if parsing fails
+                device_name = (
+                    f"NWS Alerts (GPS: {gps[:25]}...)"
+                    if len(gps) > 25
+                    else f"NWS Alerts (GPS: {gps})"
+                )
+        elif CONF_TRACKER in config_data:
+            tracker_name = config_data[CONF_TRACKER].split(".")[-1]  # Get entity name part
+            device_name = f"NWS Alerts (Tracker: {tracker_name})"
+        else:
+            device_name = "NWS Alerts"
+
+        return DeviceInfo(
+            entry_type=DeviceEntryType.SERVICE,
+            identifiers={(DOMAIN, self._config.entry_id)},
+            manufacturer="NWS",
+            name=device_name,
+        )
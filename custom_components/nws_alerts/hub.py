@@ -0,0 +1,652 @@
+"""Shared national alert feed for nws_alerts."""
+
+import asyncio
+from asyncio import Lock
+from collections import Counter, OrderedDict
+from collections.abc import AsyncIterator, Mapping
+from contextlib import asynccontextmanager
+from datetime import datetime, timedelta
+from email.utils import parsedate_to_datetime
+from functools import partial
+import json
+import logging
+import re
+from typing import Any
+from weakref import WeakValueDictionary
+
+import aiohttp
+
+from homeassistant.core import HomeAssistant, callback
+from homeassistant.helpers.storage import Store
+from homeassistant.helpers.update_coordinator import UpdateFailed
+from homeassistant.util import dt as dt_util
+
+from .alert import AlertRecord, alert_id as url_alert_id, normalize_alert
+from .const import (
+    ALERT_DETAILS_CACHE_SIZE,
+    API_ENDPOINT,
+    DEFAULT_DECODE_THRESHOLD,
+    DEFAULT_INTERVAL,
+    DOMAIN,
+    ZONE_CACHE_SIZE,
+    ZONE_CACHE_STORAGE_KEY,
+    ZONE_CACHE_STORAGE_VERSION,
+    ZONE_GRID_RESOLUTION,
+)
+from .ratelimit import CircuitBreaker, RateLimiter
+from .zone_index import ZoneIndex, async_get_zone_index
+
+_LOGGER = logging.getLogger(__name__)
+
+# Re-fetch a little early so an entry polling on its own interval never
+# receives the feed from the previous cycle.
+HUB_SLACK = timedelta(seconds=5)
+ZONE_CACHE_SAVE_DELAY = 30
+# Batched zone queries are split to keep URLs below this length
+BATCH_URL_MAX_LENGTH = 2000
+# Alert properties the coordinator reads, everything else is dropped on decode
+ALERT_PROPERTIES = (
+    "event",
+    "messageType",
+    "status",
+    "severity",
+    "certainty",
+    "sent",
+    "onset",
+    "expires",
+    "ends",
+    "areaDesc",
+    "description",
+    "instruction",
+)
+
+
+def grid_cell(lat: float, lon: float, resolution: float = ZONE_GRID_RESOLUTION) -> str:
+    """Snap a point to the grid cell it falls in."""
+    return f"{round(lat / resolution)},{round(lon / resolution)}"
+
+
+def zone_batches(zones: list[str], max_length: int = BATCH_URL_MAX_LENGTH) -> list[list[str]]:
+    """Split zone codes into the fewest ?zone= queries whose URL fits max_length."""
+    prefix = len(f"{API_ENDPOINT}/alerts/active?zone=")
+    batches: list[list[str]] = []
+    length = 0
+    for zone in zones:
+        if batches and length + 1 + len(zone) <= max_length:
+            batches[-1].append(zone)
+            length += 1 + len(zone)
+        else:
+            batches.append([zone])
+            length = prefix + len(zone)
+    return batches
+
+
+def conditional_headers(headers: Mapping[str, str]) -> dict[str, str]:
+    """Return the request headers revalidating a response with these headers."""
+    validators = {}
+    if etag := headers.get("ETag"):
+        validators["If-None-Match"] = etag
+    if last_modified := headers.get("Last-Modified"):
+        validators["If-Modified-Since"] = last_modified
+    return validators
+
+
+def cache_ttl(headers: Mapping[str, str]) -> timedelta | None:
+    """Return how long a response may be cached from its Cache-Control/Expires headers."""
+    if match := re.search(r"max-age=(\d+)", headers.get("Cache-Control", "")):
+        return timedelta(seconds=int(match.group(1)))
+    if expires := headers.get("Expires"):
+        try:
+            date = parsedate_to_datetime(headers["Date"]) if "Date" in headers else dt_util.utcnow()
+            return max(parsedate_to_datetime(expires) - date, timedelta(0))
+        except (TypeError, ValueError):
+            return None
+    return None
+
+
+def feature_zones(feature: dict[str, Any]) -> set[str]:
+    """Return the UGC zone/county codes an alert feature applies to."""
+    properties = feature.get("properties") or {}
+    zones = set((properties.get("geocode") or {}).get("UGC") or [])
+    zones.update(url.rsplit("/", 1)[-1] for url in properties.get("affectedZones") or [])
+    return zones
+
+
+def slim_feature(feature: dict[str, Any], geometry: bool = False) -> dict[str, Any]:
+    """Return an alert feature with only what the integration reads.
+
+    Geometry is kept only when asked for, to match points against. The
+    affected zones are folded into the UGC codes and of the parameters only
+    the headline is kept.
+    """
+    properties = feature.get("properties") or {}
+    slim = {key: properties[key] for key in ALERT_PROPERTIES if key in properties}
+    if "parameters" in properties:
+        parameters = properties["parameters"] or {}
+        slim["parameters"] = (
+            {"NWSheadline": parameters["NWSheadline"]} if "NWSheadline" in parameters else {}
+        )
+    if "eventCode" in properties:
+        event_code = properties["eventCode"] or {}
+        slim["eventCode"] = {"NationalWeatherService": event_code.get("NationalWeatherService")}
+    slim["geocode"] = {"UGC": sorted(feature_zones(feature))}
+    result = {"id": feature.get("id"), "properties": slim}
+    if geometry and feature.get("geometry"):
+        result["geometry"] = feature["geometry"]
+    return result
+
+
+def _slim_features(geometry: bool, obj: dict[str, Any]) -> dict[str, Any]:
+    """Slim every feature as soon as the decoder finishes it."""
+    if obj.get("type") == "Feature" and "properties" in obj:
+        return slim_feature(obj, geometry)
+    return obj
+
+
+def decode_features(body: bytes, geometry: bool = False) -> list[dict[str, Any]]:
+    """Decode an alert collection into slim features.
+
+    Each feature is slimmed the moment the decoder finishes it, so outlines,
+    zone URL lists and unused parameters are released feature by feature
+    instead of the whole document being held at once.
+    """
+    decoder = json.JSONDecoder(object_hook=partial(_slim_features, geometry))
+    data = decoder.decode(body.decode("utf-8"))
+    if not isinstance(data, dict):
+        return []
+    return [feature for feature in data.get("features") or [] if "properties" in feature]
+
+
+def decode_alerts(
+    body: bytes, geometry: bool, known: frozenset[tuple[str, str]]
+) -> tuple[list[dict[str, Any]], list[AlertRecord]]:
+    """Decode an alert collection and build the records of the alerts not known yet.
+
+    Run in the executor for large responses, so the records of an outbreak's
+    worth of new alerts are built off the event loop too.
+    """
+    features = decode_features(body, geometry)
+    records = []
+    for feature in features:
+        try:
+            if (feature["id"], feature["properties"]["sent"]) not in known:
+                records.append(normalize_alert(feature))
+        except (KeyError, TypeError):
+            # Logged by the entries parsing it
+            continue
+    return features, records
+
+
+def point_in_geometry(geometry: dict[str, Any], lat: float, lon: float) -> bool:
+    """Return True if the point lies inside a GeoJSON (Multi)Polygon."""
+    if geometry.get("type") == "Polygon":
+        polygons = [geometry["coordinates"]]
+    elif geometry.get("type") == "MultiPolygon":
+        polygons = geometry["coordinates"]
+    else:
+        return False
+
+    for rings in polygons:
+        # First ring is the outline, any others are holes
+        if rings and _point_in_ring(rings[0], lat, lon):
+            if not any(_point_in_ring(hole, lat, lon) for hole in rings[1:]):
+                return True
+    return False
+
+
+def _point_in_ring(ring: list[list[float]], lat: float, lon: float) -> bool:
+    """Ray casting test against a single linear ring of [lon, lat] pairs."""
+    inside = False
+    j = len(ring) - 1
+    for i, (x_i, y_i) in enumerate(ring):
+        x_j, y_j = ring[j]
+        if (y_i > lat) != (y_j > lat) and lon < (x_j - x_i) * (lat - y_i) / (y_j - y_i) + x_i:
+            inside = not inside
+        j = i
+    return inside
+
+
+class AlertsHub:
+    """Fetch the national alert feed once per cycle and share it between entries."""
+
+    def __init__(
+        self,
+        hass: HomeAssistant,
+        *,
+        session: aiohttp.ClientSession,
+        user_agent: str,
+    ) -> None:
+        """Initialize."""
+        self.hass = hass
+        self._session = session
+        self._user_agent = user_agent
+        self._lock = Lock()
+        self.limiter = RateLimiter(hass)
+        self.breaker = CircuitBreaker(hass)
+        self._decode_thresholds: dict[str, int] = {}
+        # Records built along with large responses, held until the next
+        # response of the same URL so the entries find them in the pool
+        self._decoded_records: dict[str, list[AlertRecord]] = {}
+        self._intervals: dict[str, timedelta] = {}
+        self._fetched: datetime | None = None
+        self._validators: dict[str, str] = {}
+        self.cache_ttl: timedelta | None = None
+        self._by_zone: dict[str, list[dict[str, Any]]] = {}
+        self._with_geometry: list[dict[str, Any]] = []
+        self._counts_lock = Lock()
+        self._counts_fetched: datetime | None = None
+        self._counts: dict[str, int] = {}
+        # Request broker state for batched ?zone= queries
+        self._entry_zones: dict[str, list[str]] = {}
+        self._zone_features: dict[str, list[dict[str, Any]]] = {}
+        self._zone_fetched: dict[str, datetime] = {}
+        self._zone_ttl: dict[str, timedelta | None] = {}
+        self._in_flight: dict[str, asyncio.Task[None]] = {}
+        # Batch URL each zone was last fetched under, the conditional request
+        # state of a batch URL is kept only while a zone refers to it
+        self._zone_batch: dict[str, str] = {}
+        self._batch_validators: dict[str, tuple[dict[str, str], list[dict[str, Any]]]] = {}
+        # Hash of the last body per batch URL, an identical body isn't decoded again
+        self._batch_bodies: dict[str, tuple[int, list[dict[str, Any]]]] = {}
+        self.cache_stats: Counter[str] = Counter()
+        self._zone_index: ZoneIndex | None = None
+        # Serialized copies of the most recently held alerts by ID, for the
+        # get_alert_details service, so they don't keep records in the pool
+        self.alert_details: OrderedDict[str, dict[str, Any]] = OrderedDict()
+        # One record per alert version for all entries, dropped once no entry holds it
+        self.alert_pool: WeakValueDictionary[tuple[str, str], AlertRecord] = WeakValueDictionary()
+        self._zone_cells: OrderedDict[str, list[str]] = OrderedDict()
+        self._zone_store: Store[dict[str, Any]] = Store(
+            hass, ZONE_CACHE_STORAGE_VERSION, ZONE_CACHE_STORAGE_KEY
+        )
+
+    async def async_load(self) -> None:
+        """Load the offline zone index and the persisted point to zone cache."""
+        self._zone_index = await async_get_zone_index(self.hass)
+        if (data := await self._zone_store.async_load()) is None:
+            return
+        # Cells of a different grid size don't map to the current grid
+        if data.get("resolution") == ZONE_GRID_RESOLUTION:
+            # Keep anything resolved by entries set up while loading
+            self._zone_cells = OrderedDict(data["cells"]) | self._zone_cells
+
+    @callback
+    def _zone_cells_to_save(self) -> dict[str, Any]:
+        """Return the point to zone cache to persist."""
+        return {"resolution": ZONE_GRID_RESOLUTION, "cells": dict(self._zone_cells)}
+
+    @callback
+    def async_register(self, entry_id: str, interval: timedelta) -> None:
+        """Register a config entry using the hub."""
+        self._intervals[entry_id] = interval
+
+    @callback
+    def async_unregister(self, entry_id: str) -> bool:
+        """Unregister a config entry, return True when no entries remain."""
+        self._intervals.pop(entry_id, None)
+        self._decode_thresholds.pop(entry_id, None)
+        self._decoded_records.clear()
+        if self._entry_zones.pop(entry_id, None) is not None:
+            self._zone_batch.clear()
+            self._batch_validators.clear()
+            self._batch_bodies.clear()
+        return not self._intervals
+
+    @callback
+    def async_set_decode_threshold(self, entry_id: str, threshold: int) -> None:
+        """Set the response size in bytes an entry wants decoded in the executor."""
+        self._decode_thresholds[entry_id] = threshold
+
+    @property
+    def decode_threshold(self) -> int:
+        """Return the response size over which alerts are decoded in the executor.
+
+        Responses are shared between entries, the smallest threshold wins.
+        """
+        return min(self._decode_thresholds.values(), default=DEFAULT_DECODE_THRESHOLD * 1024)
+
+    @property
+    def max_age(self) -> timedelta:
+        """Return how long a fetched feed is served before it is refreshed."""
+        interval = min(self._intervals.values(), default=timedelta(minutes=DEFAULT_INTERVAL))
+        return max(interval - HUB_SLACK, HUB_SLACK)
+
+    def _zone_max_age(self, zone: str) -> timedelta:
+        """Return how long alerts fetched for a zone are served to entries."""
+        interval = min(
+            (
+                self._intervals[entry_id]
+                for entry_id, zones in self._entry_zones.items()
+                if zone in zones and entry_id in self._intervals
+            ),
+            default=timedelta(minutes=DEFAULT_INTERVAL),
+        )
+        return max(interval - HUB_SLACK, HUB_SLACK)
+
+    async def async_get_batched_features(
+        self, entry_id: str, zone_id: str
+    ) -> tuple[list[dict[str, Any]], timedelta | None]:
+        """Return the active alert features for an entry's zones and their cache time.
+
+        This is a request broker for ?zone= queries. When an entry polls, the
+        zones of every entry that are due are fetched together in as few
+        queries as the URL length allows, so entries polling later in the
+        same cycle, or watching overlapping zones, are served from the result.
+        Zones already being fetched are awaited instead of requested again.
+        """
+        zones = [zone.strip() for zone in zone_id.split(",")]
+        if self._entry_zones.get(entry_id) != zones:
+            self._entry_zones[entry_id] = zones
+            self._zone_batch.clear()
+            self._batch_validators.clear()
+            self._batch_bodies.clear()
+            self._decoded_records.clear()
+
+        now = dt_util.utcnow()
+        wanted = [
+            zone
+            for zone in dict.fromkeys(zones + [z for zs in self._entry_zones.values() for z in zs])
+            if zone not in self._in_flight
+            and (
+                zone not in self._zone_fetched
+                or now - self._zone_fetched[zone] >= self._zone_max_age(zone)
+            )
+        ]
+        for batch in zone_batches(wanted):
+            task = self.hass.async_create_background_task(
+                self._async_fetch_zones(batch), f"{DOMAIN} zone batch", eager_start=False
+            )
+            for zone in batch:
+                self._in_flight[zone] = task
+
+        tasks = list(
+            dict.fromkeys(
+                self._in_flight[zone] for zone in zones + wanted if zone in self._in_flight
+            )
+        )
+        ours = {self._in_flight[zone] for zone in zones if zone in self._in_flight}
+        # Other entries await the same fetches, a caller giving up mustn't cancel them
+        results = await asyncio.gather(
+            *(asyncio.shield(task) for task in tasks), return_exceptions=True
+        )
+        for task, result in zip(tasks, results, strict=True):
+            if isinstance(result, asyncio.CancelledError) and task in ours:
+                raise UpdateFailed("Batched alert request was cancelled") from result
+            if isinstance(result, BaseException) and task in ours:
+                raise result
+
+        features: dict[str, dict[str, Any]] = {}
+        for zone in zones:
+            for feature in self._zone_features.get(zone, []):
+                features.setdefault(feature["id"], feature)
+        ttls = [ttl for zone in zones if (ttl := self._zone_ttl.get(zone)) is not None]
+        return list(features.values()), min(ttls, default=None)
+
+    async def _async_fetch_zones(self, batch: list[str]) -> None:
+        """Fetch one batched ?zone= query and route the features to each zone."""
+        url = f"{API_ENDPOINT}/alerts/active?zone={','.join(batch)}"
+        validators, cached = self._batch_validators.get(url, ({}, None))
+        headers = {"User-Agent": self._user_agent, "Accept": "application/geo+json", **validators}
+        try:
+            _LOGGER.debug("Fetching batched alerts from %s", url)
+            async with self.async_api_get(url, headers=headers) as r:
+                ttl = cache_ttl(r.headers)
+                if r.status == 304 and cached is not None:
+                    _LOGGER.debug("%s not modified", url)
+                    self.cache_stats["not_modified"] += 1
+                    features = cached
+                elif r.status == 200:
+                    body = await r.read()
+                    body_hash = hash(body)
+                    last_hash, last_features = self._batch_bodies.get(url, (None, []))
+                    if body_hash == last_hash:
+                        _LOGGER.debug("%s unchanged, reusing decoded alerts", url)
+                        self.cache_stats["unchanged_body"] += 1
+                        features = last_features
+                    else:
+                        self.cache_stats["decoded"] += 1
+                        features = await self.async_decode_features(body, url)
+                        self._batch_bodies[url] = (body_hash, features)
+                    if validators := conditional_headers(r.headers):
+                        self._batch_validators[url] = (validators, features)
+                else:
+                    msg = f"Problem updating NWS data: ({r.status}) - {r.reason}"
+                    _LOGGER.warning(msg)
+                    raise UpdateFailed(msg)
+        finally:
+            for zone in batch:
+                self._in_flight.pop(zone, None)
+
+        now = dt_util.utcnow()
+        routed: dict[str, list[dict[str, Any]]] = {zone: [] for zone in batch}
+        for feature in features:
+            if zones := feature_zones(feature) & routed.keys():
+                for zone in zones:
+                    routed[zone].append(feature)
+            elif len(batch) == 1:
+                # Asked for this zone alone, the API matched it by more than its codes
+                routed[batch[0]].append(feature)
+            else:
+                # Can't tell which zone of the batch it is for, they may be far apart
+                _LOGGER.debug("Dropping alert %s matching none of %s", feature.get("id"), batch)
+        for zone, zone_features in routed.items():
+            self._zone_features[zone] = zone_features
+            self._zone_fetched[zone] = now
+            self._zone_ttl[zone] = ttl
+            self._zone_batch[zone] = url
+        self._async_prune_batches()
+
+    @callback
+    def _async_prune_batches(self) -> None:
+        """Drop the state of batch URLs no zone was last fetched under.
+
+        Which zones are batched together depends on which are due, so a
+        combination may never come back, its features and records with it.
+        """
+        current = set(self._zone_batch.values())
+        for url in (self._batch_validators.keys() | self._batch_bodies.keys()) - current:
+            self._batch_validators.pop(url, None)
+            self._batch_bodies.pop(url, None)
+            self._decoded_records.pop(url, None)
+
+    async def async_get_zone_features(self, zone_id: str) -> list[dict[str, Any]]:
+        """Return the active alert features for a comma separated zone list."""
+        await self._async_refresh()
+
+        features: dict[str, dict[str, Any]] = {}
+        for zone in zone_id.split(","):
+            for feature in self._by_zone.get(zone.strip(), []):
+                features.setdefault(feature["id"], feature)
+        return list(features.values())
+
+    async def async_get_point_features(self, gps_loc: str) -> list[dict[str, Any]]:
+        """Return the active alert features covering a lat,lon point."""
+        zones = await self.async_get_point_zones(gps_loc)
+        await self._async_refresh()
+
+        lat, lon = (float(x) for x in gps_loc.split(","))
+        features: dict[str, dict[str, Any]] = {}
+        # Polygon alerts only apply inside their polygon, the rest by zone
+        for feature in self._with_geometry:
+            if point_in_geometry(feature["geometry"], lat, lon):
+                features.setdefault(feature["id"], feature)
+        for zone in zones:
+            for feature in self._by_zone.get(zone, []):
+                if not feature.get("geometry"):
+                    features.setdefault(feature["id"], feature)
+        return list(features.values())
+
+    async def async_get_zone_counts(self) -> dict[str, int]:
+        """Return the number of active alerts per zone for the whole country.
+
+        The small count document is fetched at most once per cycle, however
+        many entries ask for it.
+        """
+        async with self._counts_lock:
+            now = dt_util.utcnow()
+            if self._counts_fetched is None or now - self._counts_fetched >= self.max_age:
+                _LOGGER.debug("Fetching active alert counts")
+                data = await self.async_fetch_json(f"{API_ENDPOINT}/alerts/active/count")
+                self._counts = data.get("zones", {})
+                self._counts_fetched = now
+            return self._counts
+
+    async def async_get_point_zones(self, gps_loc: str) -> list[str]:
+        """Resolve a lat,lon point to its NWS zone and county codes."""
+        lat, lon = (float(x) for x in gps_loc.split(","))
+        return await self.async_resolve_zones(lat, lon)
+
+    async def async_resolve_zones(self, lat: float, lon: float) -> list[str]:
+        """Resolve a point to zone codes.
+
+        The offline zone index answers locally when it is installed. Otherwise
+        points are resolved through the API once per grid cell; nearby points
+        share a cell, so GPS jitter and a fleet of trackers in the same area
+        are served from the cache.
+        """
+        if self._zone_index is not None and (local := self._zone_index.lookup(lat, lon)):
+            return local
+
+        cell = grid_cell(lat, lon)
+        if (cached := self._zone_cells.get(cell)) is not None:
+            self._zone_cells.move_to_end(cell)
+            return cached
+
+        i, j = (int(x) for x in cell.split(","))
+        center = f"{i * ZONE_GRID_RESOLUTION:.4f},{j * ZONE_GRID_RESOLUTION:.4f}"
+        data = await self.async_fetch_json(f"{API_ENDPOINT}/zones?point={center}")
+        zones = list(dict.fromkeys(f["properties"]["id"] for f in data.get("features", [])))
+        _LOGGER.debug("Resolved grid cell %s to zones %s", center, zones)
+
+        self._zone_cells[cell] = zones
+        while len(self._zone_cells) > ZONE_CACHE_SIZE:
+            self._zone_cells.popitem(last=False)
+        self._zone_store.async_delay_save(self._zone_cells_to_save, ZONE_CACHE_SAVE_DELAY)
+        return zones
+
+    @asynccontextmanager
+    async def async_api_get(
+        self, url: str, headers: dict[str, str]
+    ) -> AsyncIterator[aiohttp.ClientResponse]:
+        """Send a GET request to the NWS API, paced by the shared rate limiter.
+
+        Requests fail fast while the circuit breaker is open.
+        """
+        await self.limiter.async_acquire()
+        self.breaker.async_before_request()
+        try:
+            async with self._session.get(url, headers=headers) as r:
+                if r.status >= 500:
+                    self.breaker.async_record_failure()
+                else:
+                    self.breaker.async_record_success()
+                self.limiter.async_record(r.status, r.headers)
+                yield r
+        except (aiohttp.ClientError, TimeoutError, asyncio.CancelledError):
+            self.breaker.async_record_failure()
+            raise
+
+    async def async_decode_features(
+        self, body: bytes, url: str, geometry: bool = False
+    ) -> list[dict[str, Any]]:
+        """Decode an alert response, large ones in the executor.
+
+        A national or multi-state response takes long enough to decode and
+        parse to stall the event loop, so the records of its new alerts are
+        built in the same executor job and added to the pool. Small zone
+        responses aren't worth the thread hop.
+        """
+        if len(body) <= self.decode_threshold:
+            self._decoded_records.pop(url, None)
+            return decode_features(body, geometry)
+        _LOGGER.debug("Decoding %s bytes in the executor", len(body))
+        features, records = await self.hass.async_add_executor_job(
+            decode_alerts, body, geometry, frozenset(self.alert_pool.keys())
+        )
+        self._decoded_records[url] = [
+            self.alert_pool.setdefault((record["URL"], record["Sent"]), record)
+            for record in records
+        ]
+        return features
+
+    @callback
+    def async_remember_alert(self, alert: AlertRecord) -> None:
+        """Keep an alert an entry holds for the get_alert_details service."""
+        details = self.alert_details.get(alert["ID"])
+        if details is None or details["Sent"] != alert["Sent"]:
+            self.alert_details[alert["ID"]] = alert.as_dict()
+        self.alert_details.move_to_end(alert["ID"])
+        while len(self.alert_details) > ALERT_DETAILS_CACHE_SIZE:
+            self.alert_details.popitem(last=False)
+
+    async def async_get_alert_details(
+        self, alert_id: str | None = None, url: str | None = None
+    ) -> dict[str, Any]:
+        """Return an alert with its full texts, serialized.
+
+        Served from the alerts fetched recently, an alert that is no longer
+        held is fetched from its URL. Raises LookupError for an unknown ID.
+        """
+        if alert_id is None and url is not None:
+            alert_id = url_alert_id(url)
+        if (details := self.alert_details.get(alert_id or "")) is not None:
+            self.alert_details.move_to_end(details["ID"])
+            return details
+        if url is None:
+            raise LookupError(f"Alert {alert_id} is not known, pass its URL")
+        if not url.startswith(f"{API_ENDPOINT}/alerts/"):
+            raise LookupError(f"{url} is not an NWS alert URL")
+
+        _LOGGER.debug("Fetching alert details from %s", url)
+        alert = normalize_alert(await self.async_fetch_json(url))
+        self.async_remember_alert(alert)
+        return self.alert_details[alert["ID"]]
+
+    async def async_fetch_json(self, url: str) -> dict[str, Any]:
+        """Fetch a JSON document from the NWS API."""
+        headers = {"User-Agent": self._user_agent, "Accept": "application/geo+json"}
+        async with self.async_api_get(url, headers=headers) as r:
+            if r.status == 200:
+                return await r.json()
+            msg = f"Problem updating NWS data: ({r.status}) - {r.reason}"
+            _LOGGER.warning(msg)
+            raise UpdateFailed(msg)
+
+    async def _async_refresh(self) -> None:
+        """Fetch the national feed unless the cached copy is still fresh."""
+        async with self._lock:
+            now = dt_util.utcnow()
+            if self._fetched is not None and now - self._fetched < self.max_age:
+                return
+
+            _LOGGER.debug("Fetching national alert feed")
+            headers = {
+                "User-Agent": self._user_agent,
+                "Accept": "application/geo+json",
+                **self._validators,
+            }
+            url = f"{API_ENDPOINT}/alerts/active"
+            async with self.async_api_get(url, headers=headers) as r:
+                self.cache_ttl = cache_ttl(r.headers)
+                if r.status == 304 and self._fetched is not None:
+                    _LOGGER.debug("National alert feed not modified")
+                    self._fetched = now
+                    return
+                if r.status != 200:
+                    msg = f"Problem updating NWS data: ({r.status}) - {r.reason}"
+                    _LOGGER.warning(msg)
+                    raise UpdateFailed(msg)
+                features = await self.async_decode_features(await r.read(), url, geometry=True)
+                self._validators = conditional_headers(r.headers)
+
+            by_zone: dict[str, list[dict[str, Any]]] = {}
+            with_geometry = []
+            for feature in features:
+                for zone in feature_zones(feature):
+                    by_zone.setdefault(zone, []).append(feature)
+                if feature.get("geometry"):
+                    with_geometry.append(feature)
+
+            self._by_zone = by_zone
+            self._with_geometry = with_geometry
+            self._fetched = now
@@ -0,0 +1,181 @@
+"""Request pacing and failure handling for the NWS API."""
+
+import asyncio
+from collections.abc import Mapping
+from email.utils import parsedate_to_datetime
+import logging
+import random
+
+from homeassistant.core import HomeAssistant, callback
+from homeassistant.helpers.update_coordinator import UpdateFailed
+from homeassistant.util import dt as dt_util
+
+from .const import (
+    BACKOFF_BASE,
+    BACKOFF_MAX,
+    CIRCUIT_COOLDOWN,
+    CIRCUIT_FAILURES,
+    RATE_LIMIT_BURST,
+    RATE_LIMIT_RATE,
+)
+
+_LOGGER = logging.getLogger(__name__)
+
+# Replies telling us the API is overloaded or degraded
+BACKOFF_STATUSES = frozenset({429, 500, 502, 503, 504})
+
+
+class BackoffError(UpdateFailed):
+    """Raised while requests to the NWS API are held back."""
+
+
+class CircuitOpenError(BackoffError):
+    """Raised while the NWS API is considered down."""
+
+
+def retry_after(headers: Mapping[str, str]) -> float | None:
+    """Return the Retry-After header in seconds, it is either seconds or an HTTP date."""
+    if (value := headers.get("Retry-After")) is None:
+        return None
+    if value.strip().isdigit():
+        return float(value)
+    try:
+        return max((parsedate_to_datetime(value) - dt_util.utcnow()).total_seconds(), 0.0)
+    except (TypeError, ValueError):
+        return None
+
+
+def backoff_delay(failures: int, minimum: float | None = None) -> float:
+    """Return the seconds to back off after consecutive failures.
+
+    Exponential with jitter, so installations that failed together don't all
+    come back at the same moment, and never shorter than the server asked for.
+    """
+    delay = min(BACKOFF_MAX, BACKOFF_BASE * 2 ** (failures - 1))
+    return max(random.uniform(delay / 2, delay), minimum or 0.0)
+
+
+class RateLimiter:
+    """Token bucket shared by every request of the integration, with backoff."""
+
+    def __init__(
+        self,
+        hass: HomeAssistant,
+        rate: float = RATE_LIMIT_RATE,
+        burst: int = RATE_LIMIT_BURST,
+    ) -> None:
+        """Initialize."""
+        self.hass = hass
+        self._rate = rate
+        self._burst = burst
+        self._tokens = float(burst)
+        self._updated = hass.loop.time()
+        self._lock = asyncio.Lock()
+        self.failures = 0
+        self._backoff_until = 0.0
+
+    @property
+    def backoff_remaining(self) -> float:
+        """Return the seconds left before requests are allowed again."""
+        return max(self._backoff_until - self.hass.loop.time(), 0.0)
+
+    async def async_acquire(self) -> None:
+        """Wait for a request slot.
+
+        Raises BackoffError while backing off instead of waiting, callers
+        keep serving what they have.
+        """
+        if remaining := self.backoff_remaining:
+            raise BackoffError(f"Backing off from the NWS API for another {remaining:.0f} s")
+        async with self._lock:
+            while True:
+                now = self.hass.loop.time()
+                self._tokens = min(self._burst, self._tokens + (now - self._updated) * self._rate)
+                self._updated = now
+                if self._tokens >= 1:
+                    self._tokens -= 1
+                    return
+                await asyncio.sleep((1 - self._tokens) / self._rate)
+
+    @callback
+    def async_record(self, status: int, headers: Mapping[str, str]) -> None:
+        """Record a response, raise BackoffError when the API wants us to slow down."""
+        if status not in BACKOFF_STATUSES:
+            if status < 400:
+                self.failures = 0
+            return
+        self.failures += 1
+        delay = backoff_delay(self.failures, retry_after(headers))
+        self._backoff_until = self.hass.loop.time() + delay
+        _LOGGER.warning(
+            "NWS API replied %s, backing off for %.0f seconds (failure %s)",
+            status,
+            delay,
+            self.failures,
+        )
+        raise BackoffError(f"NWS API replied {status}, backing off for {delay:.0f} s")
+
+
+class CircuitBreaker:
+    """Stop calling the NWS API after repeated failures.
+
+    After CIRCUIT_FAILURES consecutive timeouts, connection errors or 5xx
+    replies requests fail fast. Every cooldown a single request is let
+    through to probe the API, its success closes the circuit again.
+    """
+
+    def __init__(
+        self,
+        hass: HomeAssistant,
+        threshold: int = CIRCUIT_FAILURES,
+        cooldown: float = CIRCUIT_COOLDOWN,
+    ) -> None:
+        """Initialize."""
+        self.hass = hass
+        self._threshold = threshold
+        self._cooldown = cooldown
+        self.failures = 0
+        self._opened_at: float | None = None
+        self._probing = False
+
+    @property
+    def is_open(self) -> bool:
+        """Return True while requests are being stopped."""
+        return self._opened_at is not None
+
+    @callback
+    def async_before_request(self) -> None:
+        """Raise CircuitOpenError unless a request may be sent."""
+        if self._opened_at is None:
+            return
+        remaining = self._opened_at + self._cooldown - self.hass.loop.time()
+        if remaining > 0 or self._probing:
+            raise CircuitOpenError(
+                f"NWS API unavailable, next attempt in {max(remaining, 0):.0f} s"
+            )
+        _LOGGER.debug("Probing the NWS API")
+        self._probing = True
+
+    @callback
+    def async_record_success(self) -> None:
+        """Record a request that got an answer."""
+        if self._opened_at is not None:
+            _LOGGER.info("NWS API is available again")
+        self.failures = 0
+        self._opened_at = None
+        self._probing = False
+
+    @callback
+    def async_record_failure(self) -> None:
+        """Record a failed request, open the circuit past the threshold."""
+        self.failures += 1
+        self._probing = False
+        if self._opened_at is None and self.failures < self._threshold:
+            return
+        if self._opened_at is None:
+            _LOGGER.warning(
+                "NWS API failed %s times in a row, pausing requests for %.0f seconds",
+                self.failures,
+                self._cooldown,
+            )
+        self._opened_at = self.hass.loop.time()
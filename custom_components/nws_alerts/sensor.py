@@ -1,18 +1,19 @@
 """nws_alert sensors."""
 
+from datetime import datetime, timedelta
 import logging
-from typing import Final
+from typing import Any, Final
 
 from homeassistant.components.sensor import SensorDeviceClass, SensorEntityDescription
 from homeassistant.config_entries import ConfigEntry
-from homeassistant.const import ATTR_ATTRIBUTION, CONF_NAME
-from homeassistant.core import HomeAssistant
-from homeassistant.helpers.device_registry import DeviceEntryType
-from homeassistant.helpers.entity import DeviceInfo
-from homeassistant.helpers.update_coordinator import CoordinatorEntity
-from homeassistant.util import slugify
+from homeassistant.const import UnitOfTime
+from homeassistant.core import HomeAssistant, callback
+from homeassistant.helpers.event import async_track_time_interval
+from homeassistant.util import dt as dt_util
 
-from .const import ATTRIBUTION, CONF_GPS_LOC, CONF_TRACKER, CONF_ZONE_ID, COORDINATOR, DOMAIN
+from .alert import AlertRecord
+from .const import COORDINATOR, DOMAIN, SEVERITY_ORDER
+from .entity import NWSAlertEntity
 
 SENSOR_TYPES: Final[dict[str, SensorEntityDescription]] = {
     "state": SensorEntityDescription(key="state", name="Alerts", icon="mdi:alert"),
@@ -22,6 +23,18 @@ SENSOR_TYPES: Final[dict[str, SensorEntityDescription]] = {
         icon="mdi:update",
         device_class=SensorDeviceClass.TIMESTAMP,
     ),
+    "data_age": SensorEntityDescription(
+        name="Data Age",
+        key="data_age",
+        icon="mdi:clock-alert-outline",
+        device_class=SensorDeviceClass.DURATION,
+        native_unit_of_measurement=UnitOfTime.MINUTES,
+    ),
+    "highest_severity": SensorEntityDescription(
+        name="Highest Severity",
+        key="highest_severity",
+        icon="mdi:alert-octagon",
+    ),
 }
 
 # ---------------------------------------------------------
@@ -36,11 +49,15 @@ _LOGGER = logging.getLogger(__name__)
 
 async def async_setup_entry(hass, entry, async_add_entities):
     """Sensor platform setup."""
-    sensors = [NWSAlertSensor(hass, entry, sensor) for sensor in SENSOR_TYPES.values()]
-    async_add_entities(sensors, True)
+    sensors: list[NWSAlertEntity] = [
+        NWSAlertSensor(hass, entry, sensor) for sensor in SENSOR_TYPES.values()
+    ]
+    coordinator = hass.data[DOMAIN][entry.entry_id][COORDINATOR]
+    sensors.extend(NWSAlertSlotSensor(hass, entry, slot) for slot in range(coordinator.alert_slots))
+    async_add_entities(sensors)
 
 
-class NWSAlertSensor(CoordinatorEntity):
+class NWSAlertSensor(NWSAlertEntity):
     """Representation of a Sensor."""
 
     def __init__(
@@ -50,18 +67,44 @@ class NWSAlertSensor(CoordinatorEntity):
         sensor_description: SensorEntityDescription,
     ) -> None:
         """Initialize the sensor."""
-        super().__init__(hass.data[DOMAIN][entry.entry_id][COORDINATOR])
-        self._config = entry
-        self._key = sensor_description.key
+        super().__init__(hass, entry, sensor_description)
+        self._attr_unit_of_measurement = sensor_description.native_unit_of_measurement
+
+    def _index_slice(self) -> Any:
+        """Return the severity counts the highest severity sensor shows."""
+        if self._key != "highest_severity":
+            return None
+        return tuple(self._severity_counts().items())
+
+    def _severity_counts(self) -> dict[str, int]:
+        """Return the number of active alerts per severity, most severe first."""
+        by_severity = self.coordinator.index["Severity"]
+        return {severity: len(by_severity.get(severity, ())) for severity in SEVERITY_ORDER}
+
+    async def async_added_to_hass(self) -> None:
+        """Keep the data age current between updates."""
+        await super().async_added_to_hass()
+        if self._key == "data_age":
+            self.async_on_remove(
+                async_track_time_interval(self.hass, self._async_write_age, timedelta(minutes=1))
+            )
 
-        self._attr_icon = sensor_description.icon
-        self._attr_name = f"{entry.data[CONF_NAME]} {sensor_description.name}"
-        self._attr_device_class = sensor_description.device_class
-        self._attr_unique_id = f"{slugify(self._attr_name)}_{entry.entry_id}"
+    @callback
+    def _async_write_age(self, now: datetime) -> None:
+        """Write the data age."""
+        self.async_write_ha_state()
 
     @property
-    def state(self) -> int | None:
+    def state(self) -> int | str | None:
         """Return the state of the sensor."""
+        if self._key == "highest_severity":
+            counts = self._severity_counts()
+            return next((severity for severity, count in counts.items() if count), "None")
+        if self._key == "data_age":
+            # Minutes since the alerts were last confirmed by the NWS
+            if self.coordinator.last_checked is None:
+                return None
+            return int((datetime.now() - self.coordinator.last_checked).total_seconds() // 60)
         if self.coordinator.data is None:
             return None
         if self._key in self.coordinator.data:
@@ -71,65 +114,65 @@ class NWSAlertSensor(CoordinatorEntity):
     @property
     def extra_state_attributes(self):
         """Return the state message."""
-        attrs = {}
+        attrs: dict[str, Any] = {}
         if self.coordinator.data is None:
             return attrs
         if "alerts" in self.coordinator.data and self._key == "state":
-            attrs["Alerts"] = self.coordinator.data["alerts"]
-
-        # Add configuration information for diagnostics
-        config_data = self._config.data
-
-        if CONF_ZONE_ID in config_data:
-            attrs["configuration_type"] = "Zone ID"
-            attrs["zone_id"] = config_data[CONF_ZONE_ID]
-        elif CONF_GPS_LOC in config_data:
-            attrs["configuration_type"] = "GPS Location"
-            attrs["gps_location"] = config_data[CONF_GPS_LOC]
-        elif CONF_TRACKER in config_data:
-            attrs["configuration_type"] = "Device Tracker"
-            attrs["tracker_entity"] = config_data[CONF_TRACKER]
-
-        attrs[ATTR_ATTRIBUTION] = ATTRIBUTION
+            attrs["Alerts"] = self.coordinator.alert_attributes
+            # Alerts past their onset, the coordinator updates us when one begins
+            now = dt_util.now()
+            attrs["in_effect"] = sum(
+                1
+                for alert in self.coordinator.data["alerts"]
+                if (onset := alert.time("Onset")) is None or onset <= now
+            )
+        if self._key == "highest_severity":
+            attrs.update(self._severity_counts())
+        if self.coordinator.data.get("stale"):
+            attrs["stale"] = True
+
+        attrs.update(self._config_attributes())
         return attrs
 
-    @property
-    def device_info(self) -> DeviceInfo:
-        """Return device registry information."""
-        config_data = self._config.data
-
-        # Create a more descriptive device name based on configuration
-        if CONF_ZONE_ID in config_data:
-            zone_id = config_data[CONF_ZONE_ID]
-            device_name = (
-                f"NWS Alerts (Zone: {zone_id[:20]}...)"
-                if len(zone_id) > 20
-                else f"NWS Alerts (Zone: {zone_id})"
-            )
-        elif CONF_GPS_LOC in config_data:
-            # Truncate GPS to 4 decimal places for readability (~11 meter precision)
-            gps = config_data[CONF_GPS_LOC]
-            try:
-                parts = gps.replace(" ", "").split(",")
-                lat = f"{float(parts[0]):.4f}"
-                lon = f"{float(parts[1]):.4f}"
-                device_name = f"NWS Alerts (GPS: {lat},{lon})"
-            except (ValueError, IndexError):
-                # Fallback if parsing fails
-                device_name = (
-                    f"NWS Alerts (GPS: {gps[:25]}...)"
-                    if len(gps) > 25
-                    else f"NWS Alerts (GPS: {gps})"
-                )
-        elif CONF_TRACKER in config_data:
-            tracker_name = config_data[CONF_TRACKER].split(".")[-1]  # Get entity name part
-            device_name = f"NWS Alerts (Tracker: {tracker_name})"
-        else:
-            device_name = "NWS Alerts"
-
-        return DeviceInfo(
-            entry_type=DeviceEntryType.SERVICE,
-            identifiers={(DOMAIN, self._config.entry_id)},
-            manufacturer="NWS",
-            name=device_name,
+
+class NWSAlertSlotSensor(NWSAlertEntity):
+    """Sensor showing one active alert, from the entry's pool of alert slots.
+
+    The state is the alert's event and the attributes its fields. The
+    sensor is only written when the alert in its slot changes.
+    """
+
+    def __init__(self, hass: HomeAssistant, entry: ConfigEntry, slot: int) -> None:
+        """Initialize the sensor."""
+        super().__init__(
+            hass,
+            entry,
+            SensorEntityDescription(
+                key=f"alert_{slot + 1}", name=f"Alert {slot + 1}", icon="mdi:alert-circle-outline"
+            ),
         )
+        self._slot = slot
+
+    def _alert(self) -> AlertRecord | None:
+        """Return the alert in this sensor's slot."""
+        return self.coordinator.slots[self._slot]
+
+    def _index_slice(self) -> Any:
+        """Return the alert in the slot."""
+        return (self._alert(),)
+
+    @property
+    def state(self) -> str:
+        """Return the event of the alert, or None for an empty slot."""
+        alert = self._alert()
+        return alert["Event"] if alert is not None else "None"
+
+    @property
+    def extra_state_attributes(self) -> dict[str, Any]:
+        """Return the alert and the configuration."""
+        alert = self._alert()
+        attrs: dict[str, Any] = {}
+        if alert is not None:
+            attrs.update(alert.as_dict(self.coordinator.slim_attributes))
+        attrs.update(self._config_attributes())
+        return attrs
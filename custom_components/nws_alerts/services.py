@@ -0,0 +1,42 @@
+"""Services for nws_alerts."""
+
+import aiohttp
+import voluptuous as vol
+
+from homeassistant.core import HomeAssistant, ServiceCall, ServiceResponse, SupportsResponse
+from homeassistant.exceptions import HomeAssistantError, ServiceValidationError
+from homeassistant.helpers import config_validation as cv
+from homeassistant.helpers.update_coordinator import UpdateFailed
+
+from .const import ATTR_ALERT_ID, ATTR_URL, DOMAIN, HUB, SERVICE_GET_ALERT_DETAILS
+
+GET_ALERT_DETAILS_SCHEMA = vol.All(
+    vol.Schema({vol.Optional(ATTR_ALERT_ID): cv.string, vol.Optional(ATTR_URL): cv.url}),
+    cv.has_at_least_one_key(ATTR_ALERT_ID, ATTR_URL),
+)
+
+
+def async_setup_services(hass: HomeAssistant) -> None:
+    """Register the integration services."""
+
+    async def async_get_alert_details(call: ServiceCall) -> ServiceResponse:
+        """Return an alert including its description and instruction."""
+        if (hub := hass.data.get(DOMAIN, {}).get(HUB)) is None:
+            raise ServiceValidationError("No NWS Alerts entry is loaded")
+        try:
+            details = await hub.async_get_alert_details(
+                call.data.get(ATTR_ALERT_ID), call.data.get(ATTR_URL)
+            )
+        except LookupError as error:
+            raise ServiceValidationError(str(error)) from error
+        except (UpdateFailed, aiohttp.ClientError, TimeoutError, KeyError, TypeError) as error:
+            raise HomeAssistantError(f"Could not fetch the alert: {error}") from error
+        return details
+
+    hass.services.async_register(
+        DOMAIN,
+        SERVICE_GET_ALERT_DETAILS,
+        async_get_alert_details,
+        schema=GET_ALERT_DETAILS_SCHEMA,
+        supports_response=SupportsResponse.ONLY,
+    )
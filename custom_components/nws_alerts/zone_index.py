@@ -0,0 +1,243 @@
+"""Offline point to zone lookup for nws_alerts.
+
+The index is a single binary file that is memory-mapped, not parsed, so it
+costs next to nothing to load. It holds simplified forecast zone and county
+outlines bucketed into a regular lat/lon grid::
+
+    header      magic, version, grid origin/size and table lengths
+    zones       8 byte ASCII zone codes
+    polygons    zone, first ring, ring count and bounding box
+    rings       first vertex and vertex count
+    cells       offsets into the cell list, one per grid cell plus one
+    cell list   polygon numbers overlapping each grid cell
+    vertices    float32 lat, lon pairs
+
+Build it with ``scripts/build_zone_index.py`` from the NWS zone and county
+shapefiles (converted to GeoJSON). It is kept in the Home Assistant
+``.storage`` directory, an update of the integration replaces the
+integration's own directory.
+"""
+
+from __future__ import annotations
+
+from collections.abc import Iterable
+import logging
+import math
+import mmap
+from pathlib import Path
+import struct
+
+from homeassistant.core import HomeAssistant
+from homeassistant.helpers.singleton import singleton
+from homeassistant.helpers.storage import STORAGE_DIR
+
+_LOGGER = logging.getLogger(__name__)
+
+ZONE_INDEX_FILE = "nws_alerts.zone_index.bin"
+DATA_ZONE_INDEX = "nws_alerts_zone_index"
+
+MAGIC = b"NWSZ"
+VERSION = 1
+HEADER = struct.Struct("<4sHHfffIIIIII")
+POLYGON = struct.Struct("<IIIffff")
+RING = struct.Struct("<II")
+ZONE_CODE_SIZE = 8
+
+# A ring is a list of [lon, lat] pairs, as in GeoJSON
+type Ring = list[list[float]]
+
+
+class ZoneIndex:
+    """Memory-mapped grid index of zone outlines."""
+
+    def __init__(self, buffer: bytes | mmap.mmap) -> None:
+        """Initialize from the raw index bytes."""
+        (
+            magic,
+            version,
+            _,
+            self._cell_size,
+            self._lat0,
+            self._lon0,
+            self._rows,
+            self._cols,
+            n_zones,
+            n_polygons,
+            n_rings,
+            n_cell_entries,
+        ) = HEADER.unpack_from(buffer, 0)
+        if magic != MAGIC or version != VERSION:
+            raise ValueError("Not a zone index file")
+
+        self._buffer = buffer
+        view = memoryview(buffer)
+        offset = HEADER.size
+        self._zones = [
+            bytes(view[offset + i * ZONE_CODE_SIZE : offset + (i + 1) * ZONE_CODE_SIZE])
+            .rstrip(b"\0")
+            .decode("ascii")
+            for i in range(n_zones)
+        ]
+        offset += n_zones * ZONE_CODE_SIZE
+        self._polygons_offset = offset
+        offset += n_polygons * POLYGON.size
+        self._rings_offset = offset
+        offset += n_rings * RING.size
+        n_cells = self._rows * self._cols + 1
+        self._cells = view[offset : offset + n_cells * 4].cast("I")
+        offset += n_cells * 4
+        self._cell_entries = view[offset : offset + n_cell_entries * 4].cast("I")
+        offset += n_cell_entries * 4
+        self._vertices = view[offset:].cast("f")
+
+    @classmethod
+    def load(cls, path: Path) -> ZoneIndex | None:
+        """Memory-map an index file, return None if there is none."""
+        try:
+            with path.open("rb") as file:
+                return cls(mmap.mmap(file.fileno(), 0, access=mmap.ACCESS_READ))
+        except (OSError, ValueError, struct.error) as error:
+            _LOGGER.debug("No offline zone index available: %s", error)
+            return None
+
+    def lookup(self, lat: float, lon: float) -> list[str]:
+        """Return the zone codes whose outline contains the point."""
+        row = math.floor((lat - self._lat0) / self._cell_size)
+        col = math.floor((lon - self._lon0) / self._cell_size)
+        if not (0 <= row < self._rows and 0 <= col < self._cols):
+            return []
+
+        cell = row * self._cols + col
+        zones: list[str] = []
+        for entry in range(self._cells[cell], self._cells[cell + 1]):
+            polygon = self._cell_entries[entry]
+            zone, first_ring, n_rings, min_lat, min_lon, max_lat, max_lon = POLYGON.unpack_from(
+                self._buffer, self._polygons_offset + polygon * POLYGON.size
+            )
+            if not (min_lat <= lat <= max_lat and min_lon <= lon <= max_lon):
+                continue
+            if self._point_in_polygon(first_ring, n_rings, lat, lon):
+                code = self._zones[zone]
+                if code not in zones:
+                    zones.append(code)
+        return zones
+
+    def _point_in_polygon(self, first_ring: int, n_rings: int, lat: float, lon: float) -> bool:
+        """Even-odd ray casting over all rings of a polygon, so holes are excluded."""
+        vertices = self._vertices
+        inside = False
+        for ring in range(first_ring, first_ring + n_rings):
+            first, count = RING.unpack_from(self._buffer, self._rings_offset + ring * RING.size)
+            j = first + count - 1
+            for i in range(first, first + count):
+                lat_i, lon_i = vertices[2 * i], vertices[2 * i + 1]
+                lat_j, lon_j = vertices[2 * j], vertices[2 * j + 1]
+                if (lat_i > lat) != (lat_j > lat) and lon < (lon_j - lon_i) * (lat - lat_i) / (
+                    lat_j - lat_i
+                ) + lon_i:
+                    inside = not inside
+                j = i
+        return inside
+
+
+def zone_index_path(config_dir: str | Path) -> Path:
+    """Return where the zone index is kept in a Home Assistant configuration directory."""
+    return Path(config_dir, STORAGE_DIR, ZONE_INDEX_FILE)
+
+
+@singleton(DATA_ZONE_INDEX)
+async def async_get_zone_index(hass: HomeAssistant) -> ZoneIndex | None:
+    """Return the zone index of the configuration directory, loaded once."""
+    return await hass.async_add_executor_job(
+        ZoneIndex.load, zone_index_path(hass.config.config_dir)
+    )
+
+
+def simplify_ring(ring: Ring, tolerance: float) -> Ring:
+    """Drop vertices closer than tolerance degrees to the last kept one."""
+    if len(ring) <= 4:
+        return ring
+    kept = [ring[0]]
+    for point in ring[1:-1]:
+        if math.dist(point, kept[-1]) >= tolerance:
+            kept.append(point)
+    kept.append(ring[-1])
+    return kept if len(kept) >= 4 else ring
+
+
+def build_zone_index(
+    zones: Iterable[tuple[str, list[list[Ring]]]],
+    cell_size: float = 0.5,
+    tolerance: float = 0.001,
+) -> bytes:
+    """Build an index from (zone code, polygons) pairs.
+
+    Each polygon is a list of rings, the first being the outline and any
+    others holes, exactly like GeoJSON (Multi)Polygon coordinates.
+    """
+    codes: list[str] = []
+    polygons: list[tuple[int, int, int, float, float, float, float]] = []
+    rings: list[tuple[int, int]] = []
+    vertices: list[float] = []
+
+    for code, shapes in zones:
+        codes.append(code)
+        for shape in shapes:
+            first_ring = len(rings)
+            lats: list[float] = []
+            lons: list[float] = []
+            for ring in shape:
+                ring = simplify_ring(ring, tolerance)
+                rings.append((len(vertices) // 2, len(ring)))
+                for lon, lat, *_ in ring:
+                    vertices.extend((lat, lon))
+                    lats.append(lat)
+                    lons.append(lon)
+            polygons.append(
+                (len(codes) - 1, first_ring, len(shape), min(lats), min(lons), max(lats), max(lons))
+            )
+
+    lat0 = math.floor(min(p[3] for p in polygons))
+    lon0 = math.floor(min(p[4] for p in polygons))
+    rows = math.floor((max(p[5] for p in polygons) - lat0) / cell_size) + 1
+    cols = math.floor((max(p[6] for p in polygons) - lon0) / cell_size) + 1
+
+    buckets: list[list[int]] = [[] for _ in range(rows * cols)]
+    for number, (_, _, _, min_lat, min_lon, max_lat, max_lon) in enumerate(polygons):
+        for row in range(
+            math.floor((min_lat - lat0) / cell_size), math.floor((max_lat - lat0) / cell_size) + 1
+        ):
+            for col in range(
+                math.floor((min_lon - lon0) / cell_size),
+                math.floor((max_lon - lon0) / cell_size) + 1,
+            ):
+                buckets[row * cols + col].append(number)
+
+    cells = [0]
+    for bucket in buckets:
+        cells.append(cells[-1] + len(bucket))
+
+    return b"".join(
+        [
+            HEADER.pack(
+                MAGIC,
+                VERSION,
+                0,
+                cell_size,
+                lat0,
+                lon0,
+                rows,
+                cols,
+                len(codes),
+                len(polygons),
+                len(rings),
+                cells[-1],
+            ),
+            *(code.encode("ascii").ljust(ZONE_CODE_SIZE, b"\0") for code in codes),
+            *(POLYGON.pack(*polygon) for polygon in polygons),
+            *(RING.pack(*ring) for ring in rings),
+            struct.pack(f"<{len(cells)}I", *cells),
+            struct.pack(f"<{cells[-1]}I", *(n for bucket in buckets for n in bucket)),
+            struct.pack(f"<{len(vertices)}f", *vertices),
+        ]
+    )
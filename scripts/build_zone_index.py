@@ -0,0 +1,74 @@
+# ruff: noqa: INP001
+"""Build the offline zone index of nws_alerts.
+
+Download the public forecast zone and county shapefiles from
+https://www.weather.gov/gis/PublicZones and https://www.weather.gov/gis/Counties,
+convert them to GeoJSON (for example ``ogr2ogr -f GeoJSON z.geojson z_*.shp``)
+and run, with the path of your Home Assistant configuration directory::
+
+    python scripts/build_zone_index.py --config /config z.geojson c.geojson
+
+The index is written to the ``.storage`` directory in there, where
+integration updates leave it alone. Restart Home Assistant to load it.
+Features from the NWS API ``/zones`` endpoint (with geometry) work as well.
+"""
+
+import argparse
+from collections.abc import Iterator
+import json
+from pathlib import Path
+import sys
+
+sys.path.insert(0, str(Path(__file__).resolve().parents[1]))
+
+from custom_components.nws_alerts.zone_index import build_zone_index, zone_index_path
+
+
+def zone_code(properties: dict) -> str | None:
+    """Return the UGC code of a zone or county feature."""
+    if "id" in properties:
+        return properties["id"]
+    if "ZONE" in properties:
+        return f"{properties['STATE']}Z{properties['ZONE']}"
+    if "FIPS" in properties:
+        return f"{properties['STATE']}C{properties['FIPS'][-3:]}"
+    return None
+
+
+def read_zones(paths: list[Path]) -> Iterator[tuple[str, list]]:
+    """Yield (zone code, polygons) for every feature in the GeoJSON files."""
+    for path in paths:
+        data = json.loads(path.read_text(encoding="utf8"))
+        for feature in data["features"]:
+            geometry = feature.get("geometry")
+            code = zone_code(feature.get("properties") or {})
+            if not geometry or not code:
+                continue
+            if geometry["type"] == "Polygon":
+                yield code, [geometry["coordinates"]]
+            elif geometry["type"] == "MultiPolygon":
+                yield code, geometry["coordinates"]
+
+
+def main() -> None:
+    """Run the builder."""
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("geojson", nargs="+", type=Path)
+    parser.add_argument(
+        "-c", "--config", type=Path, default=Path("/config"), help="Home Assistant config directory"
+    )
+    parser.add_argument("-o", "--output", type=Path, help="write the index here instead")
+    parser.add_argument("--cell-size", type=float, default=0.5, help="grid cell size in degrees")
+    parser.add_argument(
+        "--tolerance", type=float, default=0.001, help="outline simplification in degrees"
+    )
+    args = parser.parse_args()
+
+    index = build_zone_index(read_zones(args.geojson), args.cell_size, args.tolerance)
+    output = args.output or zone_index_path(args.config)
+    output.write_bytes(index)
+    print(f"Wrote {len(index)} bytes to {output}")  # noqa: T201
+
+
+if __name__ == "__main__":
+    main()
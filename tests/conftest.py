@@ -10,6 +10,8 @@ pytest_plugins = "pytest_homeassistant_custom_component"
 
 API_URL = "https://api.weather.gov"
 COUNT_URL = "https://api.weather.gov/alerts/active/count"
+ALERTS_URL = "https://api.weather.gov/alerts/active"
+ZONES_URL = "https://api.weather.gov/zones?point=123.0000,-456.0000"
 ZONE_URL = "https://api.weather.gov/alerts/active?zone=AZZ540,AZC013"
 POINT_URL = "https://api.weather.gov/alerts/active?point=123,-456"
 
@@ -53,7 +55,8 @@ def aioclient_mock():
 @pytest.fixture
 def mock_aioclient():
     """Fixture to mock aioclient calls."""
-    with aioresponses() as m:
+    # Let the test client reach the local Home Assistant API
+    with aioresponses(passthrough=["http://127.0.0.1"]) as m:
         yield m
 
 
@@ -88,6 +91,18 @@ def mock_api(mock_aioclient):
         body=load_fixture("api.json"),
         repeat=True,
     )
+    mock_aioclient.get(
+        ALERTS_URL,
+        status=200,
+        body=load_fixture("api.json"),
+        repeat=True,
+    )
+    mock_aioclient.get(
+        ZONES_URL,
+        status=200,
+        body=load_fixture("zones.json"),
+        repeat=True,
+    )
     mock_aioclient.get(
         COUNT_URL,
         status=200,
@@ -3,4 +3,7 @@
 CONFIG_DATA = {"name": "NWS Alerts", "zone_id": "AZZ540,AZC013"}
 CONFIG_DATA_2 = {"name": "NWS Alerts YAML", "zone_id": "AZZ540"}
 CONFIG_DATA_3 = {"name": "NWS Alerts", "gps_loc": "123,-456"}
+CONFIG_DATA_TRACKER = {"name": "NWS Alerts", "tracker": "device_tracker.car"}
 CONFIG_DATA_BAD = {"name": "NWS Alerts"}
+CONFIG_DATA_SHARED = {"name": "NWS Alerts Shared", "zone_id": "AZC013", "shared_feed": True}
+CONFIG_DATA_SHARED_2 = {"name": "NWS Alerts Shared GPS", "gps_loc": "123,-456", "shared_feed": True}
@@ -0,0 +1,66 @@
+"""Test NWS Alerts binary sensors."""
+
+from datetime import timedelta
+import json
+
+from pytest_homeassistant_custom_component.common import MockConfigEntry
+
+from custom_components.nws_alerts.const import COORDINATOR, DOMAIN
+from tests.conftest import ZONE_URL, load_fixture
+from tests.const import CONFIG_DATA
+
+
+async def test_binary_sensors(hass, mock_aioclient, freezer):
+    """Test the binary sensors follow their slice of the alerts."""
+    mock_aioclient.get(ZONE_URL, status=200, body=load_fixture("api.json"))
+
+    entry = MockConfigEntry(domain=DOMAIN, title="NWS Alerts", data=CONFIG_DATA)
+    entry.add_to_hass(hass)
+    assert await hass.config_entries.async_setup(entry.entry_id)
+    await hass.async_block_till_done()
+
+    assert hass.states.get("binary_sensor.nws_alerts_alerts_active").state == "on"
+    assert hass.states.get("binary_sensor.nws_alerts_tornado_warning").state == "off"
+
+    # The Air Quality Alert becomes a Tornado Warning
+    data = json.loads(load_fixture("api.json"))
+    data["features"][1]["properties"]["eventCode"]["NationalWeatherService"] = ["TOR"]
+    data["features"][1]["properties"]["sent"] = "2024-07-18T14:00:00-07:00"
+    mock_aioclient.get(ZONE_URL, status=200, body=json.dumps(data))
+    freezer.tick(timedelta(minutes=1))
+    coordinator = hass.data[DOMAIN][entry.entry_id][COORDINATOR]
+    await coordinator.async_refresh()
+    await hass.async_block_till_done()
+
+    state = hass.states.get("binary_sensor.nws_alerts_tornado_warning")
+    assert state.state == "on"
+    assert state.attributes["headlines"] == [
+        "OZONE HIGH POLLUTION ADVISORY FOR MARICOPA COUNTY INCLUDING THE PHOENIX METRO AREA THROUGH FRIDAY"
+    ]
+
+    # Only the entities whose slice changed write their state
+    data["features"][0]["properties"]["sent"] = "2024-07-18T15:00:00-07:00"
+    mock_aioclient.get(ZONE_URL, status=200, body=json.dumps(data))
+    freezer.tick(timedelta(minutes=1))
+    before = {state.entity_id: state.last_reported for state in hass.states.async_all()}
+    await coordinator.async_refresh()
+    await hass.async_block_till_done()
+    written = {
+        state.entity_id
+        for state in hass.states.async_all()
+        if state.last_reported != before[state.entity_id]
+    }
+    assert "sensor.nws_alerts_alerts" in written
+    assert "binary_sensor.nws_alerts_tornado_warning" not in written
+    assert "sensor.nws_alerts_highest_severity" not in written
+
+    # A reissue of the Tornado Warning keeps its ID but updates the headline
+    data["features"][1]["properties"]["sent"] = "2024-07-18T16:00:00-07:00"
+    data["features"][1]["properties"]["parameters"]["NWSheadline"] = ["TORNADO WARNING UPDATED"]
+    mock_aioclient.get(ZONE_URL, status=200, body=json.dumps(data))
+    freezer.tick(timedelta(minutes=1))
+    await coordinator.async_refresh()
+    await hass.async_block_till_done()
+
+    state = hass.states.get("binary_sensor.nws_alerts_tornado_warning")
+    assert state.attributes["headlines"] == ["TORNADO WARNING UPDATED"]
@@ -6,7 +6,7 @@ import pytest
 
 from custom_components.nws_alerts.const import DOMAIN
 from homeassistant import config_entries, setup
-from homeassistant.data_entry_flow import FlowResultType
+from homeassistant.data_entry_flow import FlowResultType, InvalidData
 
 pytestmark = pytest.mark.asyncio
 
@@ -28,6 +28,13 @@ pytestmark = pytest.mark.asyncio
                 "zone_id": "AZZ540,AZC013",
                 "interval": 5,
                 "timeout": 120,
+                "shared_feed": False,
+                "heartbeat": 60,
+                "adaptive_interval": False,
+                "count_precheck": False,
+                "alert_slots": 0,
+                "slim_attributes": False,
+                "decode_threshold": 256,
             },
         ),
     ],
@@ -89,6 +96,13 @@ async def test_form_zone(
                 "gps_loc": "123,-456",
                 "interval": 5,
                 "timeout": 120,
+                "shared_feed": False,
+                "heartbeat": 60,
+                "adaptive_interval": False,
+                "count_precheck": False,
+                "alert_slots": 0,
+                "slim_attributes": False,
+                "decode_threshold": 256,
             },
         ),
     ],
@@ -163,3 +177,21 @@ async def test_form_gps(
 #         await hass.async_block_till_done()
 
 #     assert result["type"] == "create_entry"
+
+
+@pytest.mark.parametrize(
+    "option", [{"alert_slots": -1}, {"heartbeat": 0}, {"decode_threshold": 0}, {"interval": 0}]
+)
+async def test_form_zone_out_of_range(option, hass):
+    """Test numeric options out of range are rejected."""
+    with patch("custom_components.nws_alerts.config_flow._get_zone_list", return_value=None):
+        result = await hass.config_entries.flow.async_init(
+            DOMAIN, context={"source": config_entries.SOURCE_USER}
+        )
+        result = await hass.config_entries.flow.async_configure(
+            result["flow_id"], {"next_step_id": "zone"}
+        )
+        with pytest.raises(InvalidData):
+            await hass.config_entries.flow.async_configure(
+                result["flow_id"], {"name": "Testing Alerts", "zone_id": "AZZ540", **option}
+            )
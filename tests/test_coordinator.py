@@ -0,0 +1,343 @@
+"""Tests for the data coordinator."""
+
+from datetime import datetime, timedelta
+import json
+import re
+from unittest.mock import Mock, patch
+
+from pytest_homeassistant_custom_component.common import (
+    MockConfigEntry,
+    async_capture_events,
+    async_fire_time_changed,
+)
+from yarl import URL
+
+from custom_components.nws_alerts.alert import AlertRecord, alert_id, normalize_alert
+from custom_components.nws_alerts.const import (
+    COORDINATOR,
+    DOMAIN,
+    EVENT_ALERT_ADDED,
+    EVENT_ALERT_REMOVED,
+    EVENT_ALERT_UPDATED,
+)
+from tests.conftest import COUNT_URL, ZONE_URL, load_fixture
+from tests.const import CONFIG_DATA, CONFIG_DATA_TRACKER
+
+
+async def test_conditional_get(hass, mock_aioclient, freezer):
+    """Test a 304 reply reuses the previously parsed alerts."""
+    mock_aioclient.get(
+        ZONE_URL,
+        status=200,
+        body=load_fixture("api.json"),
+        headers={"ETag": '"abc123"', "Last-Modified": "Thu, 18 Jul 2024 20:00:00 GMT"},
+    )
+    mock_aioclient.get(ZONE_URL, status=304, repeat=True)
+
+    entry = MockConfigEntry(domain=DOMAIN, title="NWS Alerts", data=CONFIG_DATA)
+    entry.add_to_hass(hass)
+    assert await hass.config_entries.async_setup(entry.entry_id)
+    await hass.async_block_till_done()
+
+    coordinator = hass.data[DOMAIN][entry.entry_id][COORDINATOR]
+    alerts = coordinator.data["alerts"]
+    freezer.tick(timedelta(minutes=1))
+    await coordinator.async_refresh()
+
+    assert coordinator.last_update_success
+    assert coordinator.data["state"] == 2
+    assert coordinator.data["alerts"] is alerts
+
+    requests = mock_aioclient.requests[("GET", URL(ZONE_URL))]
+    assert "If-None-Match" not in requests[0].kwargs["headers"]
+    assert requests[1].kwargs["headers"]["If-None-Match"] == '"abc123"'
+    assert requests[1].kwargs["headers"]["If-Modified-Since"] == "Thu, 18 Jul 2024 20:00:00 GMT"
+
+
+async def test_incremental_parse(hass, mock_api, freezer):
+    """Test only new or updated alerts are parsed again."""
+    entry = MockConfigEntry(domain=DOMAIN, title="NWS Alerts", data=CONFIG_DATA)
+    entry.add_to_hass(hass)
+    assert await hass.config_entries.async_setup(entry.entry_id)
+    await hass.async_block_till_done()
+
+    coordinator = hass.data[DOMAIN][entry.entry_id][COORDINATOR]
+    alerts = coordinator.data["alerts"]
+
+    with patch(
+        "custom_components.nws_alerts.coordinator.normalize_alert", wraps=normalize_alert
+    ) as normalize:
+        await coordinator.async_refresh()
+        assert normalize.call_count == 0
+        assert coordinator.data["alerts"] is alerts
+
+        # Update the first alert and drop the second one
+        data = json.loads(load_fixture("api.json"))
+        data["features"][0]["properties"]["sent"] = "2024-07-18T14:00:00-07:00"
+        del data["features"][1]
+        mock_api.clear()
+        mock_api.get(ZONE_URL, status=200, body=json.dumps(data), repeat=True)
+
+        freezer.tick(timedelta(minutes=1))
+        await coordinator.async_refresh()
+        assert normalize.call_count == 1
+        assert coordinator.data["state"] == 1
+        assert coordinator.data["alerts"][0]["Sent"] == "2024-07-18T14:00:00-07:00"
+        assert alerts[1]["Event"] == "Air Quality Alert"
+
+
+async def test_alert_records(hass, mock_api, hass_storage, freezer):
+    """Test alerts are compact records serialized once per alert set."""
+    entry = MockConfigEntry(domain=DOMAIN, title="NWS Alerts", data=CONFIG_DATA)
+    entry.add_to_hass(hass)
+    assert await hass.config_entries.async_setup(entry.entry_id)
+    await hass.async_block_till_done()
+
+    coordinator = hass.data[DOMAIN][entry.entry_id][COORDINATOR]
+    first, second = coordinator.data["alerts"]
+    assert not hasattr(first, "__dict__")
+    assert first["Status"] is second["Status"]
+    assert first.get("Missing") is None
+
+    # Timestamps are parsed once and exposed as ISO and Unix time
+    assert first.time("Sent") == datetime.fromisoformat(first["Sent"])
+    assert first.as_dict()["SentEpoch"] == int(first.time("Sent").timestamp())
+    assert alert_id(first["URL"]) == first["ID"]
+    assert alert_id.cache_info().hits
+
+    attributes = coordinator.alert_attributes
+    assert attributes == [first.as_dict(), second.as_dict()]
+    assert coordinator.alert_attributes is attributes
+
+    # Persisted as plain dicts and restored as records
+    freezer.tick(timedelta(seconds=11))
+    async_fire_time_changed(hass)
+    await hass.async_block_till_done()
+    assert hass_storage[f"{DOMAIN}.{entry.entry_id}"]["data"]["data"]["alerts"] == attributes
+    assert AlertRecord.from_dict(attributes[0]) == first
+
+
+async def test_unchanged_polls_save_check_time(hass, mock_api, hass_storage, freezer):
+    """Test the saved check time keeps up while the alerts don't change."""
+    entry = MockConfigEntry(domain=DOMAIN, title="NWS Alerts", data=CONFIG_DATA)
+    entry.add_to_hass(hass)
+    assert await hass.config_entries.async_setup(entry.entry_id)
+    await hass.async_block_till_done()
+
+    coordinator = hass.data[DOMAIN][entry.entry_id][COORDINATOR]
+    data = coordinator.data
+    first_checked = coordinator.last_checked
+    for _ in range(6):
+        freezer.tick(timedelta(minutes=1))
+        await coordinator.async_refresh()
+    assert coordinator.data is data
+
+    freezer.tick(timedelta(seconds=11))
+    async_fire_time_changed(hass)
+    await hass.async_block_till_done()
+    checked = datetime.fromisoformat(hass_storage[f"{DOMAIN}.{entry.entry_id}"]["data"]["checked"])
+    assert checked > first_checked
+    assert coordinator.last_checked - checked < timedelta(minutes=5)
+
+
+async def test_unchanged_poll_skips_state_write(hass, mock_api):
+    """Test an unchanged alert set does not notify listeners."""
+    entry = MockConfigEntry(domain=DOMAIN, title="NWS Alerts", data=CONFIG_DATA)
+    entry.add_to_hass(hass)
+    assert await hass.config_entries.async_setup(entry.entry_id)
+    await hass.async_block_till_done()
+
+    coordinator = hass.data[DOMAIN][entry.entry_id][COORDINATOR]
+    data = coordinator.data
+    assert data["fingerprint"]
+
+    listener = Mock()
+    coordinator.async_add_listener(listener)
+    await coordinator.async_refresh()
+
+    assert coordinator.data is data
+    listener.assert_not_called()
+
+    # Heartbeat is due, last_updated moves even though nothing changed
+    coordinator.heartbeat = timedelta(0)
+    await coordinator.async_refresh()
+
+    assert coordinator.data["fingerprint"] == data["fingerprint"]
+    assert coordinator.data["last_updated"] != data["last_updated"]
+    listener.assert_called_once()
+
+
+async def test_adaptive_interval(hass, mock_aioclient, freezer):
+    """Test the interval follows alert severity but honors the NWS cache time."""
+    mock_aioclient.get(
+        ZONE_URL,
+        status=200,
+        body=load_fixture("api.json"),
+        headers={"Cache-Control": "public, max-age=45"},
+        repeat=True,
+    )
+
+    entry = MockConfigEntry(
+        domain=DOMAIN,
+        title="NWS Alerts",
+        data={**CONFIG_DATA, "interval": 5, "adaptive_interval": True},
+    )
+    entry.add_to_hass(hass)
+    assert await hass.config_entries.async_setup(entry.entry_id)
+    await hass.async_block_till_done()
+
+    # The fixture has a Severe alert, poll fast but not inside the cache time
+    coordinator = hass.data[DOMAIN][entry.entry_id][COORDINATOR]
+    assert coordinator.update_interval == timedelta(seconds=45)
+
+    mock_aioclient.clear()
+    mock_aioclient.get(ZONE_URL, status=200, body='{"features": []}', repeat=True)
+    freezer.tick(timedelta(minutes=1))
+    await coordinator.async_refresh()
+    assert coordinator.update_interval == timedelta(minutes=10)
+    await coordinator.async_refresh()
+    assert coordinator.update_interval == timedelta(minutes=15)
+
+
+async def test_count_precheck(hass, mock_aioclient, freezer):
+    """Test alerts are only downloaded again when the zone counts change."""
+    mock_aioclient.get(COUNT_URL, status=200, body=load_fixture("count_reply.json"))
+    mock_aioclient.get(ZONE_URL, status=200, body=load_fixture("api.json"), repeat=True)
+
+    entry = MockConfigEntry(
+        domain=DOMAIN, title="NWS Alerts", data={**CONFIG_DATA, "count_precheck": True}
+    )
+    entry.add_to_hass(hass)
+    assert await hass.config_entries.async_setup(entry.entry_id)
+    await hass.async_block_till_done()
+
+    coordinator = hass.data[DOMAIN][entry.entry_id][COORDINATOR]
+    assert coordinator.data["state"] == 2
+
+    # Other zones changed, ours did not
+    counts = json.loads(load_fixture("count_reply.json"))
+    counts["zones"]["CAZ041"] = 5
+    mock_aioclient.get(COUNT_URL, status=200, body=json.dumps(counts))
+    freezer.tick(timedelta(minutes=1))
+    await coordinator.async_refresh()
+    assert coordinator.data["state"] == 2
+    assert len(mock_aioclient.requests[("GET", URL(COUNT_URL))]) == 2
+    assert len(mock_aioclient.requests[("GET", URL(ZONE_URL))]) == 1
+
+    counts["zones"]["AZC013"] = 4
+    mock_aioclient.get(COUNT_URL, status=200, body=json.dumps(counts))
+    freezer.tick(timedelta(minutes=1))
+    await coordinator.async_refresh()
+    assert len(mock_aioclient.requests[("GET", URL(ZONE_URL))]) == 2
+
+
+async def test_alert_events(hass, mock_aioclient, freezer):
+    """Test an event is fired for each added, updated and removed alert."""
+    mock_aioclient.get(ZONE_URL, status=200, body=load_fixture("api.json"))
+    added = async_capture_events(hass, EVENT_ALERT_ADDED)
+    updated = async_capture_events(hass, EVENT_ALERT_UPDATED)
+    removed = async_capture_events(hass, EVENT_ALERT_REMOVED)
+
+    entry = MockConfigEntry(domain=DOMAIN, title="NWS Alerts", data=CONFIG_DATA)
+    entry.add_to_hass(hass)
+    assert await hass.config_entries.async_setup(entry.entry_id)
+    await hass.async_block_till_done()
+
+    assert [event.data["alert"]["Event"] for event in added] == [
+        "Excessive Heat Warning",
+        "Air Quality Alert",
+    ]
+    assert added[0].data["entry_id"] == entry.entry_id
+    assert added[0].data["name"] == "NWS Alerts"
+
+    data = json.loads(load_fixture("api.json"))
+    data["features"][0]["properties"]["sent"] = "2024-07-18T14:00:00-07:00"
+    del data["features"][1]
+    mock_aioclient.get(ZONE_URL, status=200, body=json.dumps(data))
+    freezer.tick(timedelta(minutes=1))
+    coordinator = hass.data[DOMAIN][entry.entry_id][COORDINATOR]
+    await coordinator.async_refresh()
+    await hass.async_block_till_done()
+
+    assert len(added) == 2
+    assert [event.data["alert"]["Sent"] for event in updated] == ["2024-07-18T14:00:00-07:00"]
+    assert [event.data["alert"]["Event"] for event in removed] == ["Air Quality Alert"]
+
+
+async def test_alert_timers(hass, mock_aioclient, freezer):
+    """Test alerts come into effect at their onset and are retired when they lapse."""
+    data = json.loads(load_fixture("api.json"))
+    data["features"][0]["properties"]["expires"] = "2024-07-19T12:00:00-07:00"
+    mock_aioclient.get(ZONE_URL, status=200, body=json.dumps(data), repeat=True)
+    freezer.move_to("2024-07-18T13:00:00-07:00")
+
+    entry = MockConfigEntry(domain=DOMAIN, title="NWS Alerts", data=CONFIG_DATA)
+    entry.add_to_hass(hass)
+    assert await hass.config_entries.async_setup(entry.entry_id)
+    await hass.async_block_till_done()
+
+    state = hass.states.get("sensor.nws_alerts_alerts")
+    assert state.state == "2"
+    assert state.attributes["in_effect"] == 1
+
+    # The Excessive Heat Warning begins at 10:00
+    freezer.move_to("2024-07-19T10:00:01-07:00")
+    async_fire_time_changed(hass)
+    await hass.async_block_till_done()
+    assert hass.states.get("sensor.nws_alerts_alerts").attributes["in_effect"] == 2
+
+    # and lapses at 12:00, even though the feed still lists it
+    freezer.move_to("2024-07-19T12:00:01-07:00")
+    async_fire_time_changed(hass)
+    await hass.async_block_till_done()
+    state = hass.states.get("sensor.nws_alerts_alerts")
+    assert state.state == "1"
+    assert [alert["Event"] for alert in state.attributes["Alerts"]] == ["Air Quality Alert"]
+    assert len(mock_aioclient.requests[("GET", URL(ZONE_URL))]) >= 2
+
+
+async def test_tracker_refresh_on_move(hass, mock_aioclient, freezer):
+    """Test tracker entries refresh when the device moves, not on every jitter."""
+    zones_url = re.compile(r"^https://api\.weather\.gov/zones\?point=.*$")
+    mock_aioclient.get(zones_url, status=200, body=load_fixture("zones.json"), repeat=True)
+    mock_aioclient.get(ZONE_URL, status=200, body=load_fixture("api.json"), repeat=True)
+
+    # The tracker is not available yet, setup must not wait for it
+    entry = MockConfigEntry(domain=DOMAIN, title="NWS Alerts", data=CONFIG_DATA_TRACKER)
+    entry.add_to_hass(hass)
+    assert await hass.config_entries.async_setup(entry.entry_id)
+    await hass.async_block_till_done()
+    assert not mock_aioclient.requests
+
+    attributes = {"source_type": "gps", "latitude": 33.45, "longitude": -112.07}
+    hass.states.async_set("device_tracker.car", "not_home", attributes)
+    await _async_pass_cooldown(hass, freezer)
+
+    # The point is resolved to its zones, which are then queried
+    coordinator = hass.data[DOMAIN][entry.entry_id][COORDINATOR]
+    assert coordinator.data["state"] == 2
+    assert list(mock_aioclient.requests) == [
+        ("GET", URL("https://api.weather.gov/zones?point=33.4500,-112.0700")),
+        ("GET", URL(ZONE_URL)),
+    ]
+
+    # GPS jitter of a few meters is ignored
+    hass.states.async_set("device_tracker.car", "not_home", {**attributes, "latitude": 33.4501})
+    await _async_pass_cooldown(hass, freezer)
+    assert len(mock_aioclient.requests[("GET", URL(ZONE_URL))]) == 1
+
+    # Moved on after the zones' alerts are due again
+    freezer.tick(timedelta(minutes=1))
+    hass.states.async_set("device_tracker.car", "not_home", {**attributes, "latitude": 33.6})
+    await _async_pass_cooldown(hass, freezer)
+    assert ("GET", URL("https://api.weather.gov/zones?point=33.6000,-112.0700")) in (
+        mock_aioclient.requests
+    )
+    assert len(mock_aioclient.requests[("GET", URL(ZONE_URL))]) == 2
+
+
+async def _async_pass_cooldown(hass, freezer):
+    """Let the refresh debouncer run."""
+    freezer.tick(timedelta(seconds=11))
+    async_fire_time_changed(hass)
+    await hass.async_block_till_done()
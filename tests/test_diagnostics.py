@@ -0,0 +1,45 @@
+"""Tests for diagnostics."""
+
+from datetime import timedelta
+
+from pytest_homeassistant_custom_component.common import MockConfigEntry
+from pytest_homeassistant_custom_component.components.diagnostics import (
+    get_diagnostics_for_config_entry,
+)
+
+from custom_components.nws_alerts.const import COORDINATOR, DOMAIN
+from tests.const import CONFIG_DATA, CONFIG_DATA_3
+
+
+async def test_diagnostics(hass, hass_client, mock_api, freezer):
+    """Test unchanged response bodies show up as cache hits."""
+    entry = MockConfigEntry(domain=DOMAIN, title="NWS Alerts", data=CONFIG_DATA)
+    entry.add_to_hass(hass)
+    assert await hass.config_entries.async_setup(entry.entry_id)
+    await hass.async_block_till_done()
+
+    freezer.tick(timedelta(minutes=1))
+    await hass.data[DOMAIN][entry.entry_id][COORDINATOR].async_refresh()
+
+    diagnostics = await get_diagnostics_for_config_entry(hass, hass_client, entry)
+    assert diagnostics["hub"]["cache"] == {"decoded": 1, "unchanged_body": 1}
+    assert diagnostics["coordinator"]["alerts"] == 2
+    assert diagnostics["hub"]["circuit_open"] is False
+
+
+async def test_diagnostics_point(hass, hass_client, mock_api, freezer):
+    """Test point entries record their own cache hits and hide the location."""
+    entry = MockConfigEntry(domain=DOMAIN, title="NWS Alerts", data=CONFIG_DATA_3)
+    entry.add_to_hass(hass)
+    assert await hass.config_entries.async_setup(entry.entry_id)
+    await hass.async_block_till_done()
+
+    coordinator = hass.data[DOMAIN][entry.entry_id][COORDINATOR]
+    alerts = coordinator.data["alerts"]
+    freezer.tick(timedelta(minutes=1))
+    await coordinator.async_refresh()
+    assert coordinator.data["alerts"] is alerts
+
+    diagnostics = await get_diagnostics_for_config_entry(hass, hass_client, entry)
+    assert diagnostics["coordinator"]["cache"] == {"decoded": 1, "unchanged_body": 1}
+    assert diagnostics["entry"]["data"]["gps_loc"] == "**REDACTED**"
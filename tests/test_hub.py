@@ -0,0 +1,318 @@
+"""Tests for the shared alert hub."""
+
+import asyncio
+import copy
+from datetime import timedelta
+import gc
+import json
+import re
+from unittest.mock import patch
+
+from aioresponses import CallbackResult
+from pytest_homeassistant_custom_component.common import MockConfigEntry
+from yarl import URL
+
+from custom_components.nws_alerts.alert import AlertRecord, normalize_alert
+from custom_components.nws_alerts.const import COORDINATOR, DOMAIN, HUB
+from custom_components.nws_alerts.hub import (
+    AlertsHub,
+    cache_ttl,
+    decode_alerts,
+    decode_features,
+    point_in_geometry,
+    zone_batches,
+)
+from homeassistant.components.sensor import DOMAIN as SENSOR_DOMAIN
+from homeassistant.helpers.aiohttp_client import async_get_clientsession
+from tests.conftest import ALERTS_URL, ZONE_URL, ZONES_URL, load_fixture
+from tests.const import CONFIG_DATA, CONFIG_DATA_SHARED, CONFIG_DATA_SHARED_2
+
+
+async def test_shared_feed(hass, mock_api):
+    """Test several entries are served from a single national fetch."""
+    for data in (CONFIG_DATA_SHARED, CONFIG_DATA_SHARED_2):
+        entry = MockConfigEntry(domain=DOMAIN, title=data["name"], data=data)
+        entry.add_to_hass(hass)
+        assert await hass.config_entries.async_setup(entry.entry_id)
+        await hass.async_block_till_done()
+
+    assert len(mock_api.requests[("GET", URL(ALERTS_URL))]) == 1
+
+    states = {
+        state.entity_id: state.state
+        for state in hass.states.async_all(SENSOR_DOMAIN)
+        if state.entity_id.endswith("_alerts")
+    }
+    assert states == {
+        "sensor.nws_alerts_shared_alerts": "1",
+        "sensor.nws_alerts_shared_gps_alerts": "2",
+    }
+
+    for entry in hass.config_entries.async_entries(DOMAIN):
+        assert await hass.config_entries.async_unload(entry.entry_id)
+    assert HUB not in hass.data[DOMAIN]
+
+
+def test_point_in_geometry():
+    """Test polygon matching for point based entries."""
+    square = [[-113.0, 33.0], [-111.0, 33.0], [-111.0, 34.0], [-113.0, 34.0], [-113.0, 33.0]]
+    hole = [[-112.5, 33.25], [-112.0, 33.25], [-112.0, 33.75], [-112.5, 33.75], [-112.5, 33.25]]
+
+    assert point_in_geometry({"type": "Polygon", "coordinates": [square]}, 33.5, -112.25)
+    assert not point_in_geometry({"type": "Polygon", "coordinates": [square, hole]}, 33.5, -112.25)
+    assert point_in_geometry({"type": "MultiPolygon", "coordinates": [[square]]}, 33.1, -111.1)
+    assert not point_in_geometry({"type": "Polygon", "coordinates": [square]}, 35.0, -112.0)
+
+
+def test_cache_ttl():
+    """Test the cache time is read from the response headers."""
+    assert cache_ttl({"Cache-Control": "public, max-age=300, s-maxage=600"}) == timedelta(minutes=5)
+    assert cache_ttl(
+        {"Date": "Thu, 18 Jul 2024 20:00:00 GMT", "Expires": "Thu, 18 Jul 2024 20:01:30 GMT"}
+    ) == timedelta(seconds=90)
+    assert cache_ttl({"Expires": "0"}) is None
+    assert cache_ttl({}) is None
+
+
+async def test_point_zone_cache(hass, mock_api, hass_storage):
+    """Test nearby points are resolved to zones once per grid cell."""
+    hass_storage["nws_alerts.zone_cells"] = {
+        "version": 1,
+        "key": "nws_alerts.zone_cells",
+        "data": {"resolution": 0.01, "cells": {"3345,-11207": ["AZZ540", "AZC013"]}},
+    }
+    hub = AlertsHub(hass, session=async_get_clientsession(hass), user_agent="test")
+    await hub.async_load()
+
+    # Loaded from storage, no request needed
+    assert await hub.async_resolve_zones(33.4512, -112.0688) == ["AZZ540", "AZC013"]
+
+    assert await hub.async_get_point_zones("123.0012,-455.9987") == ["AZZ540", "AZC013"]
+    assert await hub.async_get_point_zones("122.9981,-456.0034") == ["AZZ540", "AZC013"]
+    assert list(mock_api.requests) == [("GET", URL(ZONES_URL))]
+
+
+async def test_batched_zone_queries(hass, mock_api):
+    """Test overlapping zone entries share batched and in-flight requests."""
+    hub = AlertsHub(hass, session=async_get_clientsession(hass), user_agent="test")
+    for entry_id in ("one", "two"):
+        hub.async_register(entry_id, timedelta(minutes=1))
+
+    (both, _), (county, _) = await asyncio.gather(
+        hub.async_get_batched_features("one", "AZZ540,AZC013"),
+        hub.async_get_batched_features("two", "AZC013"),
+    )
+    assert len(both) == 2
+    assert [feature["properties"]["geocode"]["UGC"] for feature in county] == [["AZC013"]]
+    assert len(mock_api.requests[("GET", URL(ZONE_URL))]) == 1
+
+    # Served from the batch until the zones are due again
+    await hub.async_get_batched_features("two", "AZC013")
+    assert len(mock_api.requests[("GET", URL(ZONE_URL))]) == 1
+
+
+async def test_timed_out_entry_leaves_batch_running(hass, mock_aioclient):
+    """Test an entry timing out doesn't cancel the batch another entry awaits."""
+    api_available = asyncio.Event()
+    api_available.set()
+
+    async def api(url, **kwargs):
+        await api_available.wait()
+        return CallbackResult(status=200, body=load_fixture("api.json"))
+
+    mock_aioclient.get(ZONE_URL, callback=api, repeat=True)
+    for data in (
+        {**CONFIG_DATA, "timeout": 1},
+        {**CONFIG_DATA, "name": "County", "zone_id": "AZC013", "timeout": 120},
+    ):
+        entry = MockConfigEntry(domain=DOMAIN, title=data["name"], data=data)
+        entry.add_to_hass(hass)
+        assert await hass.config_entries.async_setup(entry.entry_id)
+        await hass.async_block_till_done()
+    zone, county = (
+        hass.data[DOMAIN][entry.entry_id][COORDINATOR]
+        for entry in hass.config_entries.async_entries(DOMAIN)
+    )
+
+    # Both zones are due, the entry with the short timeout starts the batch
+    api_available.clear()
+    hass.data[DOMAIN][HUB]._zone_fetched.clear()  # noqa: SLF001
+    zone_refresh = hass.async_create_task(zone.async_refresh())
+    county_refresh = hass.async_create_task(county.async_refresh())
+    await zone_refresh
+    assert zone.last_update_success
+    api_available.set()
+    await county_refresh
+
+    assert county.last_update_success
+    assert hass.states.get("sensor.county_alerts").state == "1"
+    assert len(mock_aioclient.requests[("GET", URL(ZONE_URL))]) == 2
+
+
+async def test_batch_keeps_alerts_to_their_zones(hass, mock_aioclient, freezer):
+    """Test alerts of a batch only reach the zones they apply to."""
+    data = json.loads(load_fixture("api.json"))
+    # Matched by the API for none of the batch's codes
+    stray = copy.deepcopy(data["features"][1])
+    stray["id"] = "https://api.weather.gov/alerts/stray"
+    stray["properties"]["geocode"]["UGC"] = ["NMZ001"]
+    stray["properties"]["affectedZones"] = []
+    data["features"].append(stray)
+    mock_aioclient.get(
+        "https://api.weather.gov/alerts/active?zone=AZZ540,TXZ211",
+        status=200,
+        body=json.dumps(data),
+    )
+
+    mock_aioclient.get(
+        "https://api.weather.gov/alerts/active?zone=TXZ211", status=200, body='{"features": []}'
+    )
+
+    hub = AlertsHub(hass, session=async_get_clientsession(hass), user_agent="test")
+    for entry_id in ("arizona", "texas"):
+        hub.async_register(entry_id, timedelta(minutes=1))
+    await hub.async_get_batched_features("texas", "TXZ211")
+
+    # Both zones are due, the Arizona update fetches them in one batch
+    freezer.tick(timedelta(minutes=1))
+    arizona, _ = await hub.async_get_batched_features("arizona", "AZZ540")
+    texas, _ = await hub.async_get_batched_features("texas", "TXZ211")
+    assert [feature["id"] for feature in arizona] == [data["features"][0]["id"]]
+    assert texas == []
+
+
+async def test_batch_state_follows_zones(hass, mock_aioclient, freezer):
+    """Test the state of batch URLs no zone was last fetched under is dropped."""
+    mock_aioclient.get(
+        re.compile(r"https://api\.weather\.gov/alerts/active\?zone=.*"),
+        status=200,
+        body=load_fixture("api.json"),
+        headers={"ETag": '"1"'},
+        repeat=True,
+    )
+
+    hub = AlertsHub(hass, session=async_get_clientsession(hass), user_agent="test")
+    for entry_id in ("zone", "county"):
+        hub.async_register(entry_id, timedelta(minutes=1))
+    await hub.async_get_batched_features("zone", "AZZ540")
+    await hub.async_get_batched_features("county", "AZC013")
+    assert list(hub._batch_bodies) == [f"{ALERTS_URL}?zone=AZC013"]  # noqa: SLF001
+
+    # Both zones are due and fetched together, the single zone batch is gone
+    freezer.tick(timedelta(minutes=1))
+    await hub.async_get_batched_features("zone", "AZZ540")
+    assert list(hub._batch_validators) == [ZONE_URL]  # noqa: SLF001
+    assert list(hub._batch_bodies) == [ZONE_URL]  # noqa: SLF001
+
+
+async def test_large_response_decoded_in_executor(hass, mock_api):
+    """Test responses over the threshold are decoded off the event loop."""
+    hub = AlertsHub(hass, session=async_get_clientsession(hass), user_agent="test")
+    hub.async_register("one", timedelta(minutes=1))
+
+    with patch.object(
+        hass, "async_add_executor_job", wraps=hass.async_add_executor_job
+    ) as executor_job:
+        features, _ = await hub.async_get_batched_features("one", "AZZ540,AZC013")
+        assert executor_job.call_count == 0
+
+        # The records of the new alerts are built in the same job
+        hub.async_set_decode_threshold("one", 0)
+        assert await hub.async_decode_features(load_fixture("api.json").encode(), ZONE_URL) == (
+            features
+        )
+        assert executor_job.call_args.args[0] is decode_alerts
+        assert {url for url, _ in hub.alert_pool} == {feature["id"] for feature in features}
+
+
+async def test_overlapping_entries(hass, mock_api):
+    """Test an entry watching zones of another entry makes no request of its own."""
+    for data in (CONFIG_DATA, {**CONFIG_DATA, "name": "County", "zone_id": "AZC013"}):
+        entry = MockConfigEntry(domain=DOMAIN, title=data["name"], data=data)
+        entry.add_to_hass(hass)
+        assert await hass.config_entries.async_setup(entry.entry_id)
+        await hass.async_block_till_done()
+
+    assert list(mock_api.requests) == [("GET", URL(ZONE_URL))]
+    assert hass.states.get("sensor.county_alerts").state == "1"
+
+    # Both entries hold the same record of the shared alert
+    zone, county = (
+        hass.data[DOMAIN][entry.entry_id][COORDINATOR].data["alerts"]
+        for entry in hass.config_entries.async_entries(DOMAIN)
+    )
+    assert any(alert is county[0] for alert in zone)
+
+    # One pooled record per distinct alert, released once no entry holds it
+    pool = hass.data[DOMAIN][HUB].alert_pool
+    assert len(pool) == 2
+    record = AlertRecord.from_dict(county[0].as_dict())
+    pool["unused", record.Sent] = record
+    del record
+    gc.collect()
+    assert len(pool) == 2
+
+
+def test_zone_batches():
+    """Test zone lists are split to keep the query URL short."""
+    zones = [f"AZZ{n:03}" for n in range(500)]
+    batches = zone_batches(zones)
+
+    assert [zone for batch in batches for zone in batch] == zones
+    assert len(batches) == 2
+    assert all(
+        len(f"https://api.weather.gov/alerts/active?zone={','.join(batch)}") <= 2000
+        for batch in batches
+    )
+    assert zone_batches(["AZZ540", "AZC013"]) == [["AZZ540", "AZC013"]]
+
+
+def test_decode_features():
+    """Test decoded features only keep what the integration reads."""
+    body = load_fixture("api.json").encode()
+    feature, _ = decode_features(body)
+
+    assert "geometry" not in feature
+    properties = feature["properties"]
+    assert "affectedZones" not in properties
+    assert "references" not in properties
+    assert list(properties["parameters"]) == ["NWSheadline"]
+    assert properties["geocode"] == {
+        "UGC": [
+            "AZZ537",
+            "AZZ540",
+            "AZZ542",
+            "AZZ543",
+            "AZZ544",
+            "AZZ546",
+            "AZZ548",
+            "AZZ550",
+            "AZZ551",
+        ]
+    }
+    assert properties["event"] == "Excessive Heat Warning"
+
+    # Outlines are only kept for matching points
+    geometry = {
+        "type": "Polygon",
+        "coordinates": [[[-112.0, 33.0], [-111.0, 33.0], [-112.0, 33.0]]],
+    }
+    body = json.dumps(
+        {"features": [{"type": "Feature", "id": "x", "geometry": geometry, "properties": {}}]}
+    )
+    assert "geometry" not in decode_features(body.encode())[0]
+    assert decode_features(body.encode(), geometry=True)[0]["geometry"] == geometry
+
+
+async def test_alert_details_release_records(hass):
+    """Test the details cache keeps an alert's texts but not its pooled record."""
+    hub = AlertsHub(hass, session=async_get_clientsession(hass), user_agent="test")
+    record = normalize_alert(json.loads(load_fixture("api.json"))["features"][0])
+    hub.alert_pool[record["URL"], record["Sent"]] = record
+    hub.async_remember_alert(record)
+    details = record.as_dict()
+
+    del record
+    gc.collect()
+    assert not hub.alert_pool
+    assert await hub.async_get_alert_details(details["ID"]) == details
@@ -1,12 +1,17 @@
 """Tests for init."""
 
+import asyncio
+from datetime import timedelta
+import json
 import logging
 
+from aioresponses import CallbackResult
 import pytest
-from pytest_homeassistant_custom_component.common import MockConfigEntry
+from pytest_homeassistant_custom_component.common import MockConfigEntry, async_fire_time_changed
 
 from custom_components.nws_alerts.const import DOMAIN
 from homeassistant.components.sensor import DOMAIN as SENSOR_DOMAIN
+from tests.conftest import ZONE_URL, load_fixture
 from tests.const import CONFIG_DATA, CONFIG_DATA_3
 
 pytestmark = pytest.mark.asyncio
@@ -26,7 +31,7 @@ async def test_setup_entry(hass, mock_api, caplog):
         assert await hass.config_entries.async_setup(entry.entry_id)
         await hass.async_block_till_done()
 
-        assert len(hass.states.async_entity_ids(SENSOR_DOMAIN)) == 2
+        assert len(hass.states.async_entity_ids(SENSOR_DOMAIN)) == 4
         entries = hass.config_entries.async_entries(DOMAIN)
         assert len(entries) == 1
         assert "Migration to version 2 complete" in caplog.text
@@ -44,15 +49,106 @@ async def test_unload_entry(hass, mock_api):
     assert await hass.config_entries.async_setup(entry.entry_id)
     await hass.async_block_till_done()
 
-    assert len(hass.states.async_entity_ids(SENSOR_DOMAIN)) == 2
+    assert len(hass.states.async_entity_ids(SENSOR_DOMAIN)) == 4
     entries = hass.config_entries.async_entries(DOMAIN)
     assert len(entries) == 1
 
     assert await hass.config_entries.async_unload(entries[0].entry_id)
     await hass.async_block_till_done()
-    assert len(hass.states.async_entity_ids(SENSOR_DOMAIN)) == 2
+    assert len(hass.states.async_entity_ids(SENSOR_DOMAIN)) == 4
     assert len(hass.states.async_entity_ids(DOMAIN)) == 0
 
     assert await hass.config_entries.async_remove(entries[0].entry_id)
     await hass.async_block_till_done()
     assert len(hass.states.async_entity_ids(SENSOR_DOMAIN)) == 0
+
+
+@pytest.mark.parametrize(
+    "snapshot",
+    [
+        {"version": 1, "data": {"data": {"alerts": [{"URL": "x"}]}, "checked": "yesterday"}},
+        {"version": 1, "data": {"data": {"state": 1, "alerts": ["x"]}, "checked": "2024-07-18"}},
+        {"version": 1, "data": {"checked": "2024-07-18T08:00:00"}},
+        {"version": 1, "data": None},
+    ],
+)
+async def test_setup_from_unreadable_snapshot(hass, mock_api, hass_storage, snapshot):
+    """Test an unreadable snapshot is ignored and the alerts are fetched."""
+    entry = MockConfigEntry(domain=DOMAIN, title="NWS Alerts", data=CONFIG_DATA)
+    hass_storage[f"{DOMAIN}.{entry.entry_id}"] = {"key": f"{DOMAIN}.{entry.entry_id}", **snapshot}
+    entry.add_to_hass(hass)
+    assert await hass.config_entries.async_setup(entry.entry_id)
+    await hass.async_block_till_done()
+
+    assert hass.states.get("sensor.nws_alerts_alerts").state == "2"
+
+
+async def test_setup_from_other_snapshot_version(hass, mock_aioclient, hass_storage):
+    """Test a snapshot of another version is restored as far as it can be read."""
+    mock_aioclient.get(ZONE_URL, status=500, repeat=True)
+    alert = json.loads(load_fixture("api.json"))["features"][0]
+    entry = MockConfigEntry(domain=DOMAIN, title="NWS Alerts", data=CONFIG_DATA)
+    hass_storage[f"{DOMAIN}.{entry.entry_id}"] = {
+        "version": 99,
+        "key": f"{DOMAIN}.{entry.entry_id}",
+        "data": {
+            "data": {
+                "state": 1,
+                "alerts": [{"URL": alert["id"], "Event": "Heat", "NewField": 1}],
+                "last_updated": "2024-07-18T08:00:00",
+            },
+            "checked": "2024-07-18T08:00:00",
+        },
+    }
+    entry.add_to_hass(hass)
+    assert await hass.config_entries.async_setup(entry.entry_id)
+    await hass.async_block_till_done()
+
+    state = hass.states.get("sensor.nws_alerts_alerts")
+    assert state.state == "1"
+    assert state.attributes["Alerts"][0]["Event"] == "Heat"
+
+
+async def test_setup_from_snapshot(hass, mock_aioclient, hass_storage, freezer):
+    """Test the last known alerts are served while the first update runs."""
+    api_available = asyncio.Event()
+
+    async def slow_api(url, **kwargs):
+        await api_available.wait()
+        return CallbackResult(status=200, body=load_fixture("api.json"))
+
+    mock_aioclient.get(ZONE_URL, callback=slow_api, repeat=True)
+
+    entry = MockConfigEntry(domain=DOMAIN, title="NWS Alerts", data=CONFIG_DATA)
+    hass_storage[f"{DOMAIN}.{entry.entry_id}"] = {
+        "version": 1,
+        "key": f"{DOMAIN}.{entry.entry_id}",
+        "data": {
+            "data": {"state": 1, "alerts": [], "last_updated": "2024-07-18T08:00:00"},
+            "checked": "2024-07-18T08:00:00",
+        },
+    }
+
+    entry.add_to_hass(hass)
+    assert await hass.config_entries.async_setup(entry.entry_id)
+    await hass.async_block_till_done()
+
+    state = hass.states.get("sensor.nws_alerts_alerts")
+    assert state.state == "1"
+    assert state.attributes["stale"] is True
+
+    api_available.set()
+    await hass.async_block_till_done(wait_background_tasks=True)
+    state = hass.states.get("sensor.nws_alerts_alerts")
+    assert state.state == "2"
+    assert "stale" not in state.attributes
+
+    # The new alerts are persisted for the next start
+    freezer.tick(timedelta(seconds=11))
+    async_fire_time_changed(hass)
+    await hass.async_block_till_done()
+    assert hass_storage[f"{DOMAIN}.{entry.entry_id}"]["data"]["data"]["state"] == 2
+
+    assert await hass.config_entries.async_remove(entry.entry_id)
+    await hass.async_block_till_done()
+    assert f"{DOMAIN}.{entry.entry_id}" not in hass_storage
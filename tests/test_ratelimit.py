@@ -0,0 +1,98 @@
+"""Tests for NWS API request pacing."""
+
+import asyncio
+from datetime import timedelta
+from unittest.mock import patch
+
+import aiohttp
+from pytest_homeassistant_custom_component.common import MockConfigEntry, async_fire_time_changed
+from yarl import URL
+
+from custom_components.nws_alerts.const import COORDINATOR, DOMAIN, HUB
+from custom_components.nws_alerts.ratelimit import RateLimiter, backoff_delay, retry_after
+from tests.conftest import ZONE_URL, load_fixture
+from tests.const import CONFIG_DATA
+
+
+def test_retry_after():
+    """Test both forms of the Retry-After header."""
+    assert retry_after({"Retry-After": "120"}) == 120
+    assert retry_after({"Retry-After": "Thu, 01 Jan 1970 00:00:00 GMT"}) == 0
+    assert retry_after({"Retry-After": "soon"}) is None
+    assert retry_after({}) is None
+
+
+def test_backoff_delay():
+    """Test the backoff grows, is jittered and honors the server's minimum."""
+    assert 15 <= backoff_delay(1) <= 30
+    assert 60 <= backoff_delay(3) <= 120
+    assert 450 <= backoff_delay(20) <= 900
+    assert backoff_delay(1, 600) == 600
+
+
+async def test_token_bucket(hass):
+    """Test requests past the burst wait for a token."""
+    limiter = RateLimiter(hass, rate=100, burst=2)
+    with patch(
+        "custom_components.nws_alerts.ratelimit.asyncio.sleep", wraps=asyncio.sleep
+    ) as sleep:
+        for _ in range(3):
+            await limiter.async_acquire()
+    sleep.assert_called_once()
+
+
+async def test_backoff_keeps_last_alerts(hass, mock_aioclient, freezer):
+    """Test a 503 keeps the last alerts and holds back further requests."""
+    freezer.move_to("2024-07-18T13:00:00-07:00")
+    mock_aioclient.get(ZONE_URL, status=200, body=load_fixture("api.json"))
+    mock_aioclient.get(ZONE_URL, status=503, headers={"Retry-After": "120"})
+
+    entry = MockConfigEntry(domain=DOMAIN, title="NWS Alerts", data=CONFIG_DATA)
+    entry.add_to_hass(hass)
+    assert await hass.config_entries.async_setup(entry.entry_id)
+    await hass.async_block_till_done()
+
+    coordinator = hass.data[DOMAIN][entry.entry_id][COORDINATOR]
+    data = coordinator.data
+    for _ in range(2):
+        freezer.tick(timedelta(minutes=1))
+        await coordinator.async_refresh()
+
+    assert coordinator.last_update_success
+    assert coordinator.data is data
+    assert hass.states.get("sensor.nws_alerts_alerts").state == "2"
+    assert len(mock_aioclient.requests[("GET", URL(ZONE_URL))]) == 2
+
+
+async def test_circuit_breaker(hass, mock_aioclient, freezer):
+    """Test an outage stops requests and alerts are served until they expire."""
+    freezer.move_to("2024-07-18T13:00:00-07:00")
+    mock_aioclient.get(ZONE_URL, status=200, body=load_fixture("api.json"))
+    mock_aioclient.get(ZONE_URL, exception=aiohttp.ClientConnectionError(), repeat=True)
+
+    entry = MockConfigEntry(domain=DOMAIN, title="NWS Alerts", data=CONFIG_DATA)
+    entry.add_to_hass(hass)
+    assert await hass.config_entries.async_setup(entry.entry_id)
+    await hass.async_block_till_done()
+
+    coordinator = hass.data[DOMAIN][entry.entry_id][COORDINATOR]
+    hub = hass.data[DOMAIN][HUB]
+    for _ in range(4):
+        freezer.tick(timedelta(minutes=1))
+        await coordinator.async_refresh()
+
+    # Three failures open the circuit, the fourth update doesn't reach the API
+    assert hub.breaker.is_open
+    assert len(mock_aioclient.requests[("GET", URL(ZONE_URL))]) == 4
+    assert coordinator.last_update_success
+    assert coordinator.data["state"] == 2
+
+    # The Excessive Heat Warning expires at 03:00
+    freezer.move_to("2024-07-19T04:00:00-07:00")
+    await coordinator.async_refresh()
+    assert coordinator.data["state"] == 1
+    assert coordinator.data["alerts"][0]["Event"] == "Air Quality Alert"
+
+    async_fire_time_changed(hass)
+    await hass.async_block_till_done()
+    assert hass.states.get("sensor.nws_alerts_data_age").state == str(15 * 60)
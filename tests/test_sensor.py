@@ -1,11 +1,15 @@
 """Test NWS Alerts Sensors."""
 
+from datetime import timedelta
+import json
+
 import pytest
 from pytest_homeassistant_custom_component.common import MockConfigEntry
 
-from custom_components.nws_alerts.const import DOMAIN
+from custom_components.nws_alerts.const import COORDINATOR, DOMAIN
 from homeassistant.components.sensor import DOMAIN as SENSOR_DOMAIN
 from homeassistant.helpers import entity_registry as er
+from tests.conftest import ZONE_URL, load_fixture
 from tests.const import CONFIG_DATA
 
 pytestmark = pytest.mark.asyncio
@@ -49,6 +53,10 @@ async def test_sensor(hass, mock_api):
             "Onset": "2024-07-19T10:00:00-07:00",
             "Expires": "2024-07-19T03:00:00-07:00",
             "Description": "* WHAT...Dangerously hot conditions. Afternoon temperatures 112 to\n116 expected. Major Heat Risk. Overexposure can cause heat cramps\nand heat exhaustion to develop and, without intervention, can lead\nto heat stroke.\n\n* WHERE...The Northwest Valley of the Phoenix Metro Area, The East\nValley of the Phoenix Metro Area, Buckeye/Avondale, Deer Valley,\nCentral Phoenix, North Phoenix/Glendale, Scottsdale/Paradise\nValley, South Mountain/Ahwatukee, and Southeast Valley/Queen Creek.\n\n* WHEN...From 10 AM Friday to 8 PM MST Saturday.\n\n* IMPACTS...Heat related illnesses increase significantly during\nextreme heat events.\n\n* ADDITIONAL DETAILS...In Maricopa County, call 2-1-1 to find a free\ncooling center, transportation, water, and more.\nhttps://www.maricopa.gov/heat",
+            "SentEpoch": 1721332020,
+            "OnsetEpoch": 1721408400,
+            "ExpiresEpoch": 1721383200,
+            "EndsEpoch": 1721530800,
             "Instruction": "An Excessive Heat Warning means that a period of very hot\ntemperatures, even by local standards, will occur. Actions should be\ntaken to lessen the impact of the extreme heat.\n\nTake extra precautions if you work or spend time outside. When\npossible, reschedule strenuous activities to early morning or\nevening. Know the signs and symptoms of heat exhaustion and heat\nstroke. Wear lightweight and loose-fitting clothing when possible\nand drink plenty of water.\n\nTo reduce risk during outdoor work, the Occupational Safety and\nHealth Administration recommends scheduling frequent rest breaks in\nshaded or air conditioned environments. Anyone overcome by heat\nshould be moved to a cool and shaded location. Heat stroke is an\nemergency! Call 9 1 1.\n\nPublic cooling shelters are available in some areas. Consult county\nofficials for more details.",
         },
         {
@@ -68,8 +76,49 @@ async def test_sensor(hass, mock_api):
             "Expires": "2024-07-19T21:00:00-07:00",
             "Description": "AQAPSR\n\nThe Arizona Department of Environmental Quality (ADEQ) has issued an\nOzone High Pollution Advisory for the Phoenix Metro Area through\nFriday.\n\nThis means that forecast weather conditions combined with existing\nozone levels are expected to result in local maximum 8-hour ozone\nconcentrations that pose a health risk. Adverse health effects\nincrease as air quality deteriorates.\n\nOzone is an air contaminant which can cause breathing difficulties\nfor children, older adults, as well as persons with respiratory\nproblems. A decrease in physical activity is recommended.\n\nYou are urged to car pool, telecommute or use mass transit.\nThe use of gasoline-powered equipment should be reduced or done late\nin the day.\n\nFor details on this High Pollution Advisory, visit the ADEQ internet\nsite at www.azdeq.gov/forecast/phoenix or call 602-771-2300.",
             "Instruction": None,
+            "SentEpoch": 1721315580,
+            "OnsetEpoch": 1721315580,
+            "ExpiresEpoch": 1721448000,
+            "EndsEpoch": None,
         },
     ]
     assert state.attributes["Alerts"][0]["ID"] == "7681487b-41c6-0308-1a00-3cade72982c1"
     entity_registry = er.async_get(hass)
     assert entity_registry.async_get(alerts_entity_id)
+
+    state = hass.states.get("sensor.nws_alerts_highest_severity")
+    assert state.state == "Severe"
+    assert state.attributes["Severe"] == 1
+    assert state.attributes["Unknown"] == 1
+    assert state.attributes["Extreme"] == 0
+
+
+async def test_alert_slots(hass, mock_aioclient, freezer):
+    """Test every alert gets a sensor of its own and keeps it while active."""
+    mock_aioclient.get(ZONE_URL, status=200, body=load_fixture("api.json"))
+    entry = MockConfigEntry(
+        domain=DOMAIN, title="NWS Alerts", data={**CONFIG_DATA, "alert_slots": 3}
+    )
+    entry.add_to_hass(hass)
+    assert await hass.config_entries.async_setup(entry.entry_id)
+    await hass.async_block_till_done()
+
+    assert hass.states.get("sensor.nws_alerts_alert_1").state == "Excessive Heat Warning"
+    state = hass.states.get("sensor.nws_alerts_alert_2")
+    assert state.state == "Air Quality Alert"
+    assert state.attributes["NWSCode"] == "AQA"
+    assert hass.states.get("sensor.nws_alerts_alert_3").state == "None"
+
+    # The first alert ends, the second one stays in its slot without a state write
+    data = json.loads(load_fixture("api.json"))
+    del data["features"][0]
+    mock_aioclient.get(ZONE_URL, status=200, body=json.dumps(data))
+    freezer.tick(timedelta(minutes=1))
+    before = hass.states.get("sensor.nws_alerts_alert_2").last_reported
+    await hass.data[DOMAIN][entry.entry_id][COORDINATOR].async_refresh()
+    await hass.async_block_till_done()
+
+    assert hass.states.get("sensor.nws_alerts_alert_1").state == "None"
+    state = hass.states.get("sensor.nws_alerts_alert_2")
+    assert state.state == "Air Quality Alert"
+    assert state.last_reported == before
@@ -0,0 +1,111 @@
+"""Tests for the integration services."""
+
+import json
+
+import pytest
+from pytest_homeassistant_custom_component.common import MockConfigEntry
+from yarl import URL
+
+from custom_components.nws_alerts.alert import alert_id, normalize_alert
+from custom_components.nws_alerts.const import DOMAIN, SERVICE_GET_ALERT_DETAILS
+from homeassistant.exceptions import ServiceValidationError
+from tests.conftest import load_fixture
+from tests.const import CONFIG_DATA
+
+ALERT_URL = "https://api.weather.gov/alerts/urn:oid:2.49.0.1.840.0.expired.001.1"
+
+
+async def test_slim_attributes_and_details(hass, mock_api):
+    """Test slim attributes leave out the texts the service still returns."""
+    entry = MockConfigEntry(
+        domain=DOMAIN, title="NWS Alerts", data={**CONFIG_DATA, "slim_attributes": True}
+    )
+    entry.add_to_hass(hass)
+    assert await hass.config_entries.async_setup(entry.entry_id)
+    await hass.async_block_till_done()
+
+    alert = hass.states.get("sensor.nws_alerts_alerts").attributes["Alerts"][0]
+    assert "Description" not in alert
+    assert "Instruction" not in alert
+    assert alert["Headline"]
+
+    details = await hass.services.async_call(
+        DOMAIN,
+        SERVICE_GET_ALERT_DETAILS,
+        {"alert_id": alert["ID"]},
+        blocking=True,
+        return_response=True,
+    )
+    assert details["ID"] == alert["ID"]
+    assert details["Description"].startswith("* WHAT...Dangerously hot conditions.")
+
+    with pytest.raises(ServiceValidationError):
+        await hass.services.async_call(
+            DOMAIN,
+            SERVICE_GET_ALERT_DETAILS,
+            {"alert_id": "unknown"},
+            blocking=True,
+            return_response=True,
+        )
+
+
+async def test_details_fetched_from_url(hass, mock_api):
+    """Test an alert that is no longer held is fetched once from its URL."""
+    feature = json.loads(load_fixture("api.json"))["features"][0]
+    mock_api.get(ALERT_URL, status=200, body=json.dumps({**feature, "id": ALERT_URL}))
+
+    entry = MockConfigEntry(domain=DOMAIN, title="NWS Alerts", data=CONFIG_DATA)
+    entry.add_to_hass(hass)
+    assert await hass.config_entries.async_setup(entry.entry_id)
+    await hass.async_block_till_done()
+
+    for _ in range(2):
+        details = await hass.services.async_call(
+            DOMAIN,
+            SERVICE_GET_ALERT_DETAILS,
+            {"url": ALERT_URL},
+            blocking=True,
+            return_response=True,
+        )
+        assert details["URL"] == ALERT_URL
+        assert details["Event"] == "Excessive Heat Warning"
+    assert len(mock_api.requests[("GET", URL(ALERT_URL))]) == 1
+
+    with pytest.raises(ServiceValidationError):
+        await hass.services.async_call(
+            DOMAIN,
+            SERVICE_GET_ALERT_DETAILS,
+            {"url": "https://example.com/alerts/1"},
+            blocking=True,
+            return_response=True,
+        )
+
+
+async def test_details_of_restored_alert(hass, mock_api, hass_storage):
+    """Test an alert restored from the snapshot is served without fetching it."""
+    feature = json.loads(load_fixture("api.json"))["features"][0]
+    restored = normalize_alert({**feature, "id": ALERT_URL}).as_dict()
+
+    entry = MockConfigEntry(domain=DOMAIN, title="NWS Alerts", data=CONFIG_DATA)
+    hass_storage[f"{DOMAIN}.{entry.entry_id}"] = {
+        "version": 1,
+        "key": f"{DOMAIN}.{entry.entry_id}",
+        "data": {
+            "data": {"state": 1, "alerts": [restored], "last_updated": "2024-07-18T08:00:00"},
+            "checked": "2024-07-18T08:00:00",
+        },
+    }
+    entry.add_to_hass(hass)
+    assert await hass.config_entries.async_setup(entry.entry_id)
+    await hass.async_block_till_done()
+
+    details = await hass.services.async_call(
+        DOMAIN,
+        SERVICE_GET_ALERT_DETAILS,
+        {"alert_id": alert_id(ALERT_URL)},
+        blocking=True,
+        return_response=True,
+    )
+    assert details["URL"] == ALERT_URL
+    assert details["Description"] == restored["Description"]
+    assert ("GET", URL(ALERT_URL)) not in mock_api.requests
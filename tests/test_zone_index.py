@@ -0,0 +1,75 @@
+"""Tests for the offline zone index."""
+
+from unittest.mock import patch
+
+from custom_components.nws_alerts.config_flow import _get_zone_list
+from custom_components.nws_alerts.zone_index import (
+    ZoneIndex,
+    async_get_zone_index,
+    build_zone_index,
+    zone_index_path,
+)
+
+# A county with a hole cut out, and a zone overlapping its eastern half
+COUNTY = [
+    [[-113.0, 33.0], [-111.0, 33.0], [-111.0, 34.0], [-113.0, 34.0], [-113.0, 33.0]],
+    [[-112.9, 33.1], [-112.6, 33.1], [-112.6, 33.4], [-112.9, 33.4], [-112.9, 33.1]],
+]
+ZONE = [[[-112.0, 33.0], [-111.0, 33.0], [-111.0, 34.0], [-112.0, 34.0], [-112.0, 33.0]]]
+ISLAND = [[[144.6, 13.2], [145.0, 13.2], [145.0, 13.7], [144.6, 13.7], [144.6, 13.2]]]
+
+
+def _build_index(tmp_path) -> ZoneIndex:
+    """Write a small index to disk and memory-map it."""
+    path = tmp_path / "zone_index.bin"
+    path.write_bytes(
+        build_zone_index([("AZC013", [COUNTY]), ("AZZ540", [ZONE]), ("GUZ001", [ISLAND])])
+    )
+    index = ZoneIndex.load(path)
+    assert index is not None
+    return index
+
+
+def test_lookup(tmp_path):
+    """Test points are resolved to the zones containing them."""
+    index = _build_index(tmp_path)
+
+    assert index.lookup(33.5, -112.5) == ["AZC013"]
+    assert index.lookup(33.5, -111.5) == ["AZC013", "AZZ540"]
+    assert index.lookup(13.45, 144.8) == ["GUZ001"]
+    # Inside the hole, outside every zone and outside the grid
+    assert index.lookup(33.25, -112.75) == []
+    assert index.lookup(35.0, -112.0) == []
+    assert index.lookup(60.0, -150.0) == []
+
+
+def test_missing_index(tmp_path):
+    """Test a missing or invalid index file is ignored."""
+    assert ZoneIndex.load(tmp_path / "zone_index.bin") is None
+    (tmp_path / "zone_index.bin").write_bytes(b"nonsense")
+    assert ZoneIndex.load(tmp_path / "zone_index.bin") is None
+
+
+async def test_config_flow_uses_index(hass, tmp_path):
+    """Test the zone list is filled in from the index without the API."""
+    hass.config.latitude = 33.5
+    hass.config.longitude = -111.5
+    flow = type("Flow", (), {"hass": hass})()
+
+    with patch(
+        "custom_components.nws_alerts.config_flow.async_get_zone_index",
+        return_value=_build_index(tmp_path),
+    ):
+        assert await _get_zone_list(flow) == "AZC013,AZZ540"
+
+
+async def test_index_in_config_dir(hass, tmp_path):
+    """Test the index is loaded from the configuration directory."""
+    hass.config.config_dir = str(tmp_path)
+    path = zone_index_path(tmp_path)
+    path.parent.mkdir()
+    path.write_bytes(build_zone_index([("AZZ540", [ZONE])]))
+
+    index = await async_get_zone_index(hass)
+    assert index is not None
+    assert index.lookup(33.5, -111.5) == ["AZZ540"]